@@ -0,0 +1,273 @@
+"""
+Implementação do algoritmo ARC (Adaptive Replacement Cache)
+Cache que se ajusta sozinho entre recência e frequência usando listas fantasmas
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+from algorithms.cache_utils import default_sizer
+
+class ARCCache:
+    """
+    Implementação do algoritmo de cache ARC (Megiddo & Modha)
+
+    Mantém duas listas LRU de itens residentes: T1 (vistos uma vez
+    recentemente) e T2 (vistos pelo menos duas vezes), e duas listas fantasmas
+    só com chaves removidas: B1 (saídas de T1) e B2 (saídas de T2). Um miss que
+    encontra a chave em B1 indica que T1 deveria ser maior; em B2, que T2
+    deveria ser maior. O alvo p do tamanho de T1 é ajustado a cada caso, sem
+    parâmetros a calibrar.
+    """
+
+    def __init__(self, capacity: int, max_bytes: Optional[int] = None,
+                 sizer: Optional[Callable[[Any], int]] = None):
+        """
+        Inicializa o cache ARC
+
+        Args:
+            capacity (int): Capacidade máxima do cache (número de itens)
+            max_bytes (int, optional): Orçamento máximo em bytes (None = sem limite)
+            sizer (callable, optional): Função que mede o tamanho de um valor em bytes
+        """
+        self.capacity = capacity
+        self.cache = {}  # key -> value (itens residentes)
+        self.t1 = OrderedDict()  # Residentes vistos uma vez (LRU primeiro)
+        self.t2 = OrderedDict()  # Residentes vistos mais de uma vez (LRU primeiro)
+        self.b1 = OrderedDict()  # Fantasmas removidos de T1
+        self.b2 = OrderedDict()  # Fantasmas removidos de T2
+        self.p = 0.0  # Tamanho alvo de T1
+        self.access_count = 0
+        self.hit_count = 0
+        self.miss_count = 0
+
+        # Orçamento em bytes
+        self.max_bytes = max_bytes
+        self.sizer = sizer or default_sizer
+        self.entry_sizes = {}
+        self.current_bytes = 0
+
+        # Callback opcional chamado com (chave, valor) a cada remoção por capacidade
+        self.on_evict = None
+
+    def get(self, key: int) -> str:
+        """
+        Recupera um item do cache; um hit promove o item para T2
+
+        Args:
+            key (int): Chave do item
+
+        Returns:
+            str: Valor do item ou None se não encontrado
+        """
+        self.access_count += 1
+
+        if key in self.t1:
+            del self.t1[key]
+            self.t2[key] = None
+        elif key in self.t2:
+            self.t2.move_to_end(key)
+        else:
+            self.miss_count += 1
+            return None
+
+        self.hit_count += 1
+        return self.cache[key]
+
+    def put(self, key: int, value: str) -> None:
+        """
+        Adiciona um item ao cache
+
+        Args:
+            key (int): Chave do item
+            value (str): Valor do item
+        """
+        size = self.sizer(value)
+
+        # Item maior que todo o orçamento não é admitido
+        if self.max_bytes is not None and size > self.max_bytes:
+            if key in self.cache:
+                self._remove_entry(key)
+            return
+
+        if key in self.cache:
+            # Atualizar valor mantendo a lista atual
+            (self.t1 if key in self.t1 else self.t2).move_to_end(key)
+            self.cache[key] = value
+            self.current_bytes += size - self.entry_sizes[key]
+            self.entry_sizes[key] = size
+            while self._over_budget(0) and self._evict_one(protect=key):
+                pass
+            return
+
+        if key in self.b1:
+            # Miss fantasma em B1: favorecer recência
+            self.p = min(float(self.capacity), self.p + max(len(self.b2) / len(self.b1), 1.0))
+            del self.b1[key]
+            self._make_room(size, in_b2=False)
+            self.t2[key] = None
+        elif key in self.b2:
+            # Miss fantasma em B2: favorecer frequência
+            self.p = max(0.0, self.p - max(len(self.b1) / len(self.b2), 1.0))
+            del self.b2[key]
+            self._make_room(size, in_b2=True)
+            self.t2[key] = None
+        else:
+            # Chave nova: limitar o histórico antes de abrir espaço
+            if len(self.t1) + len(self.b1) >= self.capacity:
+                # L1 cheio: com B1 vazio, o LRU de T1 sai em _make_room e B2 fica intacto
+                if self.b1:
+                    self.b1.popitem(last=False)
+            elif len(self.t1) + len(self.t2) + len(self.b1) + len(self.b2) >= 2 * self.capacity and self.b2:
+                self.b2.popitem(last=False)
+            self._make_room(size, in_b2=False)
+            self.t1[key] = None
+
+        self.cache[key] = value
+        self.entry_sizes[key] = size
+        self.current_bytes += size
+        self._trim_ghosts()
+
+    def _make_room(self, incoming_size: int, in_b2: bool) -> None:
+        """Remove itens residentes até caber um novo item"""
+        while self.cache and (len(self.cache) >= self.capacity or self._over_budget(incoming_size)):
+            self._replace(in_b2)
+
+    def _replace(self, in_b2: bool = False, protect: int = None) -> bool:
+        """
+        Remove o LRU de T1 ou de T2 conforme o alvo p, movendo-o para o fantasma
+
+        Args:
+            in_b2 (bool): A requisição atual foi um miss fantasma em B2
+            protect (int, optional): Chave que não pode ser removida
+
+        Returns:
+            bool: True se algum item foi removido
+        """
+        t1_candidate = next((k for k in self.t1 if k != protect), None)
+        t2_candidate = next((k for k in self.t2 if k != protect), None)
+
+        prefer_t1 = len(self.t1) > self.p or (in_b2 and len(self.t1) == int(self.p))
+        if t1_candidate is not None and (prefer_t1 or t2_candidate is None):
+            self._evict_key(t1_candidate, self.b1)
+            return True
+        if t2_candidate is not None:
+            self._evict_key(t2_candidate, self.b2)
+            return True
+        return False
+
+    def _evict_one(self, protect: int = None) -> bool:
+        """Remove um item residente (usado pelo orçamento em bytes)"""
+        return self._replace(protect=protect)
+
+    def _trim_ghosts(self) -> None:
+        """Mantém |T1|+|B1| <= c e o total das quatro listas <= 2c"""
+        while self.b1 and len(self.t1) + len(self.b1) > self.capacity:
+            self.b1.popitem(last=False)
+        while self.b2 and len(self.cache) + len(self.b1) + len(self.b2) > 2 * self.capacity:
+            self.b2.popitem(last=False)
+
+    def _over_budget(self, incoming_size: int) -> bool:
+        """Verifica se admitir incoming_size bytes excederia o orçamento"""
+        return self.max_bytes is not None and self.current_bytes + incoming_size > self.max_bytes
+
+    def _evict_key(self, key: int, ghost: OrderedDict) -> None:
+        """Remove uma chave por capacidade, registra no fantasma e notifica on_evict"""
+        value = self.cache[key]
+        self._remove_entry(key)
+        ghost[key] = None
+        if self.on_evict is not None:
+            self.on_evict(key, value)
+
+    def _remove_entry(self, key: int) -> None:
+        """Remove uma chave residente de todas as estruturas internas"""
+        del self.cache[key]
+        self.t1.pop(key, None)
+        self.t2.pop(key, None)
+        self.current_bytes -= self.entry_sizes.pop(key, 0)
+
+    def remove(self, key: int) -> bool:
+        """
+        Remove uma chave do cache (sem notificar on_evict)
+
+        Args:
+            key (int): Chave a remover
+
+        Returns:
+            bool: True se a chave estava no cache
+        """
+        if key not in self.cache:
+            return False
+        self._remove_entry(key)
+        return True
+
+    def clear(self) -> None:
+        """Limpa todo o cache, incluindo as listas fantasmas"""
+        self.cache.clear()
+        self.t1.clear()
+        self.t2.clear()
+        self.b1.clear()
+        self.b2.clear()
+        self.p = 0.0
+        self.entry_sizes.clear()
+        self.current_bytes = 0
+
+    def size(self) -> int:
+        """Retorna o tamanho atual do cache"""
+        return len(self.cache)
+
+    def is_full(self) -> bool:
+        """Verifica se o cache está cheio"""
+        return len(self.cache) >= self.capacity
+
+    def get_stats(self) -> dict:
+        """
+        Retorna estatísticas do cache
+
+        Returns:
+            dict: Estatísticas detalhadas
+        """
+        hit_rate = (self.hit_count / self.access_count * 100) if self.access_count > 0 else 0
+
+        return {
+            'algorithm': 'ARC',
+            'capacity': self.capacity,
+            'current_size': len(self.cache),
+            'total_accesses': self.access_count,
+            'hits': self.hit_count,
+            'misses': self.miss_count,
+            'hit_rate': hit_rate,
+            'keys_in_cache': list(self.t1) + list(self.t2),
+            'max_bytes': self.max_bytes,
+            'bytes_used': self.current_bytes,
+            'target_t1_size': self.p,
+            't1_size': len(self.t1),
+            't2_size': len(self.t2),
+            'b1_size': len(self.b1),
+            'b2_size': len(self.b2)
+        }
+
+    def reset_stats(self) -> None:
+        """Reinicia as estatísticas sem limpar o cache"""
+        self.access_count = 0
+        self.hit_count = 0
+        self.miss_count = 0
+
+    def contains(self, key: int) -> bool:
+        """
+        Verifica se uma chave está no cache
+
+        Args:
+            key (int): Chave a verificar
+
+        Returns:
+            bool: True se a chave está no cache
+        """
+        return key in self.cache
+
+    def __str__(self) -> str:
+        """Representação string do cache"""
+        return f"ARCCache(capacity={self.capacity}, size={len(self.cache)}, p={self.p:.1f}, hit_rate={self.get_stats()['hit_rate']:.1f}%)"
+
+    def __repr__(self) -> str:
+        return self.__str__()
@@ -0,0 +1,170 @@
+"""
+Utilitários compartilhados pelos algoritmos de cache
+Medição do tamanho dos valores armazenados, criação de caches equivalentes,
+operações em lote e visões de mapeamento para políticas com armazenamento em
+slots ou nós
+"""
+
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+
+def default_sizer(value: Any) -> int:
+    """
+    Calcula o tamanho em bytes de um valor armazenado no cache
+
+    Strings são medidas pelo tamanho codificado em UTF-8 (o mesmo dos arquivos
+    em texts/); bytes e memoryviews pelo número de bytes.
+
+    Args:
+        value: Valor armazenado
+
+    Returns:
+        int: Tamanho em bytes
+    """
+    if value is None:
+        return 0
+    if isinstance(value, str):
+        return len(value.encode('utf-8'))
+    if isinstance(value, memoryview):
+        return value.nbytes
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    return len(str(value).encode('utf-8'))
+
+
+def new_cache_like(cache: Any, capacity: int = None, max_bytes: int = None) -> Any:
+    """
+    Cria um cache vazio com a mesma política e configuração de outro
+
+    Args:
+        cache: Instância de referência
+        capacity: Nova capacidade (None = mesma capacidade da referência)
+        max_bytes: Novo orçamento em bytes (None = mesmo orçamento da referência)
+
+    Returns:
+        Nova instância vazia
+    """
+    if capacity is None:
+        capacity = cache.capacity
+    if max_bytes is None:
+        max_bytes = getattr(cache, 'max_bytes', None)
+
+    if hasattr(cache, 'spawn'):
+        return cache.spawn(capacity, max_bytes)
+
+    kwargs = {}
+    if max_bytes is not None:
+        kwargs['max_bytes'] = max_bytes
+        kwargs['sizer'] = cache.sizer
+    return type(cache)(capacity, **kwargs)
+
+
+def innermost_policy(cache: Any) -> Any:
+    """
+    Retorna a política por baixo das camadas que a envolvem (compressão, TTL)
+
+    Args:
+        cache: Instância da política ou de uma camada
+
+    Returns:
+        A política mais interna
+    """
+    while getattr(cache, 'policy', None) is not None:
+        cache = cache.policy
+    return cache
+
+
+def get_many(cache: Any, keys: Iterable[Any]) -> Dict[Any, Any]:
+    """
+    Recupera várias chaves de uma política, usando o get_many dela se existir
+
+    O método é procurado na classe (e não na instância) para que camadas que
+    delegam atributos à política interna (compressão, TTL) não sejam puladas.
+
+    Args:
+        cache: Instância da política
+        keys: Sequência de chaves
+
+    Returns:
+        Dict: Chave -> valor apenas dos itens encontrados
+    """
+    if hasattr(type(cache), 'get_many'):
+        return cache.get_many(keys)
+
+    found = {}
+    for key in keys:
+        value = cache.get(key)
+        if value is not None:
+            found[key] = value
+    return found
+
+
+def put_many(cache: Any, items: Iterable[Tuple[Any, Any]]) -> None:
+    """
+    Armazena vários pares (chave, valor) em uma política, usando o put_many dela se existir
+
+    Args:
+        cache: Instância da política
+        items: Pares (chave, valor) na ordem de inserção ou dicionário
+    """
+    if isinstance(items, dict):
+        items = items.items()
+    if hasattr(type(cache), 'put_many'):
+        cache.put_many(items)
+        return
+
+    for key, value in items:
+        cache.put(key, value)
+
+
+class SlotMapping(Mapping):
+    """
+    Visão somente leitura chave -> valor de um cache com armazenamento em slots
+
+    Políticas baseadas em arrays (CLOCK, CLOCK-Pro) guardam os valores em uma
+    lista de tamanho fixo e apenas o slot de cada chave em um dicionário; esta
+    visão expõe o mesmo atributo `cache` das demais políticas sem duplicar os
+    valores.
+    """
+
+    def __init__(self, slot_of: Dict[Any, int], values: List[Any]):
+        self._slot_of = slot_of
+        self._values = values
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._values[self._slot_of[key]]
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._slot_of
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._slot_of)
+
+    def __len__(self) -> int:
+        return len(self._slot_of)
+
+
+class NodeMapping(Mapping):
+    """
+    Visão somente leitura chave -> valor de um cache com nós encadeados
+
+    Políticas que guardam cada item em um nó (LFU com lista de frequências)
+    mantêm apenas o dicionário chave -> nó; esta visão expõe o atributo `cache`
+    com os valores dos nós.
+    """
+
+    def __init__(self, nodes: Dict[Any, Any]):
+        self._nodes = nodes
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._nodes[key].value
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._nodes
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._nodes)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
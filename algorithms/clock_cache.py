@@ -0,0 +1,245 @@
+"""
+Implementação do algoritmo CLOCK (segunda chance)
+Aproximação do LRU em um buffer circular de tamanho fixo: um hit apenas marca
+o bit de referência, sem reordenar nenhuma estrutura
+"""
+
+from typing import Any, Callable, Optional
+
+from algorithms.cache_utils import SlotMapping, default_sizer
+
+class CLOCKCache:
+    """
+    Implementação do algoritmo de cache CLOCK
+
+    Os itens ocupam slots de arrays de tamanho fixo (chaves, valores e bits de
+    referência). Um hit só escreve 1 no bit de referência do slot; na remoção,
+    o ponteiro (hand) percorre o anel zerando bits marcados até achar um slot
+    com bit 0. Hits não alteram dicionários, o que os torna baratos e
+    praticamente somente leitura sob concorrência.
+    """
+
+    def __init__(self, capacity: int, max_bytes: Optional[int] = None,
+                 sizer: Optional[Callable[[Any], int]] = None):
+        """
+        Inicializa o cache CLOCK
+
+        Args:
+            capacity (int): Capacidade máxima do cache (número de itens)
+            max_bytes (int, optional): Orçamento máximo em bytes (None = sem limite)
+            sizer (callable, optional): Função que mede o tamanho de um valor em bytes
+        """
+        self.capacity = capacity
+        self.keys = [None] * capacity
+        self.values = [None] * capacity
+        self.referenced = bytearray(capacity)
+        self.slot_of = {}  # key -> slot
+        self.free_slots = list(range(capacity - 1, -1, -1))
+        self.hand = 0
+        self.cache = SlotMapping(self.slot_of, self.values)
+        self.access_count = 0
+        self.hit_count = 0
+        self.miss_count = 0
+
+        # Orçamento em bytes
+        self.max_bytes = max_bytes
+        self.sizer = sizer or default_sizer
+        self.entry_sizes = {}
+        self.current_bytes = 0
+
+        # Callback opcional chamado com (chave, valor) a cada remoção por capacidade
+        self.on_evict = None
+
+    def get(self, key: int) -> str:
+        """
+        Recupera um item do cache marcando seu bit de referência
+
+        Args:
+            key (int): Chave do item
+
+        Returns:
+            str: Valor do item ou None se não encontrado
+        """
+        self.access_count += 1
+        slot = self.slot_of.get(key)
+
+        if slot is None:
+            self.miss_count += 1
+            return None
+
+        self.referenced[slot] = 1
+        self.hit_count += 1
+        return self.values[slot]
+
+    def put(self, key: int, value: str) -> None:
+        """
+        Adiciona um item ao cache
+
+        Args:
+            key (int): Chave do item
+            value (str): Valor do item
+        """
+        if self.capacity <= 0:
+            return
+
+        size = self.sizer(value)
+
+        # Item maior que todo o orçamento não é admitido
+        if self.max_bytes is not None and size > self.max_bytes:
+            if key in self.slot_of:
+                self._remove_entry(key)
+            return
+
+        slot = self.slot_of.get(key)
+        if slot is not None:
+            self.values[slot] = value
+            self.referenced[slot] = 1
+            self.current_bytes += size - self.entry_sizes[key]
+            self.entry_sizes[key] = size
+            while self._over_budget(0) and self._evict_one(protect=key):
+                pass
+            return
+
+        while self.slot_of and (len(self.slot_of) >= self.capacity or self._over_budget(size)):
+            self._evict_one()
+
+        slot = self.free_slots.pop()
+        self.keys[slot] = key
+        self.values[slot] = value
+        self.referenced[slot] = 0
+        self.slot_of[key] = slot
+        self.entry_sizes[key] = size
+        self.current_bytes += size
+
+    def _over_budget(self, incoming_size: int) -> bool:
+        """Verifica se admitir incoming_size bytes excederia o orçamento"""
+        return self.max_bytes is not None and self.current_bytes + incoming_size > self.max_bytes
+
+    def _evict_one(self, protect: int = None) -> bool:
+        """
+        Avança o ponteiro dando segunda chance aos itens referenciados
+
+        Args:
+            protect (int, optional): Chave que não pode ser removida
+
+        Returns:
+            bool: True se algum item foi removido
+        """
+        keys = self.keys
+        referenced = self.referenced
+
+        # Duas voltas bastam: a primeira zera todos os bits de referência
+        for _ in range(2 * self.capacity):
+            slot = self.hand
+            self.hand = (slot + 1) % self.capacity
+            key = keys[slot]
+
+            if key is None or key == protect:
+                continue
+            if referenced[slot]:
+                referenced[slot] = 0
+                continue
+
+            self._evict_key(key)
+            return True
+        return False
+
+    def _evict_key(self, key: int) -> None:
+        """Remove uma chave por capacidade e notifica on_evict"""
+        value = self.values[self.slot_of[key]]
+        self._remove_entry(key)
+        if self.on_evict is not None:
+            self.on_evict(key, value)
+
+    def _remove_entry(self, key: int) -> None:
+        """Libera o slot de uma chave"""
+        slot = self.slot_of.pop(key)
+        self.keys[slot] = None
+        self.values[slot] = None
+        self.referenced[slot] = 0
+        self.free_slots.append(slot)
+        self.current_bytes -= self.entry_sizes.pop(key, 0)
+
+    def remove(self, key: int) -> bool:
+        """
+        Remove uma chave do cache (sem notificar on_evict)
+
+        Args:
+            key (int): Chave a remover
+
+        Returns:
+            bool: True se a chave estava no cache
+        """
+        if key not in self.slot_of:
+            return False
+        self._remove_entry(key)
+        return True
+
+    def clear(self) -> None:
+        """Limpa todo o cache"""
+        for slot in range(self.capacity):
+            self.keys[slot] = None
+            self.values[slot] = None
+            self.referenced[slot] = 0
+        self.slot_of.clear()
+        self.free_slots[:] = range(self.capacity - 1, -1, -1)
+        self.hand = 0
+        self.entry_sizes.clear()
+        self.current_bytes = 0
+
+    def size(self) -> int:
+        """Retorna o tamanho atual do cache"""
+        return len(self.slot_of)
+
+    def is_full(self) -> bool:
+        """Verifica se o cache está cheio"""
+        return len(self.slot_of) >= self.capacity
+
+    def get_stats(self) -> dict:
+        """
+        Retorna estatísticas do cache
+
+        Returns:
+            dict: Estatísticas detalhadas
+        """
+        hit_rate = (self.hit_count / self.access_count * 100) if self.access_count > 0 else 0
+
+        return {
+            'algorithm': 'CLOCK',
+            'capacity': self.capacity,
+            'current_size': len(self.slot_of),
+            'total_accesses': self.access_count,
+            'hits': self.hit_count,
+            'misses': self.miss_count,
+            'hit_rate': hit_rate,
+            'keys_in_cache': list(self.slot_of),
+            'max_bytes': self.max_bytes,
+            'bytes_used': self.current_bytes,
+            'hand': self.hand,
+            'referenced': sum(self.referenced)
+        }
+
+    def reset_stats(self) -> None:
+        """Reinicia as estatísticas sem limpar o cache"""
+        self.access_count = 0
+        self.hit_count = 0
+        self.miss_count = 0
+
+    def contains(self, key: int) -> bool:
+        """
+        Verifica se uma chave está no cache
+
+        Args:
+            key (int): Chave a verificar
+
+        Returns:
+            bool: True se a chave está no cache
+        """
+        return key in self.slot_of
+
+    def __str__(self) -> str:
+        """Representação string do cache"""
+        return f"CLOCKCache(capacity={self.capacity}, size={len(self.slot_of)}, hit_rate={self.get_stats()['hit_rate']:.1f}%)"
+
+    def __repr__(self) -> str:
+        return self.__str__()
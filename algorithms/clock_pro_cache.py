@@ -0,0 +1,372 @@
+"""
+Implementação do algoritmo CLOCK-Pro
+Versão adaptativa do CLOCK que separa páginas quentes e frias e mantém um
+período de teste para páginas frias removidas, em arrays de tamanho fixo
+"""
+
+from typing import Any, Callable, Optional
+
+from algorithms.cache_utils import SlotMapping, default_sizer
+
+# Estado de cada slot do anel
+EMPTY = 0
+COLD = 1  # Residente, fria
+HOT = 2   # Residente, quente
+TEST = 3  # Não residente, ainda em período de teste
+
+class CLOCKProCache:
+    """
+    Implementação do algoritmo de cache CLOCK-Pro (Jiang, Chen & Zhang)
+
+    O anel tem 2 × capacidade slots: até `capacity` residentes (quentes ou
+    frias) e até `capacity` chaves não residentes em teste. Três ponteiros
+    percorrem o anel:
+
+    - hand_cold remove páginas frias sem referência (que viram TEST) e promove
+      a quentes as frias referenciadas;
+    - hand_hot rebaixa a frias as quentes sem referência quando há quentes demais;
+    - hand_test encerra o período de teste das não residentes.
+
+    Um miss em uma chave ainda em teste indica que as frias precisam de mais
+    espaço (cold_target cresce) e a chave volta como quente; testes que
+    expiram sem reuso reduzem cold_target. Assim como no CLOCK, um hit só
+    marca o bit de referência.
+
+    Novas entradas ocupam um slot livre do anel em vez de serem inseridas na
+    cabeça de uma lista, que é a aproximação usual com arrays de tamanho fixo.
+    """
+
+    def __init__(self, capacity: int, max_bytes: Optional[int] = None,
+                 sizer: Optional[Callable[[Any], int]] = None):
+        """
+        Inicializa o cache CLOCK-Pro
+
+        Args:
+            capacity (int): Capacidade máxima do cache (número de itens residentes)
+            max_bytes (int, optional): Orçamento máximo em bytes (None = sem limite)
+            sizer (callable, optional): Função que mede o tamanho de um valor em bytes
+        """
+        self.capacity = capacity
+        self.ring_size = 2 * capacity
+        self.keys = [None] * self.ring_size
+        self.values = [None] * self.ring_size
+        self.status = bytearray(self.ring_size)
+        self.referenced = bytearray(self.ring_size)
+        self.slot_of = {}       # key -> slot (residentes)
+        self.test_slot_of = {}  # key -> slot (não residentes em teste)
+        self.free_slots = list(range(self.ring_size - 1, -1, -1))
+        self.cache = SlotMapping(self.slot_of, self.values)
+
+        self.hand_cold = 0
+        self.hand_hot = 0
+        self.hand_test = 0
+        self.hot_count = 0
+        self.cold_count = 0
+        self.cold_target = capacity  # Alvo adaptativo de residentes frias
+
+        self.access_count = 0
+        self.hit_count = 0
+        self.miss_count = 0
+
+        # Orçamento em bytes
+        self.max_bytes = max_bytes
+        self.sizer = sizer or default_sizer
+        self.entry_sizes = {}
+        self.current_bytes = 0
+
+        # Callback opcional chamado com (chave, valor) a cada remoção por capacidade
+        self.on_evict = None
+
+    def get(self, key: int) -> str:
+        """
+        Recupera um item do cache marcando seu bit de referência
+
+        Args:
+            key (int): Chave do item
+
+        Returns:
+            str: Valor do item ou None se não encontrado
+        """
+        self.access_count += 1
+        slot = self.slot_of.get(key)
+
+        if slot is None:
+            self.miss_count += 1
+            return None
+
+        self.referenced[slot] = 1
+        self.hit_count += 1
+        return self.values[slot]
+
+    def put(self, key: int, value: str) -> None:
+        """
+        Adiciona um item ao cache
+
+        Args:
+            key (int): Chave do item
+            value (str): Valor do item
+        """
+        if self.capacity <= 0:
+            return
+
+        size = self.sizer(value)
+
+        # Item maior que todo o orçamento não é admitido
+        if self.max_bytes is not None and size > self.max_bytes:
+            if key in self.slot_of:
+                self._remove_entry(key)
+            return
+
+        slot = self.slot_of.get(key)
+        if slot is not None:
+            self.values[slot] = value
+            self.referenced[slot] = 1
+            self.current_bytes += size - self.entry_sizes[key]
+            self.entry_sizes[key] = size
+            while self._over_budget(0) and self._evict_one(protect=key):
+                pass
+            return
+
+        # Reuso durante o período de teste: frias precisam de mais espaço
+        was_in_test = key in self.test_slot_of
+        if was_in_test:
+            self._free_slot(self.test_slot_of.pop(key))
+            self.cold_target = min(self.capacity, self.cold_target + 1)
+
+        while self.slot_of and (len(self.slot_of) >= self.capacity or self._over_budget(size)):
+            if not self._evict_one():
+                break
+
+        slot = self.free_slots.pop()
+        self.keys[slot] = key
+        self.values[slot] = value
+        self.referenced[slot] = 0
+        self.slot_of[key] = slot
+        self.entry_sizes[key] = size
+        self.current_bytes += size
+
+        if was_in_test:
+            self.status[slot] = HOT
+            self.hot_count += 1
+            self._balance_hot()
+        else:
+            self.status[slot] = COLD
+            self.cold_count += 1
+
+    def _advance(self, hand: int) -> int:
+        return (hand + 1) % self.ring_size
+
+    def _run_hand_cold(self, protect: int = None) -> bool:
+        """
+        Processa o slot sob hand_cold
+
+        Returns:
+            bool: True se uma página residente foi removida
+        """
+        slot = self.hand_cold
+        self.hand_cold = self._advance(slot)
+        evicted = False
+
+        if self.status[slot] == COLD and self.keys[slot] != protect:
+            if self.referenced[slot]:
+                # Fria reutilizada: promover a quente
+                self.referenced[slot] = 0
+                self.status[slot] = HOT
+                self.cold_count -= 1
+                self.hot_count += 1
+            else:
+                self._evict_slot(slot)
+                evicted = True
+
+        self._balance_hot()
+        return evicted
+
+    def _run_hand_hot(self) -> None:
+        """Processa o slot sob hand_hot (rebaixa quentes sem referência)"""
+        slot = self.hand_hot
+        self.hand_hot = self._advance(slot)
+
+        if self.status[slot] == HOT:
+            if self.referenced[slot]:
+                self.referenced[slot] = 0
+            else:
+                self.status[slot] = COLD
+                self.hot_count -= 1
+                self.cold_count += 1
+
+    def _run_hand_test(self) -> None:
+        """Processa o slot sob hand_test (encerra períodos de teste)"""
+        slot = self.hand_test
+        self.hand_test = self._advance(slot)
+
+        if self.status[slot] == TEST:
+            del self.test_slot_of[self.keys[slot]]
+            self._free_slot(slot)
+            if self.cold_target > 1:
+                self.cold_target -= 1
+
+    def _balance_hot(self) -> None:
+        """Rebaixa quentes enquanto excederem capacity - cold_target"""
+        while self.hot_count > 0 and self.hot_count > self.capacity - self.cold_target:
+            self._run_hand_hot()
+
+    def _over_budget(self, incoming_size: int) -> bool:
+        """Verifica se admitir incoming_size bytes excederia o orçamento"""
+        return self.max_bytes is not None and self.current_bytes + incoming_size > self.max_bytes
+
+    def _evict_one(self, protect: int = None) -> bool:
+        """
+        Avança hand_cold até remover uma página residente
+
+        Args:
+            protect (int, optional): Chave que não pode ser removida
+
+        Returns:
+            bool: True se algum item foi removido
+        """
+        # Cada volta zera bits de referência e rebaixa quentes; poucas voltas bastam
+        for _ in range(4 * self.ring_size):
+            if self._run_hand_cold(protect):
+                return True
+
+        # Só restou a chave protegida entre as frias: remover a primeira quente
+        for slot in range(self.ring_size):
+            if self.status[slot] in (COLD, HOT) and self.keys[slot] != protect:
+                self._evict_slot(slot, keep_test=False)
+                return True
+        return False
+
+    def _evict_slot(self, slot: int, keep_test: bool = True) -> None:
+        """
+        Remove a página residente de um slot e notifica on_evict
+
+        Args:
+            slot (int): Slot da página
+            keep_test (bool): Manter a chave no anel em período de teste
+        """
+        key = self.keys[slot]
+        value = self.values[slot]
+
+        if keep_test and self.status[slot] == COLD:
+            del self.slot_of[key]
+            self.cold_count -= 1
+            self.current_bytes -= self.entry_sizes.pop(key, 0)
+            self.status[slot] = TEST
+            self.values[slot] = None
+            self.referenced[slot] = 0
+            self.test_slot_of[key] = slot
+            while len(self.test_slot_of) > self.capacity:
+                self._run_hand_test()
+        else:
+            self._remove_entry(key)
+
+        if self.on_evict is not None:
+            self.on_evict(key, value)
+
+    def _free_slot(self, slot: int) -> None:
+        """Devolve um slot ao conjunto de slots livres"""
+        self.keys[slot] = None
+        self.values[slot] = None
+        self.status[slot] = EMPTY
+        self.referenced[slot] = 0
+        self.free_slots.append(slot)
+
+    def _remove_entry(self, key: int) -> None:
+        """Remove uma chave residente, liberando seu slot"""
+        slot = self.slot_of.pop(key)
+        if self.status[slot] == HOT:
+            self.hot_count -= 1
+        else:
+            self.cold_count -= 1
+        self._free_slot(slot)
+        self.current_bytes -= self.entry_sizes.pop(key, 0)
+
+    def remove(self, key: int) -> bool:
+        """
+        Remove uma chave do cache (sem notificar on_evict)
+
+        Args:
+            key (int): Chave a remover
+
+        Returns:
+            bool: True se a chave estava no cache
+        """
+        if key not in self.slot_of:
+            return False
+        self._remove_entry(key)
+        return True
+
+    def clear(self) -> None:
+        """Limpa todo o cache, incluindo as chaves em teste"""
+        for slot in range(self.ring_size):
+            self.keys[slot] = None
+            self.values[slot] = None
+            self.status[slot] = EMPTY
+            self.referenced[slot] = 0
+        self.slot_of.clear()
+        self.test_slot_of.clear()
+        self.free_slots[:] = range(self.ring_size - 1, -1, -1)
+        self.hand_cold = self.hand_hot = self.hand_test = 0
+        self.hot_count = self.cold_count = 0
+        self.cold_target = self.capacity
+        self.entry_sizes.clear()
+        self.current_bytes = 0
+
+    def size(self) -> int:
+        """Retorna o tamanho atual do cache"""
+        return len(self.slot_of)
+
+    def is_full(self) -> bool:
+        """Verifica se o cache está cheio"""
+        return len(self.slot_of) >= self.capacity
+
+    def get_stats(self) -> dict:
+        """
+        Retorna estatísticas do cache
+
+        Returns:
+            dict: Estatísticas detalhadas
+        """
+        hit_rate = (self.hit_count / self.access_count * 100) if self.access_count > 0 else 0
+
+        return {
+            'algorithm': 'CLOCKPro',
+            'capacity': self.capacity,
+            'current_size': len(self.slot_of),
+            'total_accesses': self.access_count,
+            'hits': self.hit_count,
+            'misses': self.miss_count,
+            'hit_rate': hit_rate,
+            'keys_in_cache': list(self.slot_of),
+            'max_bytes': self.max_bytes,
+            'bytes_used': self.current_bytes,
+            'hot_size': self.hot_count,
+            'cold_size': self.cold_count,
+            'test_size': len(self.test_slot_of),
+            'cold_target': self.cold_target
+        }
+
+    def reset_stats(self) -> None:
+        """Reinicia as estatísticas sem limpar o cache"""
+        self.access_count = 0
+        self.hit_count = 0
+        self.miss_count = 0
+
+    def contains(self, key: int) -> bool:
+        """
+        Verifica se uma chave está no cache
+
+        Args:
+            key (int): Chave a verificar
+
+        Returns:
+            bool: True se a chave está no cache
+        """
+        return key in self.slot_of
+
+    def __str__(self) -> str:
+        """Representação string do cache"""
+        return f"CLOCKProCache(capacity={self.capacity}, size={len(self.slot_of)}, hit_rate={self.get_stats()['hit_rate']:.1f}%)"
+
+    def __repr__(self) -> str:
+        return self.__str__()
@@ -0,0 +1,189 @@
+"""
+Camada de compressão para qualquer política de cache
+Armazena os valores comprimidos (zlib ou lzma, da biblioteca padrão) na
+política interna e os descomprime de forma transparente no get
+"""
+
+import lzma
+import time
+import zlib
+from typing import Any, Callable, Optional
+
+from algorithms.cache_utils import new_cache_like
+
+
+def _zlib_compress(data: bytes, level: Optional[int]) -> bytes:
+    return zlib.compress(data, 6 if level is None else level)
+
+
+def _lzma_compress(data: bytes, level: Optional[int]) -> bytes:
+    return lzma.compress(data, preset=level)
+
+
+# Codecs disponíveis: nome -> (comprimir(dados, nível), descomprimir(dados))
+CODECS = {
+    'zlib': (_zlib_compress, zlib.decompress),
+    'lzma': (_lzma_compress, lzma.decompress)
+}
+
+# Primeiro byte do valor armazenado: tipo original do valor
+_TEXT_TAG = b's'
+_BINARY_TAG = b'b'
+
+
+class CompressedCache:
+    """
+    Envolve uma política de cache (FIFO, LRU, LFU, MRU...) comprimindo os valores
+
+    A política interna decide as remoções normalmente; como ela guarda os bytes
+    comprimidos, caches com orçamento em bytes (max_bytes) passam a comportar
+    vários textos a mais. Strings voltam como str; bytes e memoryviews voltam
+    como bytes.
+    """
+
+    def __init__(self, policy: Any, codec: str = 'zlib', level: Optional[int] = None):
+        """
+        Inicializa a camada de compressão
+
+        Args:
+            policy: Instância da política de cache a envolver
+            codec (str): 'zlib' ou 'lzma'
+            level (int, optional): Nível de compressão (None = padrão do codec)
+        """
+        if codec not in CODECS:
+            raise ValueError(f"Codec de compressão desconhecido: {codec}")
+
+        self.policy = policy
+        self.codec = codec
+        self.level = level
+        self._on_evict = None
+
+        # Estatísticas de compressão
+        self.original_bytes = 0
+        self.compressed_bytes = 0
+        self.decompressions = 0
+        self.total_decompression_time = 0.0
+
+    def get(self, key: int) -> Any:
+        """
+        Recupera e descomprime um item do cache
+
+        Args:
+            key (int): Chave do item
+
+        Returns:
+            Valor original ou None se não encontrado
+        """
+        stored = self.policy.get(key)
+        if stored is None:
+            return None
+
+        start_time = time.perf_counter()
+        value = self._decode(stored)
+        self.total_decompression_time += time.perf_counter() - start_time
+        self.decompressions += 1
+        return value
+
+    def _decode(self, stored: bytes) -> Any:
+        """Descomprime um valor armazenado e restaura o tipo original"""
+        data = CODECS[self.codec][1](stored[1:])
+        return data.decode('utf-8') if stored[:1] == _TEXT_TAG else data
+
+    def put(self, key: int, value: Any) -> None:
+        """
+        Comprime e armazena um item no cache
+
+        Args:
+            key (int): Chave do item
+            value: str, bytes ou memoryview
+        """
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            tag, data = _BINARY_TAG, bytes(value)
+        else:
+            tag, data = _TEXT_TAG, str(value).encode('utf-8')
+
+        stored = tag + CODECS[self.codec][0](data, self.level)
+        self.original_bytes += len(data)
+        self.compressed_bytes += len(stored)
+        self.policy.put(key, stored)
+
+    def spawn(self, capacity: int, max_bytes: Optional[int] = None) -> 'CompressedCache':
+        """Cria uma cópia vazia (mesma política e codec) com outra capacidade"""
+        return CompressedCache(new_cache_like(self.policy, capacity, max_bytes),
+                               self.codec, self.level)
+
+    @property
+    def on_evict(self) -> Optional[Callable[[int, Any], None]]:
+        """Callback chamado com (chave, valor original) a cada remoção por capacidade"""
+        return self._on_evict
+
+    @on_evict.setter
+    def on_evict(self, callback: Optional[Callable[[int, Any], None]]) -> None:
+        self._on_evict = callback
+        self.policy.on_evict = self._forward_evict if callback is not None else None
+
+    def _forward_evict(self, key: int, stored: bytes) -> None:
+        self._on_evict(key, self._decode(stored))
+
+    def clear(self) -> None:
+        """Limpa todo o cache"""
+        self.policy.clear()
+
+    def size(self) -> int:
+        """Retorna o tamanho atual do cache"""
+        return self.policy.size()
+
+    def is_full(self) -> bool:
+        """Verifica se o cache está cheio"""
+        return self.policy.is_full()
+
+    def get_compression_ratio(self) -> float:
+        """
+        Retorna a razão de compressão acumulada (tamanho original / comprimido)
+
+        Returns:
+            float: Razão de compressão (0 se nada foi armazenado)
+        """
+        if self.compressed_bytes == 0:
+            return 0.0
+        return self.original_bytes / self.compressed_bytes
+
+    def get_stats(self) -> dict:
+        """
+        Retorna estatísticas da política interna e da compressão
+
+        Returns:
+            dict: Estatísticas detalhadas
+        """
+        stats = self.policy.get_stats()
+        stats.update({
+            'codec': self.codec,
+            'compression_ratio': self.get_compression_ratio(),
+            'original_bytes': self.original_bytes,
+            'compressed_bytes': self.compressed_bytes,
+            'decompressions': self.decompressions,
+            'avg_decompression_time': (self.total_decompression_time / self.decompressions
+                                       if self.decompressions > 0 else 0.0)
+        })
+        return stats
+
+    def reset_stats(self) -> None:
+        """Reinicia as estatísticas sem limpar o cache"""
+        self.policy.reset_stats()
+        self.original_bytes = 0
+        self.compressed_bytes = 0
+        self.decompressions = 0
+        self.total_decompression_time = 0.0
+
+    def __getattr__(self, name: str) -> Any:
+        # Demais atributos (cache, capacity, max_bytes, peek_lru...) vêm da política
+        if name == 'policy':
+            raise AttributeError(name)
+        return getattr(self.policy, name)
+
+    def __str__(self) -> str:
+        """Representação string do cache"""
+        return f"CompressedCache({self.policy}, codec={self.codec})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
@@ -4,7 +4,10 @@ Cache que remove o item mais antigo quando atinge capacidade máxima
 """
 
 from collections import OrderedDict
-import time
+from typing import Any, Callable, Optional
+
+from algorithms.cache_utils import default_sizer
+from algorithms.timing import Clock, LogicalClock, WallClock
 
 class FIFOCache:
     """
@@ -14,20 +17,34 @@ class FIFOCache:
     independentemente de quão recentemente foi acessado.
     """
 
-    def __init__(self, capacity: int):
+    def __init__(self, capacity: int, max_bytes: Optional[int] = None,
+                 sizer: Optional[Callable[[Any], int]] = None,
+                 clock: Optional[Clock] = None):
         """
         Inicializa o cache FIFO
 
         Args:
-            capacity (int): Capacidade máxima do cache
+            capacity (int): Capacidade máxima do cache (número de itens)
+            max_bytes (int, optional): Orçamento máximo em bytes (None = sem limite)
+            sizer (callable, optional): Função que mede o tamanho de um valor em bytes
+            clock (optional): Relógio das inserções (None = LogicalClock)
         """
         self.capacity = capacity
         self.cache = OrderedDict()  # Mantém ordem de inserção
         self.access_count = 0
         self.hit_count = 0
         self.miss_count = 0
-        self.insertion_order = {}  # Rastrear ordem de inserção
-        self.order_counter = 0
+        self.clock = clock or LogicalClock()
+        self.insertion_order = {}  # Rastrear instante de inserção (segundo o relógio)
+
+        # Orçamento em bytes
+        self.max_bytes = max_bytes
+        self.sizer = sizer or default_sizer
+        self.entry_sizes = {}
+        self.current_bytes = 0
+
+        # Callback opcional chamado com (chave, valor) a cada remoção por capacidade
+        self.on_evict = None
 
     def get(self, key: int) -> str:
         """
@@ -56,29 +73,120 @@ class FIFOCache:
             key (int): Chave do item
             value (str): Valor do item
         """
+        size = self.sizer(value)
+
+        # Item maior que todo o orçamento não é admitido
+        if self.max_bytes is not None and size > self.max_bytes:
+            if key in self.cache:
+                self._remove_entry(key)
+            return
+
         # Se a chave já existe, atualizar valor mas manter posição FIFO
         if key in self.cache:
             self.cache[key] = value
+            self.current_bytes += size - self.entry_sizes[key]
+            self.entry_sizes[key] = size
+            while self._over_budget(0) and self._evict_one(protect=key):
+                pass
             return
 
-        # Se cache está cheio, remover o primeiro item (FIFO)
-        if len(self.cache) >= self.capacity:
-            # Remove o primeiro item inserido
-            oldest_key = next(iter(self.cache))
-            del self.cache[oldest_key]
-            if oldest_key in self.insertion_order:
-                del self.insertion_order[oldest_key]
+        # Se cache está cheio, remover os primeiros itens inseridos (FIFO)
+        while self.cache and (len(self.cache) >= self.capacity or self._over_budget(size)):
+            self._evict_one()
 
         # Adicionar novo item
         self.cache[key] = value
-        self.insertion_order[key] = self.order_counter
-        self.order_counter += 1
+        self.insertion_order[key] = self.clock.now()
+        self.entry_sizes[key] = size
+        self.current_bytes += size
+
+    def get_many(self, keys) -> dict:
+        """
+        Recupera vários itens de uma vez
+
+        Args:
+            keys: Sequência de chaves (cada uma conta como um acesso)
+
+        Returns:
+            dict: Chave -> valor apenas dos itens encontrados
+        """
+        keys = list(keys)
+        cache = self.cache
+        found = {key: cache[key] for key in keys if key in cache}
+        hits = sum(1 for key in keys if key in found)
+
+        self.access_count += len(keys)
+        self.hit_count += hits
+        self.miss_count += len(keys) - hits
+        return found
+
+    def put_many(self, items) -> None:
+        """
+        Adiciona vários itens ao cache, na ordem dada
+
+        Args:
+            items: Pares (chave, valor) ou dicionário chave -> valor
+        """
+        if isinstance(items, dict):
+            items = items.items()
+        put = self.put
+        for key, value in items:
+            put(key, value)
+
+    def _over_budget(self, incoming_size: int) -> bool:
+        """Verifica se admitir incoming_size bytes excederia o orçamento"""
+        return self.max_bytes is not None and self.current_bytes + incoming_size > self.max_bytes
+
+    def _evict_one(self, protect: int = None) -> bool:
+        """
+        Remove o item mais antigo (FIFO)
+
+        Args:
+            protect (int, optional): Chave que não pode ser removida
+
+        Returns:
+            bool: True se algum item foi removido
+        """
+        for oldest_key in self.cache:
+            if oldest_key != protect:
+                self._evict_key(oldest_key)
+                return True
+        return False
+
+    def _evict_key(self, key: int) -> None:
+        """Remove uma chave por capacidade e notifica on_evict"""
+        value = self.cache[key]
+        self._remove_entry(key)
+        if self.on_evict is not None:
+            self.on_evict(key, value)
+
+    def _remove_entry(self, key: int) -> None:
+        """Remove uma chave de todas as estruturas internas"""
+        del self.cache[key]
+        self.insertion_order.pop(key, None)
+        self.current_bytes -= self.entry_sizes.pop(key, 0)
+
+    def remove(self, key: int) -> bool:
+        """
+        Remove uma chave do cache (sem notificar on_evict)
+
+        Args:
+            key (int): Chave a remover
+
+        Returns:
+            bool: True se a chave estava no cache
+        """
+        if key not in self.cache:
+            return False
+        self._remove_entry(key)
+        return True
 
     def clear(self) -> None:
         """Limpa todo o cache"""
         self.cache.clear()
         self.insertion_order.clear()
-        self.order_counter = 0
+        self.entry_sizes.clear()
+        self.current_bytes = 0
 
     def size(self) -> int:
         """Retorna o tamanho atual do cache"""
@@ -105,7 +213,9 @@ class FIFOCache:
             'hits': self.hit_count,
             'misses': self.miss_count,
             'hit_rate': hit_rate,
-            'keys_in_cache': list(self.cache.keys())
+            'keys_in_cache': list(self.cache.keys()),
+            'max_bytes': self.max_bytes,
+            'bytes_used': self.current_bytes
         }
 
     def reset_stats(self) -> None:
@@ -146,6 +256,11 @@ class FIFOCache:
             return next(iter(self.cache))
         return None
 
+    def spawn(self, capacity: int, max_bytes: Optional[int] = None) -> 'FIFOCache':
+        """Cria uma cópia vazia (mesmo tipo de relógio) com outra capacidade"""
+        clock = self.clock if isinstance(self.clock, WallClock) else LogicalClock()
+        return FIFOCache(capacity, max_bytes=max_bytes, sizer=self.sizer, clock=clock)
+
     def __str__(self) -> str:
         """Representação string do cache"""
         return f"FIFOCache(capacity={self.capacity}, size={len(self.cache)}, hit_rate={self.get_stats()['hit_rate']:.1f}%)"
@@ -3,8 +3,37 @@ Implementação do algoritmo LFU (Least Frequently Used) - Aluno D
 Cache que remove o item menos frequentemente usado quando atinge capacidade máxima
 """
 
-from collections import defaultdict, OrderedDict
-import time
+from typing import Any, Callable, Optional
+
+from algorithms.cache_utils import NodeMapping, default_sizer
+
+
+class _LFUNode:
+    """Item do cache, encadeado dentro do balde da sua frequência"""
+
+    __slots__ = ('key', 'value', 'bucket', 'prev', 'next')
+
+    def __init__(self, key: int, value: Any):
+        self.key = key
+        self.value = value
+        self.bucket = None
+        self.prev = None
+        self.next = None
+
+
+class _FrequencyBucket:
+    """Balde de uma frequência: lista dos itens do menos ao mais recente"""
+
+    __slots__ = ('freq', 'head', 'tail', 'count', 'prev', 'next')
+
+    def __init__(self, freq: int):
+        self.freq = freq
+        self.head = None
+        self.tail = None
+        self.count = 0
+        self.prev = self
+        self.next = self
+
 
 class LFUCache:
     """
@@ -12,47 +41,125 @@ class LFUCache:
 
     O LFU remove o item com menor frequência de uso quando o cache está cheio.
     Em caso de empate, remove o menos recentemente usado (LRU como desempate).
+
+    Os baldes de frequência formam uma lista duplamente encadeada em ordem
+    crescente e cada balde encadeia seus itens por recência, então hits,
+    inserções e remoções custam O(1). Baldes vazios saem da lista na hora.
+
+    Com decay_interval definido, a cada decay_interval acessos todas as
+    frequências são multiplicadas por decay_factor (mínimo 1), para que a
+    popularidade antiga perca peso quando o conjunto quente muda.
     """
 
-    def __init__(self, capacity: int):
+    def __init__(self, capacity: int, max_bytes: Optional[int] = None,
+                 sizer: Optional[Callable[[Any], int]] = None,
+                 decay_interval: Optional[int] = None, decay_factor: float = 0.5):
         """
         Inicializa o cache LFU
 
         Args:
-            capacity (int): Capacidade máxima do cache
+            capacity (int): Capacidade máxima do cache (número de itens)
+            max_bytes (int, optional): Orçamento máximo em bytes (None = sem limite)
+            sizer (callable, optional): Função que mede o tamanho de um valor em bytes
+            decay_interval (int, optional): Acessos entre envelhecimentos (None = sem envelhecimento)
+            decay_factor (float): Fator aplicado às frequências a cada envelhecimento
         """
+        if decay_interval is not None and decay_interval <= 0:
+            raise ValueError("decay_interval deve ser positivo")
+        if not 0 < decay_factor < 1:
+            raise ValueError("decay_factor deve estar entre 0 e 1")
+
         self.capacity = capacity
-        self.cache = {}  # key -> value
-        self.frequencies = defaultdict(int)  # key -> frequency count
-        self.freq_to_keys = defaultdict(OrderedDict)  # frequency -> {key: access_time}
-        self.min_frequency = 0
+        self.nodes = {}  # key -> _LFUNode
+        self.cache = NodeMapping(self.nodes)
+        self._root = _FrequencyBucket(0)  # Sentinela: root.next é o balde de menor frequência
         self.access_count = 0
         self.hit_count = 0
         self.miss_count = 0
-        self.access_times = {}
 
-    def _update_freq(self, key: int) -> None:
+        # Envelhecimento das frequências
+        self.decay_interval = decay_interval
+        self.decay_factor = decay_factor
+        self.decay_count = 0
+        self._accesses_since_decay = 0
+
+        # Orçamento em bytes
+        self.max_bytes = max_bytes
+        self.sizer = sizer or default_sizer
+        self.entry_sizes = {}
+        self.current_bytes = 0
+
+        # Callback opcional chamado com (chave, valor) a cada remoção por capacidade
+        self.on_evict = None
+
+    @property
+    def min_frequency(self) -> int:
+        """Menor frequência entre os itens do cache (0 se vazio)"""
+        return self._root.next.freq
+
+    def _insert_bucket_after(self, bucket: _FrequencyBucket, freq: int) -> _FrequencyBucket:
         """
-        Atualiza a frequência de uso de uma chave
+        Retorna o balde de frequência freq logo após bucket, criando-o se preciso
 
         Args:
-            key (int): Chave a atualizar
+            bucket: Balde anterior na lista
+            freq (int): Frequência desejada
+
+        Returns:
+            _FrequencyBucket: Balde da frequência
         """
-        current_time = time.time()
-        freq = self.frequencies[key]
+        following = bucket.next
+        if following is not self._root and following.freq == freq:
+            return following
+
+        new_bucket = _FrequencyBucket(freq)
+        new_bucket.prev = bucket
+        new_bucket.next = following
+        bucket.next = new_bucket
+        following.prev = new_bucket
+        return new_bucket
+
+    def _append(self, bucket: _FrequencyBucket, node: _LFUNode) -> None:
+        """Coloca o nó no final (mais recente) do balde"""
+        node.bucket = bucket
+        node.prev = bucket.tail
+        node.next = None
+        if bucket.tail is None:
+            bucket.head = node
+        else:
+            bucket.tail.next = node
+        bucket.tail = node
+        bucket.count += 1
+
+    def _unlink(self, node: _LFUNode) -> None:
+        """Retira o nó do seu balde, descartando o balde se ele esvaziar"""
+        bucket = node.bucket
+        if node.prev is None:
+            bucket.head = node.next
+        else:
+            node.prev.next = node.next
+        if node.next is None:
+            bucket.tail = node.prev
+        else:
+            node.next.prev = node.prev
+        node.prev = node.next = node.bucket = None
+        bucket.count -= 1
 
-        # Remover da frequência atual
-        del self.freq_to_keys[freq][key]
+        if bucket.count == 0:
+            bucket.prev.next = bucket.next
+            bucket.next.prev = bucket.prev
 
-        # Se era a única chave com frequência mínima, atualizar min_frequency
-        if freq == self.min_frequency and not self.freq_to_keys[freq]:
-            self.min_frequency += 1
+    def _update_freq(self, node: _LFUNode) -> None:
+        """
+        Incrementa a frequência de uso de um item
 
-        # Adicionar na nova frequência
-        new_freq = freq + 1
-        self.frequencies[key] = new_freq
-        self.freq_to_keys[new_freq][key] = current_time
-        self.access_times[key] = current_time
+        Args:
+            node (_LFUNode): Nó do item
+        """
+        bucket = node.bucket
+        target = self._insert_bucket_after(bucket, bucket.freq + 1)
+        self._unlink(node)
+        self._append(target, node)
 
     def get(self, key: int) -> str:
         """
@@ -65,15 +172,19 @@ class LFUCache:
             str: Valor do item ou None se não encontrado
         """
         self.access_count += 1
-
-        if key in self.cache:
-            # Atualizar frequência
-            self._update_freq(key)
+        if self.decay_interval is not None:
+            self._accesses_since_decay += 1
+            if self._accesses_since_decay >= self.decay_interval:
+                self.age()
+
+        node = self.nodes.get(key)
+        if node is not None:
+            self._update_freq(node)
             self.hit_count += 1
-            return self.cache[key]
-        else:
-            self.miss_count += 1
-            return None
+            return node.value
+
+        self.miss_count += 1
+        return None
 
     def put(self, key: int, value: str) -> None:
         """
@@ -86,49 +197,175 @@ class LFUCache:
         if self.capacity <= 0:
             return
 
-        current_time = time.time()
+        size = self.sizer(value)
 
-        if key in self.cache:
-            # Atualizar valor existente
-            self.cache[key] = value
-            self._update_freq(key)
+        # Item maior que todo o orçamento não é admitido
+        if self.max_bytes is not None and size > self.max_bytes:
+            if key in self.nodes:
+                self._remove_entry(key)
             return
 
-        # Se cache está cheio, remover o LFU
-        if len(self.cache) >= self.capacity:
-            # Encontrar chave com menor frequência
-            # Em caso de empate, remove a menos recentemente usada
-            lfu_key = next(iter(self.freq_to_keys[self.min_frequency]))
+        node = self.nodes.get(key)
+        if node is not None:
+            # Atualizar valor existente
+            node.value = value
+            self._update_freq(node)
+            self.current_bytes += size - self.entry_sizes[key]
+            self.entry_sizes[key] = size
+            while self._over_budget(0) and self._evict_one(protect=key):
+                pass
+            return
 
-            # Remover da estrutura
-            del self.cache[lfu_key]
-            del self.frequencies[lfu_key]
-            del self.freq_to_keys[self.min_frequency][lfu_key]
-            if lfu_key in self.access_times:
-                del self.access_times[lfu_key]
+        # Se cache está cheio, remover os LFU
+        while self.nodes and (len(self.nodes) >= self.capacity or self._over_budget(size)):
+            self._evict_one()
 
         # Adicionar novo item com frequência 1
-        self.cache[key] = value
-        self.frequencies[key] = 1
-        self.freq_to_keys[1][key] = current_time
-        self.access_times[key] = current_time
-        self.min_frequency = 1
+        node = _LFUNode(key, value)
+        self._append(self._insert_bucket_after(self._root, 1), node)
+        self.nodes[key] = node
+        self.entry_sizes[key] = size
+        self.current_bytes += size
+
+    def get_many(self, keys) -> dict:
+        """
+        Recupera vários itens de uma vez, incrementando suas frequências
+
+        Args:
+            keys: Sequência de chaves (cada uma conta como um acesso)
+
+        Returns:
+            dict: Chave -> valor apenas dos itens encontrados
+        """
+        keys = list(keys)
+        found = {}
+        hits = 0
+        for key in keys:
+            if self.decay_interval is not None:
+                self._accesses_since_decay += 1
+                if self._accesses_since_decay >= self.decay_interval:
+                    self.age()
+            node = self.nodes.get(key)
+            if node is not None:
+                self._update_freq(node)
+                found[key] = node.value
+                hits += 1
+
+        self.access_count += len(keys)
+        self.hit_count += hits
+        self.miss_count += len(keys) - hits
+        return found
+
+    def put_many(self, items) -> None:
+        """
+        Adiciona vários itens ao cache, na ordem dada
+
+        Args:
+            items: Pares (chave, valor) ou dicionário chave -> valor
+        """
+        if isinstance(items, dict):
+            items = items.items()
+        put = self.put
+        for key, value in items:
+            put(key, value)
+
+    def age(self) -> None:
+        """
+        Envelhece todas as frequências multiplicando-as por decay_factor
+
+        A ordem relativa é preservada: os baldes são percorridos em ordem
+        crescente e os que passam a ter a mesma frequência são fundidos.
+        """
+        self._accesses_since_decay = 0
+        self.decay_count += 1
+
+        ordered = list(self._iter_nodes())
+        self._root.next = self._root.prev = self._root
+
+        bucket = self._root
+        for node in ordered:
+            freq = max(1, int(node.bucket.freq * self.decay_factor))
+            node.prev = node.next = None
+            if bucket is self._root or bucket.freq != freq:
+                bucket = self._insert_bucket_after(bucket, freq)
+            self._append(bucket, node)
+
+    def _iter_nodes(self):
+        """Percorre os nós da menor para a maior frequência (e por recência)"""
+        bucket = self._root.next
+        while bucket is not self._root:
+            node = bucket.head
+            while node is not None:
+                following = node.next
+                yield node
+                node = following
+            bucket = bucket.next
+
+    def _over_budget(self, incoming_size: int) -> bool:
+        """Verifica se admitir incoming_size bytes excederia o orçamento"""
+        return self.max_bytes is not None and self.current_bytes + incoming_size > self.max_bytes
+
+    def _evict_one(self, protect: int = None) -> bool:
+        """
+        Remove o item com menor frequência
+        Em caso de empate, remove o menos recentemente usado
+
+        Args:
+            protect (int, optional): Chave que não pode ser removida
+
+        Returns:
+            bool: True se algum item foi removido
+        """
+        for node in self._iter_nodes():
+            if node.key != protect:
+                self._evict_key(node.key)
+                return True
+        return False
+
+    def _evict_key(self, key: int) -> None:
+        """Remove uma chave por capacidade e notifica on_evict"""
+        value = self.nodes[key].value
+        self._remove_entry(key)
+        if self.on_evict is not None:
+            self.on_evict(key, value)
+
+    def _remove_entry(self, key: int) -> None:
+        """Remove uma chave de todas as estruturas internas"""
+        self._unlink(self.nodes.pop(key))
+        self.current_bytes -= self.entry_sizes.pop(key, 0)
+
+    def remove(self, key: int) -> bool:
+        """
+        Remove uma chave do cache (sem notificar on_evict)
+
+        Args:
+            key (int): Chave a remover
+
+        Returns:
+            bool: True se a chave estava no cache
+        """
+        if key not in self.nodes:
+            return False
+        self._remove_entry(key)
+        return True
 
     def clear(self) -> None:
         """Limpa todo o cache"""
-        self.cache.clear()
-        self.frequencies.clear()
-        self.freq_to_keys.clear()
-        self.access_times.clear()
-        self.min_frequency = 0
+        for node in list(self._iter_nodes()):
+            node.prev = node.next = node.bucket = None
+        self.nodes.clear()
+        self._root.next = self._root.prev = self._root
+        self._accesses_since_decay = 0
+        self.entry_sizes.clear()
+        self.current_bytes = 0
 
     def size(self) -> int:
         """Retorna o tamanho atual do cache"""
-        return len(self.cache)
+        return len(self.nodes)
 
     def is_full(self) -> bool:
         """Verifica se o cache está cheio"""
-        return len(self.cache) >= self.capacity
+        return len(self.nodes) >= self.capacity
 
     def get_stats(self) -> dict:
         """
@@ -139,24 +376,28 @@ class LFUCache:
         """
         hit_rate = (self.hit_count / self.access_count * 100) if self.access_count > 0 else 0
 
-        # Calcular estatísticas de frequência
+        # Distribuição de frequências direto dos baldes
         freq_distribution = {}
-        for key, freq in self.frequencies.items():
-            if freq not in freq_distribution:
-                freq_distribution[freq] = 0
-            freq_distribution[freq] += 1
+        bucket = self._root.next
+        while bucket is not self._root:
+            freq_distribution[bucket.freq] = bucket.count
+            bucket = bucket.next
 
         return {
             'algorithm': 'LFU',
             'capacity': self.capacity,
-            'current_size': len(self.cache),
+            'current_size': len(self.nodes),
             'total_accesses': self.access_count,
             'hits': self.hit_count,
             'misses': self.miss_count,
             'hit_rate': hit_rate,
-            'keys_in_cache': list(self.cache.keys()),
+            'keys_in_cache': list(self.nodes.keys()),
             'min_frequency': self.min_frequency,
-            'frequency_distribution': freq_distribution
+            'frequency_distribution': freq_distribution,
+            'max_bytes': self.max_bytes,
+            'bytes_used': self.current_bytes,
+            'decay_interval': self.decay_interval,
+            'decays': self.decay_count
         }
 
     def reset_stats(self) -> None:
@@ -175,7 +416,33 @@ class LFUCache:
         Returns:
             int: Frequência de uso
         """
-        return self.frequencies.get(key, 0)
+        node = self.nodes.get(key)
+        return node.bucket.freq if node is not None else 0
+
+    def set_frequency(self, key: int, frequency: int) -> bool:
+        """
+        Define a frequência de uma chave (ex.: ao restaurar um snapshot)
+
+        A chave passa a ser a mais recente do balde da nova frequência.
+
+        Args:
+            key (int): Chave a atualizar
+            frequency (int): Nova frequência (mínimo 1)
+
+        Returns:
+            bool: True se a chave estava no cache
+        """
+        node = self.nodes.get(key)
+        if node is None:
+            return False
+
+        frequency = max(1, int(frequency))
+        self._unlink(node)
+        bucket = self._root
+        while bucket.next is not self._root and bucket.next.freq < frequency:
+            bucket = bucket.next
+        self._append(self._insert_bucket_after(bucket, frequency), node)
+        return True
 
     def get_keys_by_frequency(self) -> dict:
         """
@@ -185,9 +452,8 @@ class LFUCache:
             dict: Frequência -> lista de chaves
         """
         result = {}
-        for freq, keys_dict in self.freq_to_keys.items():
-            if keys_dict:  # Apenas frequências com chaves
-                result[freq] = list(keys_dict.keys())
+        for node in self._iter_nodes():
+            result.setdefault(node.bucket.freq, []).append(node.key)
         return result
 
     def peek_lfu(self) -> int:
@@ -197,9 +463,8 @@ class LFUCache:
         Returns:
             int: Chave LFU ou None se cache vazio
         """
-        if self.freq_to_keys[self.min_frequency]:
-            return next(iter(self.freq_to_keys[self.min_frequency]))
-        return None
+        head = self._root.next.head
+        return head.key if head is not None else None
 
     def contains(self, key: int) -> bool:
         """
@@ -211,11 +476,40 @@ class LFUCache:
         Returns:
             bool: True se a chave está no cache
         """
-        return key in self.cache
+        return key in self.nodes
+
+    def spawn(self, capacity: int, max_bytes: Optional[int] = None) -> 'LFUCache':
+        """Cria uma cópia vazia (mesmo envelhecimento) com outra capacidade"""
+        return LFUCache(capacity, max_bytes=max_bytes, sizer=self.sizer,
+                        decay_interval=self.decay_interval, decay_factor=self.decay_factor)
+
+    def __getstate__(self) -> dict:
+        """Serializa os itens como lista plana (evita recursão nas listas encadeadas)"""
+        state = self.__dict__.copy()
+        state['_root'] = None
+        state['nodes'] = [(node.key, node.value, node.bucket.freq) for node in self._iter_nodes()]
+        del state['cache']
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Reconstrói baldes e nós a partir da lista serializada"""
+        entries = state.pop('nodes')
+        self.__dict__.update(state)
+        self.nodes = {}
+        self.cache = NodeMapping(self.nodes)
+        self._root = _FrequencyBucket(0)
+
+        bucket = self._root
+        for key, value, freq in entries:
+            if bucket is self._root or bucket.freq != freq:
+                bucket = self._insert_bucket_after(bucket, freq)
+            node = _LFUNode(key, value)
+            self._append(bucket, node)
+            self.nodes[key] = node
 
     def __str__(self) -> str:
         """Representação string do cache"""
-        return f"LFUCache(capacity={self.capacity}, size={len(self.cache)}, hit_rate={self.get_stats()['hit_rate']:.1f}%)"
+        return f"LFUCache(capacity={self.capacity}, size={len(self.nodes)}, hit_rate={self.get_stats()['hit_rate']:.1f}%)"
 
     def __repr__(self) -> str:
         return self.__str__()
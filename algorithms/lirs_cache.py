@@ -0,0 +1,301 @@
+"""
+Implementação do algoritmo LIRS (Low Inter-reference Recency Set)
+Cache resistente a varreduras que classifica os itens pela distância entre
+reutilizações, e não apenas pelo último acesso
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+from algorithms.cache_utils import default_sizer
+
+class LIRSCache:
+    """
+    Implementação do algoritmo de cache LIRS (Jiang & Zhang)
+
+    Itens LIR (reutilizados em intervalos curtos) ocupam quase todo o cache e
+    nunca são removidos diretamente; os itens HIR residentes ficam em uma fila
+    pequena (Q) e são as vítimas. A pilha S guarda a recência de LIRs e HIRs,
+    inclusive HIRs não residentes: um HIR reacessado enquanto ainda está em S
+    tem distância de reutilização menor que o LIR mais antigo e troca de lugar
+    com ele. Uma varredura só circula pela fila Q.
+    """
+
+    def __init__(self, capacity: int, max_bytes: Optional[int] = None,
+                 sizer: Optional[Callable[[Any], int]] = None,
+                 hir_ratio: float = 0.01, history_ratio: float = 3.0):
+        """
+        Inicializa o cache LIRS
+
+        Args:
+            capacity (int): Capacidade máxima do cache (número de itens)
+            max_bytes (int, optional): Orçamento máximo em bytes (None = sem limite)
+            sizer (callable, optional): Função que mede o tamanho de um valor em bytes
+            hir_ratio (float): Fração da capacidade para HIRs residentes
+            history_ratio (float): Tamanho máximo da pilha S em relação à capacidade
+        """
+        self.capacity = capacity
+        self.hir_ratio = hir_ratio
+        self.history_ratio = history_ratio
+        hir_capacity = max(1, int(capacity * hir_ratio)) if capacity > 1 else 0
+        self.lir_capacity = max(1, capacity - hir_capacity)
+        self.max_stack_size = max(capacity, int(capacity * history_ratio))
+
+        self.cache = {}  # key -> value (itens residentes)
+        self.stack = OrderedDict()  # Pilha S (base = mais antigo primeiro)
+        self.queue = OrderedDict()  # Fila Q dos HIRs residentes (vítima primeiro)
+        self.lir_keys = set()
+        self.access_count = 0
+        self.hit_count = 0
+        self.miss_count = 0
+
+        # Orçamento em bytes
+        self.max_bytes = max_bytes
+        self.sizer = sizer or default_sizer
+        self.entry_sizes = {}
+        self.current_bytes = 0
+
+        # Callback opcional chamado com (chave, valor) a cada remoção por capacidade
+        self.on_evict = None
+
+    def get(self, key: int) -> str:
+        """
+        Recupera um item do cache atualizando seu status LIR/HIR
+
+        Args:
+            key (int): Chave do item
+
+        Returns:
+            str: Valor do item ou None se não encontrado
+        """
+        self.access_count += 1
+
+        if key in self.lir_keys:
+            self.stack.move_to_end(key)
+            self._prune()
+        elif key in self.queue:
+            if key in self.stack:
+                # Reutilização curta: torna-se LIR e o LIR mais antigo vira HIR
+                self._push(key)
+                del self.queue[key]
+                self.lir_keys.add(key)
+                self._demote_bottom_lir()
+            else:
+                self._push(key)
+                self.queue.move_to_end(key)
+        else:
+            self.miss_count += 1
+            return None
+
+        self.hit_count += 1
+        return self.cache[key]
+
+    def put(self, key: int, value: str) -> None:
+        """
+        Adiciona um item ao cache
+
+        Args:
+            key (int): Chave do item
+            value (str): Valor do item
+        """
+        size = self.sizer(value)
+
+        # Item maior que todo o orçamento não é admitido
+        if self.max_bytes is not None and size > self.max_bytes:
+            if key in self.cache:
+                self._remove_entry(key)
+            return
+
+        if key in self.cache:
+            self.cache[key] = value
+            self.current_bytes += size - self.entry_sizes[key]
+            self.entry_sizes[key] = size
+            while self._over_budget(0) and self._evict_one(protect=key):
+                pass
+            return
+
+        while self.cache and (len(self.cache) >= self.capacity or self._over_budget(size)):
+            self._evict_one()
+
+        if len(self.lir_keys) < self.lir_capacity:
+            # Aquecimento: os primeiros itens preenchem o conjunto LIR
+            self._push(key)
+            self.lir_keys.add(key)
+        elif key in self.stack:
+            # HIR não residente ainda na pilha: reutilização curta
+            self._push(key)
+            self.lir_keys.add(key)
+            self._demote_bottom_lir()
+        else:
+            self._push(key)
+            self.queue[key] = None
+
+        self.cache[key] = value
+        self.entry_sizes[key] = size
+        self.current_bytes += size
+        self._limit_stack()
+
+    def _push(self, key: int) -> None:
+        """Coloca a chave no topo da pilha S"""
+        self.stack.pop(key, None)
+        self.stack[key] = None
+
+    def _prune(self) -> None:
+        """Remove da base da pilha tudo que não for LIR"""
+        while self.stack and next(iter(self.stack)) not in self.lir_keys:
+            self.stack.popitem(last=False)
+
+    def _demote_bottom_lir(self) -> None:
+        """Transforma o LIR da base da pilha em HIR residente"""
+        self._prune()
+        if len(self.lir_keys) <= self.lir_capacity or not self.stack:
+            return
+        bottom, _ = self.stack.popitem(last=False)
+        self.lir_keys.discard(bottom)
+        self.queue[bottom] = None
+        self._prune()
+
+    def _limit_stack(self) -> None:
+        """Descarta os HIRs não residentes mais antigos se a pilha crescer demais"""
+        while len(self.stack) > self.max_stack_size:
+            oldest = next((k for k in self.stack if k not in self.cache), None)
+            if oldest is None:
+                break
+            del self.stack[oldest]
+
+    def _over_budget(self, incoming_size: int) -> bool:
+        """Verifica se admitir incoming_size bytes excederia o orçamento"""
+        return self.max_bytes is not None and self.current_bytes + incoming_size > self.max_bytes
+
+    def _evict_one(self, protect: int = None) -> bool:
+        """
+        Remove o primeiro HIR residente da fila; sem HIRs, o LIR mais antigo
+
+        Args:
+            protect (int, optional): Chave que não pode ser removida
+
+        Returns:
+            bool: True se algum item foi removido
+        """
+        for candidate in self.queue:
+            if candidate != protect:
+                self._evict_key(candidate)
+                return True
+
+        for candidate in self.stack:
+            if candidate in self.lir_keys and candidate != protect:
+                self._evict_key(candidate)
+                return True
+        return False
+
+    def _evict_key(self, key: int) -> None:
+        """Remove uma chave por capacidade e notifica on_evict"""
+        value = self.cache[key]
+        self._remove_entry(key, keep_history=True)
+        if self.on_evict is not None:
+            self.on_evict(key, value)
+
+    def _remove_entry(self, key: int, keep_history: bool = False) -> None:
+        """
+        Remove uma chave residente de todas as estruturas internas
+
+        Args:
+            key (int): Chave a remover
+            keep_history (bool): Manter um HIR removido na pilha como não residente
+        """
+        del self.cache[key]
+        self.queue.pop(key, None)
+        if key in self.lir_keys:
+            self.lir_keys.discard(key)
+            self.stack.pop(key, None)
+            self._prune()
+        elif not keep_history:
+            self.stack.pop(key, None)
+        self.current_bytes -= self.entry_sizes.pop(key, 0)
+
+    def remove(self, key: int) -> bool:
+        """
+        Remove uma chave do cache (sem notificar on_evict)
+
+        Args:
+            key (int): Chave a remover
+
+        Returns:
+            bool: True se a chave estava no cache
+        """
+        if key not in self.cache:
+            return False
+        self._remove_entry(key)
+        return True
+
+    def clear(self) -> None:
+        """Limpa todo o cache, incluindo o histórico da pilha"""
+        self.cache.clear()
+        self.stack.clear()
+        self.queue.clear()
+        self.lir_keys.clear()
+        self.entry_sizes.clear()
+        self.current_bytes = 0
+
+    def size(self) -> int:
+        """Retorna o tamanho atual do cache"""
+        return len(self.cache)
+
+    def is_full(self) -> bool:
+        """Verifica se o cache está cheio"""
+        return len(self.cache) >= self.capacity
+
+    def get_stats(self) -> dict:
+        """
+        Retorna estatísticas do cache
+
+        Returns:
+            dict: Estatísticas detalhadas
+        """
+        hit_rate = (self.hit_count / self.access_count * 100) if self.access_count > 0 else 0
+
+        return {
+            'algorithm': 'LIRS',
+            'capacity': self.capacity,
+            'current_size': len(self.cache),
+            'total_accesses': self.access_count,
+            'hits': self.hit_count,
+            'misses': self.miss_count,
+            'hit_rate': hit_rate,
+            'keys_in_cache': list(self.cache.keys()),
+            'max_bytes': self.max_bytes,
+            'bytes_used': self.current_bytes,
+            'lir_size': len(self.lir_keys),
+            'hir_resident_size': len(self.queue),
+            'stack_size': len(self.stack)
+        }
+
+    def reset_stats(self) -> None:
+        """Reinicia as estatísticas sem limpar o cache"""
+        self.access_count = 0
+        self.hit_count = 0
+        self.miss_count = 0
+
+    def contains(self, key: int) -> bool:
+        """
+        Verifica se uma chave está no cache
+
+        Args:
+            key (int): Chave a verificar
+
+        Returns:
+            bool: True se a chave está no cache
+        """
+        return key in self.cache
+
+    def spawn(self, capacity: int, max_bytes: Optional[int] = None) -> 'LIRSCache':
+        """Cria uma cópia vazia (mesmas proporções) com outra capacidade"""
+        return LIRSCache(capacity, max_bytes=max_bytes, sizer=self.sizer,
+                         hir_ratio=self.hir_ratio, history_ratio=self.history_ratio)
+
+    def __str__(self) -> str:
+        """Representação string do cache"""
+        return f"LIRSCache(capacity={self.capacity}, size={len(self.cache)}, hit_rate={self.get_stats()['hit_rate']:.1f}%)"
+
+    def __repr__(self) -> str:
+        return self.__str__()
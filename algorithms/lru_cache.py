@@ -4,29 +4,49 @@ Cache que remove o item menos recentemente usado quando atinge capacidade máxim
 """
 
 from collections import OrderedDict
-import time
+from typing import Any, Callable, Optional
+
+from algorithms.cache_utils import default_sizer
+from algorithms.timing import Clock, LogicalClock, WallClock
 
 class LRUCache:
     """
     Implementação do algoritmo de cache LRU (Least Recently Used)
 
     O LRU remove o item que foi acessado há mais tempo quando o cache está cheio.
-    Utiliza OrderedDict para manter eficiência O(1) nas operações.
+    Utiliza OrderedDict para manter eficiência O(1) nas operações. Os
+    instantes de acesso vêm do relógio injetado (lógico por padrão, sem
+    chamadas ao sistema a cada acesso).
     """
 
-    def __init__(self, capacity: int):
+    def __init__(self, capacity: int, max_bytes: Optional[int] = None,
+                 sizer: Optional[Callable[[Any], int]] = None,
+                 clock: Optional[Clock] = None):
         """
         Inicializa o cache LRU
 
         Args:
-            capacity (int): Capacidade máxima do cache
+            capacity (int): Capacidade máxima do cache (número de itens)
+            max_bytes (int, optional): Orçamento máximo em bytes (None = sem limite)
+            sizer (callable, optional): Função que mede o tamanho de um valor em bytes
+            clock (optional): Relógio dos acessos (None = LogicalClock)
         """
         self.capacity = capacity
         self.cache = OrderedDict()
         self.access_count = 0
         self.hit_count = 0
         self.miss_count = 0
-        self.access_times = {}  # Rastrear tempos de acesso
+        self.clock = clock or LogicalClock()
+        self.access_times = {}  # Rastrear instantes de acesso (segundo o relógio)
+
+        # Orçamento em bytes
+        self.max_bytes = max_bytes
+        self.sizer = sizer or default_sizer
+        self.entry_sizes = {}
+        self.current_bytes = 0
+
+        # Callback opcional chamado com (chave, valor) a cada remoção por capacidade
+        self.on_evict = None
 
     def get(self, key: int) -> str:
         """
@@ -39,15 +59,13 @@ class LRUCache:
             str: Valor do item ou None se não encontrado
         """
         self.access_count += 1
-        current_time = time.time()
 
         if key in self.cache:
             # Mover para o final (mais recente)
-            value = self.cache.pop(key)
-            self.cache[key] = value
-            self.access_times[key] = current_time
+            self.cache.move_to_end(key)
+            self.access_times[key] = self.clock.now()
             self.hit_count += 1
-            return value
+            return self.cache[key]
         else:
             self.miss_count += 1
             return None
@@ -60,31 +78,130 @@ class LRUCache:
             key (int): Chave do item
             value (str): Valor do item
         """
-        current_time = time.time()
+        size = self.sizer(value)
+
+        # Item maior que todo o orçamento não é admitido
+        if self.max_bytes is not None and size > self.max_bytes:
+            if key in self.cache:
+                self._remove_entry(key)
+            return
 
         if key in self.cache:
             # Atualizar valor e mover para o final
-            self.cache.pop(key)
             self.cache[key] = value
-            self.access_times[key] = current_time
+            self.cache.move_to_end(key)
+            self.access_times[key] = self.clock.now()
+            self.current_bytes += size - self.entry_sizes[key]
+            self.entry_sizes[key] = size
+            while self._over_budget(0) and self._evict_one(protect=key):
+                pass
             return
 
-        # Se cache está cheio, remover o LRU (primeiro item)
-        if len(self.cache) >= self.capacity:
-            # Remove o item menos recentemente usado
-            lru_key = next(iter(self.cache))
-            del self.cache[lru_key]
-            if lru_key in self.access_times:
-                del self.access_times[lru_key]
+        # Se cache está cheio, remover os LRU (primeiros itens)
+        while self.cache and (len(self.cache) >= self.capacity or self._over_budget(size)):
+            self._evict_one()
 
         # Adicionar novo item (sempre no final = mais recente)
         self.cache[key] = value
-        self.access_times[key] = current_time
+        self.access_times[key] = self.clock.now()
+        self.entry_sizes[key] = size
+        self.current_bytes += size
+
+    def get_many(self, keys) -> dict:
+        """
+        Recupera vários itens de uma vez, marcando-os como recentemente usados
+
+        Args:
+            keys: Sequência de chaves (cada uma conta como um acesso)
+
+        Returns:
+            dict: Chave -> valor apenas dos itens encontrados
+        """
+        keys = list(keys)
+        cache = self.cache
+        access_times = self.access_times
+        now = self.clock.now
+        found = {}
+        hits = 0
+        for key in keys:
+            if key in cache:
+                cache.move_to_end(key)
+                access_times[key] = now()
+                found[key] = cache[key]
+                hits += 1
+
+        self.access_count += len(keys)
+        self.hit_count += hits
+        self.miss_count += len(keys) - hits
+        return found
+
+    def put_many(self, items) -> None:
+        """
+        Adiciona vários itens ao cache, na ordem dada
+
+        Args:
+            items: Pares (chave, valor) ou dicionário chave -> valor
+        """
+        if isinstance(items, dict):
+            items = items.items()
+        put = self.put
+        for key, value in items:
+            put(key, value)
+
+    def _over_budget(self, incoming_size: int) -> bool:
+        """Verifica se admitir incoming_size bytes excederia o orçamento"""
+        return self.max_bytes is not None and self.current_bytes + incoming_size > self.max_bytes
+
+    def _evict_one(self, protect: int = None) -> bool:
+        """
+        Remove o item menos recentemente usado
+
+        Args:
+            protect (int, optional): Chave que não pode ser removida
+
+        Returns:
+            bool: True se algum item foi removido
+        """
+        for lru_key in self.cache:
+            if lru_key != protect:
+                self._evict_key(lru_key)
+                return True
+        return False
+
+    def _evict_key(self, key: int) -> None:
+        """Remove uma chave por capacidade e notifica on_evict"""
+        value = self.cache[key]
+        self._remove_entry(key)
+        if self.on_evict is not None:
+            self.on_evict(key, value)
+
+    def _remove_entry(self, key: int) -> None:
+        """Remove uma chave de todas as estruturas internas"""
+        del self.cache[key]
+        self.access_times.pop(key, None)
+        self.current_bytes -= self.entry_sizes.pop(key, 0)
+
+    def remove(self, key: int) -> bool:
+        """
+        Remove uma chave do cache (sem notificar on_evict)
+
+        Args:
+            key (int): Chave a remover
+
+        Returns:
+            bool: True se a chave estava no cache
+        """
+        if key not in self.cache:
+            return False
+        self._remove_entry(key)
+        return True
 
     def clear(self) -> None:
         """Limpa todo o cache"""
         self.cache.clear()
         self.access_times.clear()
+        self.entry_sizes.clear()
+        self.current_bytes = 0
 
     def size(self) -> int:
         """Retorna o tamanho atual do cache"""
@@ -111,7 +228,9 @@ class LRUCache:
             'hits': self.hit_count,
             'misses': self.miss_count,
             'hit_rate': hit_rate,
-            'keys_in_cache': list(self.cache.keys())
+            'keys_in_cache': list(self.cache.keys()),
+            'max_bytes': self.max_bytes,
+            'bytes_used': self.current_bytes
         }
 
     def reset_stats(self) -> None:
@@ -154,16 +273,21 @@ class LRUCache:
 
     def get_access_time(self, key: int) -> float:
         """
-        Retorna o tempo do último acesso de uma chave
+        Retorna o instante do último acesso de uma chave
 
         Args:
             key (int): Chave a consultar
 
         Returns:
-            float: Timestamp do último acesso ou None
+            float: Instante do último acesso (tick lógico ou timestamp, conforme o relógio) ou None
         """
         return self.access_times.get(key)
 
+    def spawn(self, capacity: int, max_bytes: Optional[int] = None) -> 'LRUCache':
+        """Cria uma cópia vazia (mesmo tipo de relógio) com outra capacidade"""
+        clock = self.clock if isinstance(self.clock, WallClock) else LogicalClock()
+        return LRUCache(capacity, max_bytes=max_bytes, sizer=self.sizer, clock=clock)
+
     def __str__(self) -> str:
         """Representação string do cache"""
         return f"LRUCache(capacity={self.capacity}, size={len(self.cache)}, hit_rate={self.get_stats()['hit_rate']:.1f}%)"
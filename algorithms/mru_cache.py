@@ -4,7 +4,9 @@ Cache que remove o item mais recentemente usado quando atinge capacidade máxima
 """
 
 from collections import OrderedDict
-import time
+from typing import Any, Callable, Optional
+
+from algorithms.cache_utils import default_sizer
 
 class MRUCache:
     """
@@ -15,12 +17,15 @@ class MRUCache:
     é provável que não seja necessário em breve.
     """
 
-    def __init__(self, capacity: int):
+    def __init__(self, capacity: int, max_bytes: Optional[int] = None,
+                 sizer: Optional[Callable[[Any], int]] = None):
         """
         Inicializa o cache MRU
 
         Args:
-            capacity (int): Capacidade máxima do cache
+            capacity (int): Capacidade máxima do cache (número de itens)
+            max_bytes (int, optional): Orçamento máximo em bytes (None = sem limite)
+            sizer (callable, optional): Função que mede o tamanho de um valor em bytes
         """
         self.capacity = capacity
         self.cache = OrderedDict()
@@ -28,6 +33,15 @@ class MRUCache:
         self.hit_count = 0
         self.miss_count = 0
 
+        # Orçamento em bytes
+        self.max_bytes = max_bytes
+        self.sizer = sizer or default_sizer
+        self.entry_sizes = {}
+        self.current_bytes = 0
+
+        # Callback opcional chamado com (chave, valor) a cada remoção por capacidade
+        self.on_evict = None
+
     def get(self, key: int) -> str:
         """
         Recupera um item do cache e o marca como o mais recentemente usado.
@@ -56,25 +70,115 @@ class MRUCache:
         Se a chave já existe, seu valor é atualizado e ela é movida
         para o final (mais recentemente usada).
 
-        Se a chave não existe e o cache está cheio, o item mais
-        recentemente usado (o último) é removido antes da inserção.
+        Se a chave não existe e o cache está cheio (em itens ou bytes), os
+        itens mais recentemente usados (os últimos) são removidos antes da
+        inserção.
 
         Args:
             key (int): Chave do item
             value (str): Valor do item
         """
+        size = self.sizer(value)
+
+        # Item maior que todo o orçamento não é admitido
+        if self.max_bytes is not None and size > self.max_bytes:
+            if key in self.cache:
+                self._remove_entry(key)
+            return
+
         if key in self.cache:
             # Se a chave existe, mova para o final
-            self.cache.pop(key)
-        elif len(self.cache) >= self.capacity:
-            # Se o cache está cheio, remove o mais recentemente usado (o último)
-            self.cache.popitem(last=True)
+            self._remove_entry(key)
+            while self.cache and self._over_budget(size):
+                self._evict_one()
+        else:
+            # Se o cache está cheio, remove os mais recentemente usados (os últimos)
+            while self.cache and (len(self.cache) >= self.capacity or self._over_budget(size)):
+                self._evict_one()
 
         self.cache[key] = value
+        self.entry_sizes[key] = size
+        self.current_bytes += size
+
+    def get_many(self, keys) -> dict:
+        """
+        Recupera vários itens de uma vez, marcando-os como recentemente usados
+
+        Args:
+            keys: Sequência de chaves (cada uma conta como um acesso)
+
+        Returns:
+            dict: Chave -> valor apenas dos itens encontrados
+        """
+        keys = list(keys)
+        cache = self.cache
+        found = {}
+        hits = 0
+        for key in keys:
+            if key in cache:
+                cache.move_to_end(key)
+                found[key] = cache[key]
+                hits += 1
+
+        self.access_count += len(keys)
+        self.hit_count += hits
+        self.miss_count += len(keys) - hits
+        return found
+
+    def put_many(self, items) -> None:
+        """
+        Adiciona vários itens ao cache, na ordem dada
+
+        Args:
+            items: Pares (chave, valor) ou dicionário chave -> valor
+        """
+        if isinstance(items, dict):
+            items = items.items()
+        put = self.put
+        for key, value in items:
+            put(key, value)
+
+    def _over_budget(self, incoming_size: int) -> bool:
+        """Verifica se admitir incoming_size bytes excederia o orçamento."""
+        return self.max_bytes is not None and self.current_bytes + incoming_size > self.max_bytes
+
+    def _evict_one(self) -> None:
+        """Remove o item mais recentemente usado (o último)."""
+        mru_key = next(reversed(self.cache))
+        self._evict_key(mru_key)
+
+    def _evict_key(self, key: int) -> None:
+        """Remove uma chave por capacidade e notifica on_evict."""
+        value = self.cache[key]
+        self._remove_entry(key)
+        if self.on_evict is not None:
+            self.on_evict(key, value)
+
+    def _remove_entry(self, key: int) -> None:
+        """Remove uma chave de todas as estruturas internas."""
+        del self.cache[key]
+        self.current_bytes -= self.entry_sizes.pop(key, 0)
+
+    def remove(self, key: int) -> bool:
+        """
+        Remove uma chave do cache (sem notificar on_evict).
+
+        Args:
+            key (int): Chave a remover
+
+        Returns:
+            bool: True se a chave estava no cache
+        """
+        if key not in self.cache:
+            return False
+        self._remove_entry(key)
+        return True
 
     def clear(self) -> None:
         """Limpa todo o cache."""
         self.cache.clear()
+        self.entry_sizes.clear()
+        self.current_bytes = 0
         self.access_count = 0
         self.hit_count = 0
         self.miss_count = 0
@@ -87,6 +191,18 @@ class MRUCache:
         """Verifica se o cache está cheio."""
         return len(self.cache) >= self.capacity
 
+    def contains(self, key: int) -> bool:
+        """
+        Verifica se uma chave está no cache
+
+        Args:
+            key (int): Chave a verificar
+
+        Returns:
+            bool: True se a chave está no cache
+        """
+        return key in self.cache
+
     def get_stats(self) -> dict:
         """
         Retorna estatísticas de desempenho do cache.
@@ -103,7 +219,9 @@ class MRUCache:
             'hits': self.hit_count,
             'misses': self.miss_count,
             'hit_rate': hit_rate,
-            'keys_in_cache': list(self.cache.keys())
+            'keys_in_cache': list(self.cache.keys()),
+            'max_bytes': self.max_bytes,
+            'bytes_used': self.current_bytes
         }
 
     def reset_stats(self) -> None:
@@ -0,0 +1,307 @@
+"""
+Implementação do algoritmo ótimo de Belady (OPT/MIN)
+Política offline: conhece o trace completo e remove o item cujo próximo uso
+está mais distante no futuro. Serve como limite superior de hit rate para
+as demais políticas
+"""
+
+import heapq
+from array import array
+from typing import Any, Callable, Iterable, Optional, Sequence
+
+from algorithms.cache_utils import default_sizer
+
+# Próximo uso de uma chave que não volta a ser requisitada
+NEVER = 2 ** 32 - 1
+
+
+def compute_next_uses(trace: Sequence[int]) -> array:
+    """
+    Calcula, para cada requisição, a posição da próxima requisição da mesma chave
+
+    Args:
+        trace: Sequência de chaves requisitadas
+
+    Returns:
+        array: next_uses[i] = menor j > i com trace[j] == trace[i] (NEVER se não houver)
+    """
+    next_uses = array('I', [NEVER]) * len(trace)
+    last_seen = {}
+    for position in range(len(trace) - 1, -1, -1):
+        key = trace[position]
+        next_uses[position] = last_seen.get(key, NEVER)
+        last_seen[key] = position
+    return next_uses
+
+
+class OPTCache:
+    """
+    Implementação do algoritmo de cache ótimo (Belady)
+
+    Antes de usar, o trace completo deve ser informado (set_trace); cada get
+    corresponde à próxima requisição do trace. O próximo uso de cada chave
+    residente fica em um heap de máximo com invalidação preguiçosa, então cada
+    requisição custa O(log k).
+
+    Um item novo cujo próximo uso é mais distante que o de todos os residentes
+    não é admitido (bypass), o que torna o resultado um limite superior também
+    para políticas com filtro de admissão. Com orçamento em bytes a remoção
+    continua pelo próximo uso mais distante (heurística; o ótimo exato com
+    tamanhos variáveis é NP-difícil).
+    """
+
+    def __init__(self, capacity: int, max_bytes: Optional[int] = None,
+                 sizer: Optional[Callable[[Any], int]] = None,
+                 trace: Optional[Sequence[int]] = None):
+        """
+        Inicializa o cache OPT
+
+        Args:
+            capacity (int): Capacidade máxima do cache (número de itens)
+            max_bytes (int, optional): Orçamento máximo em bytes (None = sem limite)
+            sizer (callable, optional): Função que mede o tamanho de um valor em bytes
+            trace (sequence, optional): Trace completo de requisições
+        """
+        self.capacity = capacity
+        self.cache = {}  # key -> value
+        self.next_use_of = {}  # key -> posição do próximo uso
+        self.heap = []  # (-próximo uso, key), com entradas obsoletas
+        self.trace = None
+        self.next_uses = None
+        self.position = 0
+        self._pending = None  # (key, próximo uso) da última requisição
+        self.access_count = 0
+        self.hit_count = 0
+        self.miss_count = 0
+        self.bypass_count = 0
+
+        # Orçamento em bytes
+        self.max_bytes = max_bytes
+        self.sizer = sizer or default_sizer
+        self.entry_sizes = {}
+        self.current_bytes = 0
+
+        # Callback opcional chamado com (chave, valor) a cada remoção por capacidade
+        self.on_evict = None
+
+        if trace is not None:
+            self.set_trace(trace)
+
+    def set_trace(self, trace: Iterable[int]) -> None:
+        """
+        Define o trace a ser reproduzido e limpa o cache
+
+        Args:
+            trace: Sequência completa de chaves que serão requisitadas
+        """
+        self.trace = trace if isinstance(trace, Sequence) else list(trace)
+        self.next_uses = compute_next_uses(self.trace)
+        self.clear()
+
+    def get(self, key: int) -> str:
+        """
+        Recupera um item do cache (avança uma posição no trace)
+
+        Args:
+            key (int): Chave do item (deve ser a próxima do trace)
+
+        Returns:
+            str: Valor do item ou None se não encontrado
+        """
+        if self.trace is None:
+            raise ValueError("OPTCache requer o trace completo (set_trace) antes do uso")
+        if self.position >= len(self.trace) or self.trace[self.position] != key:
+            raise ValueError(f"Requisição fora do trace na posição {self.position}: {key}")
+
+        next_use = self.next_uses[self.position]
+        self.position += 1
+        self.access_count += 1
+        self._pending = (key, next_use)
+
+        if key in self.cache:
+            self._set_next_use(key, next_use)
+            self.hit_count += 1
+            return self.cache[key]
+
+        self.miss_count += 1
+        return None
+
+    def put(self, key: int, value: str) -> None:
+        """
+        Adiciona um item ao cache, removendo o de próximo uso mais distante
+
+        Args:
+            key (int): Chave do item
+            value (str): Valor do item
+        """
+        size = self.sizer(value)
+        next_use = self._pending[1] if self._pending and self._pending[0] == key else NEVER
+
+        # Item maior que todo o orçamento não é admitido
+        if self.max_bytes is not None and size > self.max_bytes:
+            if key in self.cache:
+                self._remove_entry(key)
+            return
+
+        if key in self.cache:
+            self.cache[key] = value
+            self.current_bytes += size - self.entry_sizes[key]
+            self.entry_sizes[key] = size
+            while self._over_budget(0) and self._evict_one(protect=key):
+                pass
+            return
+
+        while self.cache and (len(self.cache) >= self.capacity or self._over_budget(size)):
+            farthest = self._peek_farthest()
+            if next_use >= self.next_use_of[farthest]:
+                # O próprio item novo é o mais distante: não admitir
+                self.bypass_count += 1
+                return
+            self._evict_one()
+
+        self.cache[key] = value
+        self.entry_sizes[key] = size
+        self.current_bytes += size
+        self._set_next_use(key, next_use)
+
+    def _set_next_use(self, key: int, next_use: int) -> None:
+        """Atualiza o próximo uso de uma chave residente"""
+        self.next_use_of[key] = next_use
+        heapq.heappush(self.heap, (-next_use, key))
+
+        # Compactar o heap quando as entradas obsoletas dominam
+        if len(self.heap) > 4 * max(len(self.cache), 16):
+            self.heap = [(-use, k) for k, use in self.next_use_of.items()]
+            heapq.heapify(self.heap)
+
+    def _peek_farthest(self) -> int:
+        """Retorna a chave residente com o próximo uso mais distante"""
+        heap = self.heap
+        while heap:
+            negative_use, key = heap[0]
+            if self.next_use_of.get(key) == -negative_use:
+                return key
+            heapq.heappop(heap)
+        return None
+
+    def _over_budget(self, incoming_size: int) -> bool:
+        """Verifica se admitir incoming_size bytes excederia o orçamento"""
+        return self.max_bytes is not None and self.current_bytes + incoming_size > self.max_bytes
+
+    def _evict_one(self, protect: int = None) -> bool:
+        """
+        Remove a chave de próximo uso mais distante
+
+        Args:
+            protect (int, optional): Chave que não pode ser removida
+
+        Returns:
+            bool: True se algum item foi removido
+        """
+        farthest = self._peek_farthest()
+        if farthest is None:
+            return False
+        if farthest == protect:
+            candidates = [k for k in self.cache if k != protect]
+            if not candidates:
+                return False
+            farthest = max(candidates, key=self.next_use_of.__getitem__)
+
+        self._evict_key(farthest)
+        return True
+
+    def _evict_key(self, key: int) -> None:
+        """Remove uma chave por capacidade e notifica on_evict"""
+        value = self.cache[key]
+        self._remove_entry(key)
+        if self.on_evict is not None:
+            self.on_evict(key, value)
+
+    def _remove_entry(self, key: int) -> None:
+        """Remove uma chave de todas as estruturas internas"""
+        del self.cache[key]
+        del self.next_use_of[key]
+        self.current_bytes -= self.entry_sizes.pop(key, 0)
+
+    def remove(self, key: int) -> bool:
+        """
+        Remove uma chave do cache (sem notificar on_evict)
+
+        Args:
+            key (int): Chave a remover
+
+        Returns:
+            bool: True se a chave estava no cache
+        """
+        if key not in self.cache:
+            return False
+        self._remove_entry(key)
+        return True
+
+    def clear(self) -> None:
+        """Limpa o cache e volta ao início do trace"""
+        self.cache.clear()
+        self.next_use_of.clear()
+        self.heap = []
+        self.position = 0
+        self._pending = None
+        self.entry_sizes.clear()
+        self.current_bytes = 0
+
+    def size(self) -> int:
+        """Retorna o tamanho atual do cache"""
+        return len(self.cache)
+
+    def is_full(self) -> bool:
+        """Verifica se o cache está cheio"""
+        return len(self.cache) >= self.capacity
+
+    def get_stats(self) -> dict:
+        """
+        Retorna estatísticas do cache
+
+        Returns:
+            dict: Estatísticas detalhadas
+        """
+        hit_rate = (self.hit_count / self.access_count * 100) if self.access_count > 0 else 0
+
+        return {
+            'algorithm': 'OPT',
+            'capacity': self.capacity,
+            'current_size': len(self.cache),
+            'total_accesses': self.access_count,
+            'hits': self.hit_count,
+            'misses': self.miss_count,
+            'hit_rate': hit_rate,
+            'keys_in_cache': list(self.cache.keys()),
+            'max_bytes': self.max_bytes,
+            'bytes_used': self.current_bytes,
+            'bypassed': self.bypass_count,
+            'trace_position': self.position
+        }
+
+    def reset_stats(self) -> None:
+        """Reinicia as estatísticas sem limpar o cache"""
+        self.access_count = 0
+        self.hit_count = 0
+        self.miss_count = 0
+        self.bypass_count = 0
+
+    def contains(self, key: int) -> bool:
+        """
+        Verifica se uma chave está no cache
+
+        Args:
+            key (int): Chave a verificar
+
+        Returns:
+            bool: True se a chave está no cache
+        """
+        return key in self.cache
+
+    def __str__(self) -> str:
+        """Representação string do cache"""
+        return f"OPTCache(capacity={self.capacity}, size={len(self.cache)}, hit_rate={self.get_stats()['hit_rate']:.1f}%)"
+
+    def __repr__(self) -> str:
+        return self.__str__()
@@ -0,0 +1,85 @@
+"""
+Relógios usados pelas políticas de cache para registrar acessos
+O relógio lógico (padrão) é apenas um contador, sem chamadas ao sistema no
+caminho quente; o relógio de parede fica disponível para TTL e diagnóstico
+"""
+
+import time
+from typing import Callable, Union
+
+class LogicalClock:
+    """
+    Relógio lógico: cada leitura retorna o próximo inteiro
+
+    Preserva a ordem dos eventos, que é tudo o que as políticas precisam para
+    recência e ordem de inserção, e custa apenas um incremento.
+    """
+
+    __slots__ = ('ticks',)
+
+    def __init__(self, start: int = 0):
+        """
+        Inicializa o relógio lógico
+
+        Args:
+            start (int): Valor inicial do contador
+        """
+        self.ticks = start
+
+    def now(self) -> int:
+        """Avança o relógio e retorna o instante atual"""
+        self.ticks += 1
+        return self.ticks
+
+    def __repr__(self) -> str:
+        return f"LogicalClock(ticks={self.ticks})"
+
+
+class WallClock:
+    """
+    Relógio de parede: retorna segundos de uma fonte de tempo real
+
+    Necessário quando os instantes precisam ter significado físico (expiração
+    por TTL, tempos exibidos ao usuário).
+    """
+
+    __slots__ = ('source',)
+
+    def __init__(self, source: Callable[[], float] = time.time):
+        """
+        Inicializa o relógio de parede
+
+        Args:
+            source (callable): Função que retorna o tempo atual em segundos
+        """
+        self.source = source
+
+    def now(self) -> float:
+        """Retorna o instante atual em segundos"""
+        return self.source()
+
+    def __repr__(self) -> str:
+        return f"WallClock(source={getattr(self.source, '__name__', self.source)})"
+
+
+Clock = Union[LogicalClock, WallClock]
+
+
+def create_clock(kind: str = 'logical') -> Clock:
+    """
+    Cria um relógio pelo nome
+
+    Args:
+        kind (str): 'logical' (contador) ou 'wall' (time.time)
+
+    Returns:
+        Relógio correspondente
+
+    Raises:
+        ValueError: Se o tipo não for reconhecido
+    """
+    if kind == 'logical':
+        return LogicalClock()
+    if kind == 'wall':
+        return WallClock()
+    raise ValueError(f"Relógio desconhecido: {kind}")
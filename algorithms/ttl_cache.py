@@ -0,0 +1,283 @@
+"""
+Camada de expiração (TTL) para qualquer política de cache
+Entradas podem ter um tempo de vida (por item ou padrão) e uma versão (por
+exemplo, o mtime do arquivo) revalidada periodicamente; entradas vencidas ou
+desatualizadas são descartadas no próximo acesso ou por uma varredura limitada
+"""
+
+import heapq
+import time
+from typing import Any, Callable, Optional
+
+from algorithms.cache_utils import new_cache_like
+from algorithms.timing import Clock, WallClock
+
+
+class TTLCache:
+    """
+    Envolve uma política de cache (FIFO, LRU, LFU...) adicionando expiração
+
+    A política interna continua decidindo as remoções por capacidade. Esta
+    camada guarda apenas o prazo de cada entrada (em um heap com invalidação
+    preguiçosa) e, se houver um validador, a versão com que a entrada foi
+    armazenada:
+
+    - no get, uma entrada vencida é removida e o acesso vira miss;
+    - com validator, a versão atual é consultada no máximo uma vez a cada
+      revalidate_interval segundos por chave; se mudou, a entrada é removida;
+    - sweep() remove até max_entries entradas vencidas, para ser chamado
+      periodicamente (ver core/expiry_sweeper.py) sem percorrer todo o cache.
+
+    A cada entrada descartada por expiração ou desatualização, on_expire é
+    chamado com a chave (usado pelo cache em dois níveis para descartar a
+    cópia do L2). Durante on_evict, entry_metadata ainda retorna a versão e o
+    prazo da entrada removida, para que eles acompanhem o texto no L2.
+    """
+
+    def __init__(self, policy: Any, default_ttl: Optional[float] = None,
+                 clock: Optional[Clock] = None,
+                 validator: Optional[Callable[[int], Any]] = None,
+                 revalidate_interval: float = 0.0):
+        """
+        Inicializa a camada de expiração
+
+        Args:
+            policy: Instância da política de cache a envolver
+            default_ttl (float, optional): Tempo de vida padrão em segundos (None = sem prazo)
+            clock (optional): Relógio dos prazos (None = WallClock monotônico)
+            validator (callable, optional): Função chave -> versão atual (ex.: mtime do arquivo)
+            revalidate_interval (float): Intervalo mínimo entre validações da mesma chave
+        """
+        if default_ttl is not None and default_ttl <= 0:
+            raise ValueError("default_ttl deve ser positivo")
+
+        self.policy = policy
+        self.default_ttl = default_ttl
+        self.clock = clock or WallClock(time.monotonic)
+        self.validator = validator
+        self.revalidate_interval = revalidate_interval
+        self.on_expire = None
+        self._on_evict = None
+
+        self.expires_at = {}  # key -> prazo
+        self.heap = []  # (prazo, key), com entradas obsoletas
+        self.versions = {}  # key -> versão armazenada
+        self.checked_at = {}  # key -> instante da última validação
+
+        # Remoções por capacidade também limpam os metadados
+        self.policy.on_evict = self._forward_evict
+
+        # Estatísticas de expiração
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: int) -> Any:
+        """
+        Recupera um item do cache se ainda estiver válido
+
+        Args:
+            key (int): Chave do item
+
+        Returns:
+            Valor do item ou None se não encontrado, vencido ou desatualizado
+        """
+        deadline = self.expires_at.get(key)
+        now = None
+        if deadline is not None:
+            now = self.clock.now()
+            if now >= deadline:
+                self._expire(key)
+                self.expirations += 1
+        elif self.validator is not None and key in self.versions:
+            now = self.clock.now()
+
+        if self.validator is not None and key in self.versions:
+            if now - self.checked_at[key] >= self.revalidate_interval:
+                self.checked_at[key] = now
+                if self.validator(key) != self.versions[key]:
+                    self._expire(key)
+                    self.invalidations += 1
+
+        # Entradas descartadas acima contam como miss na política
+        return self.policy.get(key)
+
+    def put(self, key: int, value: Any, ttl: Optional[float] = None, version: Any = None) -> None:
+        """
+        Armazena um item no cache
+
+        Args:
+            key (int): Chave do item
+            value: Valor do item
+            ttl (float, optional): Tempo de vida em segundos (None = default_ttl)
+            version (optional): Versão do valor (None = consultar o validador)
+        """
+        self.policy.put(key, value)
+        if not self.policy.contains(key):
+            # Não admitido pela política
+            self._drop_metadata(key)
+            return
+
+        now = self.clock.now()
+        if ttl is None:
+            ttl = self.default_ttl
+        if ttl is not None:
+            deadline = now + ttl
+            self.expires_at[key] = deadline
+            heapq.heappush(self.heap, (deadline, key))
+            self._compact_heap()
+        else:
+            self.expires_at.pop(key, None)
+
+        if self.validator is not None:
+            self.versions[key] = version if version is not None else self.validator(key)
+            self.checked_at[key] = now
+
+    def sweep(self, max_entries: Optional[int] = None) -> int:
+        """
+        Remove entradas vencidas em ordem de prazo
+
+        Args:
+            max_entries (int, optional): Máximo de entradas removidas (None = todas)
+
+        Returns:
+            int: Número de entradas removidas
+        """
+        now = self.clock.now()
+        removed = 0
+        heap = self.heap
+        while heap and heap[0][0] <= now and (max_entries is None or removed < max_entries):
+            deadline, key = heapq.heappop(heap)
+            if self.expires_at.get(key) == deadline:
+                self._expire(key)
+                self.expirations += 1
+                removed += 1
+        return removed
+
+    def _compact_heap(self) -> None:
+        """Reconstrói o heap quando as entradas obsoletas dominam"""
+        if len(self.heap) > 2 * len(self.expires_at) + 64:
+            self.heap = [(deadline, key) for key, deadline in self.expires_at.items()]
+            heapq.heapify(self.heap)
+
+    def _expire(self, key: int) -> None:
+        """Descarta uma entrada vencida ou desatualizada e notifica on_expire"""
+        self.policy.remove(key)
+        self._drop_metadata(key)
+        if self.on_expire is not None:
+            self.on_expire(key)
+
+    def _drop_metadata(self, key: int) -> None:
+        self.expires_at.pop(key, None)
+        self.versions.pop(key, None)
+        self.checked_at.pop(key, None)
+
+    @property
+    def on_evict(self) -> Optional[Callable[[int, Any], None]]:
+        """Callback chamado com (chave, valor) a cada remoção por capacidade"""
+        return self._on_evict
+
+    @on_evict.setter
+    def on_evict(self, callback: Optional[Callable[[int, Any], None]]) -> None:
+        self._on_evict = callback
+
+    def _forward_evict(self, key: int, value: Any) -> None:
+        # Metadados descartados só depois do callback, que pode consultá-los
+        if self._on_evict is not None:
+            self._on_evict(key, value)
+        self._drop_metadata(key)
+
+    def entry_metadata(self, key: int) -> tuple:
+        """
+        Retorna a versão e o prazo com que uma entrada foi armazenada
+
+        Args:
+            key (int): Chave do item
+
+        Returns:
+            tuple: (versão ou None, prazo no relógio da camada ou None)
+        """
+        return self.versions.get(key), self.expires_at.get(key)
+
+    def remove(self, key: int) -> bool:
+        """
+        Remove uma chave do cache (sem notificar on_evict nem on_expire)
+
+        Args:
+            key (int): Chave a remover
+
+        Returns:
+            bool: True se a chave estava no cache
+        """
+        self._drop_metadata(key)
+        return self.policy.remove(key)
+
+    def contains(self, key: int) -> bool:
+        """
+        Verifica se uma chave está no cache e não venceu
+
+        Args:
+            key (int): Chave a verificar
+
+        Returns:
+            bool: True se a chave está no cache
+        """
+        deadline = self.expires_at.get(key)
+        if deadline is not None and self.clock.now() >= deadline:
+            return False
+        return self.policy.contains(key)
+
+    def clear(self) -> None:
+        """Limpa todo o cache"""
+        self.policy.clear()
+        self.expires_at.clear()
+        self.heap = []
+        self.versions.clear()
+        self.checked_at.clear()
+
+    def size(self) -> int:
+        """Retorna o tamanho atual do cache"""
+        return self.policy.size()
+
+    def is_full(self) -> bool:
+        """Verifica se o cache está cheio"""
+        return self.policy.is_full()
+
+    def spawn(self, capacity: int, max_bytes: Optional[int] = None) -> 'TTLCache':
+        """Cria uma cópia vazia (mesma política e prazos) com outra capacidade"""
+        return TTLCache(new_cache_like(self.policy, capacity, max_bytes), self.default_ttl,
+                        self.clock, self.validator, self.revalidate_interval)
+
+    def get_stats(self) -> dict:
+        """
+        Retorna estatísticas da política interna e da expiração
+
+        Returns:
+            dict: Estatísticas detalhadas
+        """
+        stats = self.policy.get_stats()
+        stats.update({
+            'default_ttl': self.default_ttl,
+            'entries_with_ttl': len(self.expires_at),
+            'expirations': self.expirations,
+            'invalidations': self.invalidations
+        })
+        return stats
+
+    def reset_stats(self) -> None:
+        """Reinicia as estatísticas sem limpar o cache"""
+        self.policy.reset_stats()
+        self.expirations = 0
+        self.invalidations = 0
+
+    def __getattr__(self, name: str) -> Any:
+        # Demais atributos (cache, capacity, max_bytes, peek_lru...) vêm da política
+        if name == 'policy':
+            raise AttributeError(name)
+        return getattr(self.policy, name)
+
+    def __str__(self) -> str:
+        """Representação string do cache"""
+        return f"TTLCache({self.policy}, default_ttl={self.default_ttl})"
+
+    def __repr__(self) -> str:
+        return self.__str__()
@@ -0,0 +1,256 @@
+"""
+Implementação do algoritmo 2Q (Two Queue)
+Cache resistente a varreduras: itens novos passam por uma fila FIFO de
+entrada e só chegam à fila LRU principal se forem acessados de novo
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+from algorithms.cache_utils import default_sizer
+
+class TwoQueueCache:
+    """
+    Implementação do algoritmo de cache 2Q (Johnson & Shasha, versão completa)
+
+    A1in: FIFO dos itens vistos uma vez (residentes, ~25% da capacidade)
+    A1out: FIFO fantasma com as chaves que saíram de A1in (~50% da capacidade)
+    Am: LRU dos itens reutilizados
+
+    Um item só entra em Am se voltar a ser requisitado depois de sair de A1in,
+    então uma varredura sobre textos frios passa apenas por A1in sem expulsar
+    o conjunto quente.
+    """
+
+    def __init__(self, capacity: int, max_bytes: Optional[int] = None,
+                 sizer: Optional[Callable[[Any], int]] = None,
+                 in_ratio: float = 0.25, out_ratio: float = 0.5):
+        """
+        Inicializa o cache 2Q
+
+        Args:
+            capacity (int): Capacidade máxima do cache (número de itens)
+            max_bytes (int, optional): Orçamento máximo em bytes (None = sem limite)
+            sizer (callable, optional): Função que mede o tamanho de um valor em bytes
+            in_ratio (float): Fração da capacidade reservada para A1in
+            out_ratio (float): Tamanho de A1out em relação à capacidade
+        """
+        self.capacity = capacity
+        self.in_ratio = in_ratio
+        self.out_ratio = out_ratio
+        self.in_capacity = max(1, int(capacity * in_ratio))
+        self.out_capacity = max(1, int(capacity * out_ratio))
+
+        self.cache = {}  # key -> value (itens residentes)
+        self.a1in = OrderedDict()
+        self.a1out = OrderedDict()
+        self.am = OrderedDict()
+        self.access_count = 0
+        self.hit_count = 0
+        self.miss_count = 0
+
+        # Orçamento em bytes
+        self.max_bytes = max_bytes
+        self.sizer = sizer or default_sizer
+        self.entry_sizes = {}
+        self.current_bytes = 0
+
+        # Callback opcional chamado com (chave, valor) a cada remoção por capacidade
+        self.on_evict = None
+
+    def get(self, key: int) -> str:
+        """
+        Recupera um item do cache
+
+        Hits em A1in não alteram a ordem (FIFO); hits em Am movem o item para o final.
+
+        Args:
+            key (int): Chave do item
+
+        Returns:
+            str: Valor do item ou None se não encontrado
+        """
+        self.access_count += 1
+
+        if key in self.am:
+            self.am.move_to_end(key)
+        elif key not in self.a1in:
+            self.miss_count += 1
+            return None
+
+        self.hit_count += 1
+        return self.cache[key]
+
+    def put(self, key: int, value: str) -> None:
+        """
+        Adiciona um item ao cache
+
+        Args:
+            key (int): Chave do item
+            value (str): Valor do item
+        """
+        size = self.sizer(value)
+
+        # Item maior que todo o orçamento não é admitido
+        if self.max_bytes is not None and size > self.max_bytes:
+            if key in self.cache:
+                self._remove_entry(key)
+            return
+
+        if key in self.cache:
+            self.cache[key] = value
+            self.current_bytes += size - self.entry_sizes[key]
+            self.entry_sizes[key] = size
+            while self._over_budget(0) and self._evict_one(protect=key):
+                pass
+            return
+
+        while self.cache and (len(self.cache) >= self.capacity or self._over_budget(size)):
+            self._evict_one()
+
+        if key in self.a1out:
+            # Reutilizado depois de sair de A1in: entra na fila principal
+            del self.a1out[key]
+            self.am[key] = None
+        else:
+            self.a1in[key] = None
+
+        self.cache[key] = value
+        self.entry_sizes[key] = size
+        self.current_bytes += size
+
+    def _over_budget(self, incoming_size: int) -> bool:
+        """Verifica se admitir incoming_size bytes excederia o orçamento"""
+        return self.max_bytes is not None and self.current_bytes + incoming_size > self.max_bytes
+
+    def _evict_one(self, protect: int = None) -> bool:
+        """
+        Libera espaço: A1in se estiver acima da sua cota, senão o LRU de Am
+
+        Args:
+            protect (int, optional): Chave que não pode ser removida
+
+        Returns:
+            bool: True se algum item foi removido
+        """
+        if len(self.a1in) > self.in_capacity or not self.am:
+            segments = (self.a1in, self.am)
+        else:
+            segments = (self.am, self.a1in)
+
+        for segment in segments:
+            for candidate in segment:
+                if candidate != protect:
+                    from_a1in = segment is self.a1in
+                    self._evict_key(candidate)
+                    if from_a1in:
+                        self._remember(candidate)
+                    return True
+        return False
+
+    def _remember(self, key: int) -> None:
+        """Registra em A1out uma chave que saiu de A1in"""
+        self.a1out[key] = None
+        while len(self.a1out) > self.out_capacity:
+            self.a1out.popitem(last=False)
+
+    def _evict_key(self, key: int) -> None:
+        """Remove uma chave por capacidade e notifica on_evict"""
+        value = self.cache[key]
+        self._remove_entry(key)
+        if self.on_evict is not None:
+            self.on_evict(key, value)
+
+    def _remove_entry(self, key: int) -> None:
+        """Remove uma chave residente de todas as estruturas internas"""
+        del self.cache[key]
+        self.a1in.pop(key, None)
+        self.am.pop(key, None)
+        self.current_bytes -= self.entry_sizes.pop(key, 0)
+
+    def remove(self, key: int) -> bool:
+        """
+        Remove uma chave do cache (sem notificar on_evict)
+
+        Args:
+            key (int): Chave a remover
+
+        Returns:
+            bool: True se a chave estava no cache
+        """
+        if key not in self.cache:
+            return False
+        self._remove_entry(key)
+        return True
+
+    def clear(self) -> None:
+        """Limpa todo o cache, incluindo a fila fantasma"""
+        self.cache.clear()
+        self.a1in.clear()
+        self.a1out.clear()
+        self.am.clear()
+        self.entry_sizes.clear()
+        self.current_bytes = 0
+
+    def size(self) -> int:
+        """Retorna o tamanho atual do cache"""
+        return len(self.cache)
+
+    def is_full(self) -> bool:
+        """Verifica se o cache está cheio"""
+        return len(self.cache) >= self.capacity
+
+    def get_stats(self) -> dict:
+        """
+        Retorna estatísticas do cache
+
+        Returns:
+            dict: Estatísticas detalhadas
+        """
+        hit_rate = (self.hit_count / self.access_count * 100) if self.access_count > 0 else 0
+
+        return {
+            'algorithm': '2Q',
+            'capacity': self.capacity,
+            'current_size': len(self.cache),
+            'total_accesses': self.access_count,
+            'hits': self.hit_count,
+            'misses': self.miss_count,
+            'hit_rate': hit_rate,
+            'keys_in_cache': list(self.a1in) + list(self.am),
+            'max_bytes': self.max_bytes,
+            'bytes_used': self.current_bytes,
+            'a1in_size': len(self.a1in),
+            'a1out_size': len(self.a1out),
+            'am_size': len(self.am)
+        }
+
+    def reset_stats(self) -> None:
+        """Reinicia as estatísticas sem limpar o cache"""
+        self.access_count = 0
+        self.hit_count = 0
+        self.miss_count = 0
+
+    def contains(self, key: int) -> bool:
+        """
+        Verifica se uma chave está no cache
+
+        Args:
+            key (int): Chave a verificar
+
+        Returns:
+            bool: True se a chave está no cache
+        """
+        return key in self.cache
+
+    def spawn(self, capacity: int, max_bytes: Optional[int] = None) -> 'TwoQueueCache':
+        """Cria uma cópia vazia (mesmas proporções) com outra capacidade"""
+        return TwoQueueCache(capacity, max_bytes=max_bytes, sizer=self.sizer,
+                             in_ratio=self.in_ratio, out_ratio=self.out_ratio)
+
+    def __str__(self) -> str:
+        """Representação string do cache"""
+        return f"TwoQueueCache(capacity={self.capacity}, size={len(self.cache)}, hit_rate={self.get_stats()['hit_rate']:.1f}%)"
+
+    def __repr__(self) -> str:
+        return self.__str__()
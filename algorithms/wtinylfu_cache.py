@@ -0,0 +1,348 @@
+"""
+Implementação do algoritmo W-TinyLFU (Window TinyLFU)
+Janela LRU pequena + LRU segmentado principal, com filtro de admissão baseado
+em um count-min sketch compacto que envelhece periodicamente
+"""
+
+from array import array
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+from algorithms.cache_utils import default_sizer
+
+class CountMinSketch:
+    """
+    Estimador de frequência aproximado com contadores de 8 bits saturados em 15
+
+    Guarda o histórico de acessos inclusive de chaves que já saíram do cache,
+    em memória fixa. A cada sample_size incrementos todos os contadores são
+    divididos por 2 (envelhecimento), para que popularidade antiga expire.
+    """
+
+    MAX_COUNT = 15
+
+    def __init__(self, width: int, depth: int = 4, sample_size: Optional[int] = None):
+        """
+        Inicializa o sketch
+
+        Args:
+            width (int): Contadores por linha (arredondado para potência de 2)
+            depth (int): Número de linhas (funções de hash)
+            sample_size (int, optional): Incrementos entre envelhecimentos (padrão 10 × width)
+        """
+        self.width = 1 << max(4, (width - 1).bit_length())
+        self.mask = self.width - 1
+        self.depth = depth
+        self.table = array('B', bytes(self.width * depth))
+        self.sample_size = sample_size or 10 * self.width
+        self.additions = 0
+        self.reset_count = 0
+
+    def _indexes(self, key: Any):
+        """Posição do contador da chave em cada linha"""
+        for row in range(self.depth):
+            yield row * self.width + (hash((key, row)) & self.mask)
+
+    def increment(self, key: Any) -> None:
+        """Registra um acesso à chave"""
+        table = self.table
+        for index in self._indexes(key):
+            if table[index] < self.MAX_COUNT:
+                table[index] += 1
+
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self._age()
+
+    def estimate(self, key: Any) -> int:
+        """Retorna a frequência estimada (mínimo entre as linhas)"""
+        table = self.table
+        return min(table[index] for index in self._indexes(key))
+
+    def _age(self) -> None:
+        """Divide todos os contadores por 2"""
+        self.table = array('B', (count >> 1 for count in self.table))
+        self.additions //= 2
+        self.reset_count += 1
+
+    def clear(self) -> None:
+        """Zera todos os contadores"""
+        self.table = array('B', bytes(self.width * self.depth))
+        self.additions = 0
+
+
+class WTinyLFUCache:
+    """
+    Implementação do algoritmo de cache W-TinyLFU
+
+    Itens novos entram em uma janela LRU pequena. Quem sai da janela disputa a
+    entrada no cache principal (SLRU: probation + protected) com a vítima da
+    probation: só é admitido se o sketch estimar uma frequência maior. Assim
+    textos acessados uma única vez não expulsam os textos quentes.
+
+    A frequência é registrada em cada get (hit ou miss).
+    """
+
+    def __init__(self, capacity: int, max_bytes: Optional[int] = None,
+                 sizer: Optional[Callable[[Any], int]] = None,
+                 window_ratio: float = 0.01, protected_ratio: float = 0.8):
+        """
+        Inicializa o cache W-TinyLFU
+
+        Args:
+            capacity (int): Capacidade máxima do cache (número de itens)
+            max_bytes (int, optional): Orçamento máximo em bytes (None = sem limite)
+            sizer (callable, optional): Função que mede o tamanho de um valor em bytes
+            window_ratio (float): Fração da capacidade usada pela janela LRU
+            protected_ratio (float): Fração do cache principal para o segmento protegido
+        """
+        self.capacity = capacity
+        self.window_ratio = window_ratio
+        self.protected_ratio = protected_ratio
+        self.window_capacity = max(1, round(capacity * window_ratio))
+        self.main_capacity = max(0, capacity - self.window_capacity)
+        self.protected_capacity = int(self.main_capacity * protected_ratio)
+
+        self.cache = {}  # key -> value (todos os itens residentes)
+        self.window = OrderedDict()
+        self.probation = OrderedDict()
+        self.protected = OrderedDict()
+        self.sketch = CountMinSketch(max(capacity, 1) * 8)
+
+        self.access_count = 0
+        self.hit_count = 0
+        self.miss_count = 0
+        self.admitted_count = 0
+        self.rejected_count = 0
+
+        # Orçamento em bytes
+        self.max_bytes = max_bytes
+        self.sizer = sizer or default_sizer
+        self.entry_sizes = {}
+        self.current_bytes = 0
+
+        # Callback opcional chamado com (chave, valor) a cada remoção por capacidade
+        self.on_evict = None
+
+    def get(self, key: int) -> str:
+        """
+        Recupera um item do cache e registra o acesso no sketch
+
+        Args:
+            key (int): Chave do item
+
+        Returns:
+            str: Valor do item ou None se não encontrado
+        """
+        self.access_count += 1
+        self.sketch.increment(key)
+
+        if key in self.window:
+            self.window.move_to_end(key)
+        elif key in self.probation:
+            # Segundo acesso no cache principal: promover para protected
+            del self.probation[key]
+            self.protected[key] = None
+            if len(self.protected) > self.protected_capacity:
+                demoted, _ = self.protected.popitem(last=False)
+                self.probation[demoted] = None
+        elif key in self.protected:
+            self.protected.move_to_end(key)
+        else:
+            self.miss_count += 1
+            return None
+
+        self.hit_count += 1
+        return self.cache[key]
+
+    def put(self, key: int, value: str) -> None:
+        """
+        Adiciona um item ao cache (entra pela janela)
+
+        Args:
+            key (int): Chave do item
+            value (str): Valor do item
+        """
+        size = self.sizer(value)
+
+        # Item maior que todo o orçamento não é admitido
+        if self.max_bytes is not None and size > self.max_bytes:
+            if key in self.cache:
+                self._remove_entry(key)
+            return
+
+        if key in self.cache:
+            self.cache[key] = value
+            self.current_bytes += size - self.entry_sizes[key]
+            self.entry_sizes[key] = size
+            while self._over_budget(0) and self._evict_one(protect=key):
+                pass
+            return
+
+        while self.cache and self._over_budget(size):
+            self._evict_one()
+
+        self.window[key] = None
+        self.cache[key] = value
+        self.entry_sizes[key] = size
+        self.current_bytes += size
+
+        if len(self.window) > self.window_capacity:
+            candidate, _ = self.window.popitem(last=False)
+            self._admit(candidate)
+
+    def _admit(self, candidate: int) -> None:
+        """
+        Decide se o item que saiu da janela entra no cache principal
+
+        Args:
+            candidate (int): Chave que saiu da janela
+        """
+        if len(self.probation) + len(self.protected) < self.main_capacity:
+            self.probation[candidate] = None
+            return
+
+        segment = self.probation if self.probation else self.protected
+        if not segment:
+            # Sem cache principal (capacidade mínima): a janela é o cache
+            self._evict_key(candidate)
+            return
+
+        victim = next(iter(segment))
+        if self.sketch.estimate(candidate) > self.sketch.estimate(victim):
+            self._evict_key(victim)
+            self.probation[candidate] = None
+            self.admitted_count += 1
+        else:
+            self._evict_key(candidate)
+            self.rejected_count += 1
+
+    def _over_budget(self, incoming_size: int) -> bool:
+        """Verifica se admitir incoming_size bytes excederia o orçamento"""
+        return self.max_bytes is not None and self.current_bytes + incoming_size > self.max_bytes
+
+    def _evict_one(self, protect: int = None) -> bool:
+        """
+        Remove um item para liberar bytes: probation, depois janela, depois protected
+
+        Args:
+            protect (int, optional): Chave que não pode ser removida
+
+        Returns:
+            bool: True se algum item foi removido
+        """
+        for segment in (self.probation, self.window, self.protected):
+            for candidate in segment:
+                if candidate != protect:
+                    self._evict_key(candidate)
+                    return True
+        return False
+
+    def _evict_key(self, key: int) -> None:
+        """Remove uma chave por capacidade e notifica on_evict"""
+        value = self.cache[key]
+        self._remove_entry(key)
+        if self.on_evict is not None:
+            self.on_evict(key, value)
+
+    def _remove_entry(self, key: int) -> None:
+        """Remove uma chave de todas as estruturas internas"""
+        del self.cache[key]
+        self.window.pop(key, None)
+        self.probation.pop(key, None)
+        self.protected.pop(key, None)
+        self.current_bytes -= self.entry_sizes.pop(key, 0)
+
+    def remove(self, key: int) -> bool:
+        """
+        Remove uma chave do cache (sem notificar on_evict)
+
+        Args:
+            key (int): Chave a remover
+
+        Returns:
+            bool: True se a chave estava no cache
+        """
+        if key not in self.cache:
+            return False
+        self._remove_entry(key)
+        return True
+
+    def clear(self) -> None:
+        """Limpa todo o cache e o histórico de frequências"""
+        self.cache.clear()
+        self.window.clear()
+        self.probation.clear()
+        self.protected.clear()
+        self.sketch.clear()
+        self.entry_sizes.clear()
+        self.current_bytes = 0
+
+    def size(self) -> int:
+        """Retorna o tamanho atual do cache"""
+        return len(self.cache)
+
+    def is_full(self) -> bool:
+        """Verifica se o cache está cheio"""
+        return len(self.cache) >= self.capacity
+
+    def get_stats(self) -> dict:
+        """
+        Retorna estatísticas do cache
+
+        Returns:
+            dict: Estatísticas detalhadas
+        """
+        hit_rate = (self.hit_count / self.access_count * 100) if self.access_count > 0 else 0
+
+        return {
+            'algorithm': 'WTinyLFU',
+            'capacity': self.capacity,
+            'current_size': len(self.cache),
+            'total_accesses': self.access_count,
+            'hits': self.hit_count,
+            'misses': self.miss_count,
+            'hit_rate': hit_rate,
+            'keys_in_cache': list(self.window) + list(self.probation) + list(self.protected),
+            'max_bytes': self.max_bytes,
+            'bytes_used': self.current_bytes,
+            'window_size': len(self.window),
+            'probation_size': len(self.probation),
+            'protected_size': len(self.protected),
+            'admitted': self.admitted_count,
+            'rejected': self.rejected_count,
+            'sketch_resets': self.sketch.reset_count
+        }
+
+    def reset_stats(self) -> None:
+        """Reinicia as estatísticas sem limpar o cache"""
+        self.access_count = 0
+        self.hit_count = 0
+        self.miss_count = 0
+        self.admitted_count = 0
+        self.rejected_count = 0
+
+    def contains(self, key: int) -> bool:
+        """
+        Verifica se uma chave está no cache
+
+        Args:
+            key (int): Chave a verificar
+
+        Returns:
+            bool: True se a chave está no cache
+        """
+        return key in self.cache
+
+    def spawn(self, capacity: int, max_bytes: Optional[int] = None) -> 'WTinyLFUCache':
+        """Cria uma cópia vazia (mesmas proporções) com outra capacidade"""
+        return WTinyLFUCache(capacity, max_bytes=max_bytes, sizer=self.sizer,
+                             window_ratio=self.window_ratio,
+                             protected_ratio=self.protected_ratio)
+
+    def __str__(self) -> str:
+        """Representação string do cache"""
+        return f"WTinyLFUCache(capacity={self.capacity}, size={len(self.cache)}, hit_rate={self.get_stats()['hit_rate']:.1f}%)"
+
+    def __repr__(self) -> str:
+        return self.__str__()
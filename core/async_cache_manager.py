@@ -0,0 +1,112 @@
+"""
+Fachada assíncrona (asyncio) para o gerenciador de cache
+Combina o cache em memória com o AsyncTextManager e coalesce misses
+simultâneos do mesmo texto em uma única carga. As chamadas ao gerenciador
+(que podem tocar o L2 em sqlite) rodam em um executor, fora do event loop
+"""
+
+import asyncio
+from concurrent.futures import Executor
+from typing import Dict, Optional, Tuple
+
+from core.async_text_manager import AsyncTextManager
+
+
+class AsyncCacheManager:
+    """Gerenciador de cache com API assíncrona"""
+
+    def __init__(self, cache_manager, async_text_manager: AsyncTextManager,
+                 executor: Optional[Executor] = None):
+        """
+        Inicializa a fachada assíncrona
+
+        Args:
+            cache_manager: Gerenciador thread-safe (ConcurrentCacheManager ou TieredCacheManager)
+            async_text_manager: Fonte assíncrona dos textos
+            executor: Executor das chamadas ao gerenciador (None = executor padrão do loop)
+        """
+        self.cache_manager = cache_manager
+        self.text_manager = async_text_manager
+        self.executor = executor
+        self._in_flight = {}
+        self.coalesced_count = 0
+
+    async def _run(self, function, *args):
+        """Executa uma chamada bloqueante ao gerenciador sem ocupar o event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, function, *args)
+
+    async def get(self, key: int, algorithm: str) -> Optional[str]:
+        """
+        Recupera um item do cache
+
+        Args:
+            key (int): Chave do item (ID do texto)
+            algorithm (str): Nome do algoritmo
+
+        Returns:
+            Optional[str]: Conteúdo do cache ou None se não encontrado
+        """
+        return await self._run(self.cache_manager.get, key, algorithm)
+
+    async def put(self, key: int, value: str, algorithm: str) -> None:
+        """
+        Armazena um item no cache
+
+        Args:
+            key (int): Chave do item (ID do texto)
+            value (str): Conteúdo do texto
+            algorithm (str): Nome do algoritmo
+        """
+        await self._run(self.cache_manager.put, key, value, algorithm)
+
+    async def get_or_load(self, key: int, algorithm: str) -> Tuple[Optional[str], bool]:
+        """
+        Recupera um texto do cache ou o carrega do disco em caso de miss
+
+        Misses simultâneos da mesma chave aguardam a mesma carga. A carga roda
+        em uma tarefa própria: cancelar quem a iniciou não cancela a carga nem
+        os demais que a aguardam.
+
+        Args:
+            key (int): Chave do item (ID do texto)
+            algorithm (str): Nome do algoritmo
+
+        Returns:
+            Tuple[Optional[str], bool]: (conteúdo ou None, True se foi cache hit)
+        """
+        value = await self._run(self.cache_manager.get, key, algorithm)
+        if value is not None:
+            return value, True
+
+        flight_key = (algorithm, key)
+        task = self._in_flight.get(flight_key)
+        if task is not None:
+            self.coalesced_count += 1
+        else:
+            task = asyncio.ensure_future(self._load(key, algorithm))
+            self._in_flight[flight_key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(flight_key, None))
+            # Evita aviso de exceção não recuperada quando ninguém mais aguarda
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+        return await asyncio.shield(task), False
+
+    async def _load(self, key: int, algorithm: str) -> Optional[str]:
+        """Carrega um texto do disco e o armazena no cache"""
+        content = await self.text_manager.load_text(key)
+        if content:
+            await self._run(self.cache_manager.put, key, content, algorithm)
+        return content
+
+    def get_stats(self, algorithm: str = None) -> Dict:
+        """
+        Retorna estatísticas do gerenciador de cache subjacente
+
+        Args:
+            algorithm (str, optional): Nome do algoritmo ou None para todos
+
+        Returns:
+            Dict: Estatísticas
+        """
+        return self.cache_manager.get_stats(algorithm)
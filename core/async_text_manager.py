@@ -0,0 +1,63 @@
+"""
+Fachada assíncrona (asyncio) para o TextManager
+Transfere a leitura dos arquivos para um executor e usa asyncio.sleep para o
+atraso simulado do disco, permitindo centenas de requisições em andamento em
+um único event loop
+"""
+
+import asyncio
+from concurrent.futures import Executor
+from typing import Optional
+
+
+class AsyncTextManager:
+    """Versão assíncrona do carregamento de textos"""
+
+    def __init__(self, text_manager, executor: Optional[Executor] = None):
+        """
+        Inicializa a fachada assíncrona
+
+        Args:
+            text_manager: Instância de TextManager (ou backend compatível)
+            executor: Executor para a E/S de arquivos (None = executor padrão do loop)
+        """
+        self.text_manager = text_manager
+        self.executor = executor
+
+    async def load_text(self, text_id: int) -> Optional[str]:
+        """
+        Carrega um texto do disco sem bloquear o event loop
+
+        Args:
+            text_id (int): ID do texto
+
+        Returns:
+            str: Conteúdo do texto ou None se não encontrado
+        """
+        if not self.text_manager.has_text(text_id):
+            return None
+
+        # Simular lentidão do disco forense sem ocupar uma thread
+        delay = self.text_manager.next_disk_delay()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.text_manager.read_text, text_id)
+
+    async def get_text_info(self, text_id: int) -> Optional[dict]:
+        """
+        Retorna informações sobre um texto sem carregá-lo
+
+        Args:
+            text_id (int): ID do texto
+
+        Returns:
+            dict: Informações do texto ou None
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.text_manager.get_text_info, text_id)
+
+    def get_read_stats(self) -> dict:
+        """Retorna estatísticas de leitura do disco."""
+        return self.text_manager.get_read_stats()
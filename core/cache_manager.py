@@ -3,9 +3,12 @@ Módulo gerenciador de cache - Aluno A
 Interface unificada para coordenar os diferentes algoritmos de cache
 """
 
-from typing import Any, Optional, Dict
+from typing import Any, Optional, Dict, Iterable, List, Tuple
 import time
 
+from core.cache_snapshot import policy_entries, restore_entry
+from algorithms.cache_utils import get_many, put_many
+
 class CacheManager:
     """
     Gerenciador central dos algoritmos de cache
@@ -44,6 +47,33 @@ class CacheManager:
 
         return result
 
+    def get_many(self, keys: Iterable[int], algorithm: str) -> Dict[int, str]:
+        """
+        Recupera vários itens do cache com uma única validação e atualização de estatísticas
+
+        Args:
+            keys: IDs dos textos (cada um conta como uma requisição)
+            algorithm (str): Nome do algoritmo
+
+        Returns:
+            Dict[int, str]: ID -> conteúdo apenas dos itens encontrados
+        """
+        if algorithm not in self.algorithms:
+            raise ValueError(f"Algoritmo '{algorithm}' não disponível")
+
+        keys = list(keys)
+        start_time = time.time()
+        found = get_many(self.algorithms[algorithm], keys)
+        elapsed_time = time.time() - start_time
+
+        stats = self.stats[algorithm]
+        hits = sum(1 for key in keys if key in found)
+        stats['hits'] += hits
+        stats['misses'] += len(keys) - hits
+        stats['total_time'] += elapsed_time
+
+        return found
+
     def put(self, key: int, value: str, algorithm: str) -> None:
         """
         Armazena um item no cache usando o algoritmo especificado
@@ -58,6 +88,35 @@ class CacheManager:
 
         self.algorithms[algorithm].put(key, value)
 
+    def put_many(self, items: Iterable[Tuple[int, str]], algorithm: str) -> None:
+        """
+        Armazena vários itens no cache do algoritmo
+
+        Args:
+            items: Pares (ID do texto, conteúdo) ou dicionário ID -> conteúdo
+            algorithm (str): Nome do algoritmo
+        """
+        if algorithm not in self.algorithms:
+            raise ValueError(f"Algoritmo '{algorithm}' não disponível")
+
+        put_many(self.algorithms[algorithm], items)
+
+    def contains(self, key: int, algorithm: str) -> bool:
+        """
+        Verifica se uma chave está no cache do algoritmo, sem contar como acesso
+
+        Args:
+            key (int): Chave do item (ID do texto)
+            algorithm (str): Nome do algoritmo
+
+        Returns:
+            bool: True se a chave está no cache
+        """
+        if algorithm not in self.algorithms:
+            raise ValueError(f"Algoritmo '{algorithm}' não disponível")
+
+        return self.algorithms[algorithm].contains(key)
+
     def clear(self, algorithm: str = None) -> None:
         """
         Limpa o cache do algoritmo especificado ou todos
@@ -72,6 +131,60 @@ class CacheManager:
             for alg in self.algorithms.values():
                 alg.clear()
 
+    def invalidate(self, key: int, algorithm: str = None) -> int:
+        """
+        Remove uma única chave do cache do algoritmo especificado ou de todos
+
+        Args:
+            key (int): Chave do item (ID do texto)
+            algorithm (str, optional): Nome do algoritmo ou None para todos
+
+        Returns:
+            int: Número de caches que continham a chave
+        """
+        if algorithm and algorithm not in self.algorithms:
+            raise ValueError(f"Algoritmo '{algorithm}' não disponível")
+
+        caches = [self.algorithms[algorithm]] if algorithm else self.algorithms.values()
+        return sum(1 for cache in caches if cache.remove(key))
+
+    def snapshot_entries(self, algorithm: str) -> List[list]:
+        """
+        Lista as chaves do algoritmo (ordem de reinserção) com seus metadados
+
+        Args:
+            algorithm (str): Nome do algoritmo
+
+        Returns:
+            List[list]: [chave, frequência ou None] para cada item do cache
+        """
+        if algorithm not in self.algorithms:
+            raise ValueError(f"Algoritmo '{algorithm}' não disponível")
+
+        return policy_entries(self.algorithms[algorithm])
+
+    def restore_entries(self, algorithm: str, entries: Iterable[tuple]) -> int:
+        """
+        Reinsere entradas de um snapshot, preservando as que já estão no cache
+
+        Args:
+            algorithm (str): Nome do algoritmo
+            entries: Sequência de (chave, conteúdo, frequência ou None) na ordem salva
+
+        Returns:
+            int: Número de entradas reinseridas
+        """
+        if algorithm not in self.algorithms:
+            raise ValueError(f"Algoritmo '{algorithm}' não disponível")
+
+        cache = self.algorithms[algorithm]
+        restored = 0
+        for key, value, frequency in entries:
+            if not cache.contains(key):
+                restore_entry(cache, key, value, frequency)
+                restored += 1
+        return restored
+
     def get_stats(self, algorithm: str = None) -> Dict:
         """
         Retorna estatísticas dos algoritmos
@@ -109,6 +222,8 @@ class CacheManager:
             'algorithm': algorithm,
             'size': len(cache.cache) if hasattr(cache, 'cache') else 0,
             'capacity': cache.capacity if hasattr(cache, 'capacity') else 0,
+            'max_bytes': getattr(cache, 'max_bytes', None),
+            'bytes_used': getattr(cache, 'current_bytes', 0),
             'hits': stats['hits'],
             'misses': stats['misses'],
             'hit_rate': hit_rate,
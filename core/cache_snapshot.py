@@ -0,0 +1,265 @@
+"""
+Snapshot do conteúdo do cache para aquecimento na inicialização
+Salva apenas as chaves de cada algoritmo (na ordem de remoção da política) e
+os metadados necessários para reconstruí-la (frequências do LFU); na próxima
+execução os textos são recarregados em paralelo, em segundo plano
+"""
+
+import gzip
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+SNAPSHOT_VERSION = 1
+
+
+def policy_entries(cache: Any) -> List[list]:
+    """
+    Lista as chaves de uma política na ordem em que devem ser reinseridas
+
+    Para políticas baseadas em ordem (FIFO, LRU, MRU...) é a ordem do
+    mapeamento `cache` (mais antigo primeiro); para o LFU, a ordem de remoção
+    (frequência crescente, depois recência) com a frequência de cada chave.
+
+    Args:
+        cache: Instância da política (ou camada que a envolve)
+
+    Returns:
+        Lista de [chave, frequência ou None]
+    """
+    if hasattr(cache, 'get_keys_by_frequency'):
+        by_frequency = cache.get_keys_by_frequency()
+        return [[key, frequency] for frequency in sorted(by_frequency)
+                for key in by_frequency[frequency]]
+    return [[key, None] for key in list(cache.cache)]
+
+
+def restore_entry(cache: Any, key: int, value: Any, frequency: Optional[int]) -> None:
+    """
+    Reinsere uma entrada salva em uma política
+
+    Args:
+        cache: Instância da política
+        key (int): Chave do item
+        value: Conteúdo recarregado
+        frequency (int, optional): Frequência salva (LFU)
+    """
+    cache.put(key, value)
+    if frequency is not None and hasattr(cache, 'set_frequency'):
+        cache.set_frequency(key, frequency)
+
+
+def capture_snapshot(cache_manager: Any) -> Dict:
+    """
+    Captura as chaves e metadados de todos os algoritmos de um gerenciador
+
+    Args:
+        cache_manager: CacheManager ou ConcurrentCacheManager
+
+    Returns:
+        Dict: Snapshot serializável em JSON
+    """
+    return {
+        'version': SNAPSHOT_VERSION,
+        'created': datetime.now().isoformat(),
+        'algorithms': {alg: cache_manager.snapshot_entries(alg) for alg in cache_manager.algorithms}
+    }
+
+
+def save_snapshot(cache_manager: Any, path) -> Path:
+    """
+    Salva o snapshot de um gerenciador em JSON comprimido com gzip
+
+    Args:
+        cache_manager: CacheManager ou ConcurrentCacheManager
+        path: Caminho do arquivo
+
+    Returns:
+        Path: Caminho do arquivo gerado
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Escrever em arquivo temporário e renomear ao final (atômico)
+    temp_path = path.with_suffix(path.suffix + '.tmp')
+    with gzip.open(temp_path, 'wt', encoding='utf-8') as f:
+        json.dump(capture_snapshot(cache_manager), f, separators=(',', ':'))
+
+    os.replace(temp_path, path)
+    return path
+
+
+def load_snapshot(path) -> Optional[Dict]:
+    """
+    Carrega um snapshot salvo
+
+    Args:
+        path: Caminho do arquivo
+
+    Returns:
+        Dict: Snapshot ou None se o arquivo não existir ou for inválido
+    """
+    path = Path(path)
+    if not path.exists():
+        return None
+
+    try:
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Erro ao ler snapshot do cache {path}: {e}")
+        return None
+
+    if snapshot.get('version') != SNAPSHOT_VERSION:
+        print(f"Snapshot do cache {path} ignorado: versão {snapshot.get('version')}")
+        return None
+    return snapshot
+
+
+class SnapshotWarmer:
+    """
+    Reidrata um gerenciador de cache a partir de um snapshot em segundo plano
+
+    Os textos distintos do snapshot são carregados em paralelo (max_workers
+    threads) e, em seguida, reinseridos em cada algoritmo na ordem salva.
+    Chaves que a aplicação já colocou no cache enquanto o aquecimento rodava
+    são mantidas como estão.
+    """
+
+    def __init__(self, cache_manager: Any, loader: Callable[[int], Any], max_workers: int = 4):
+        """
+        Inicializa o aquecedor
+
+        Args:
+            cache_manager: Gerenciador a reidratar (com contains e restore_entries)
+            loader: Função ID do texto -> conteúdo
+            max_workers (int): Cargas simultâneas
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers deve ser pelo menos 1")
+
+        self.cache_manager = cache_manager
+        self.loader = loader
+        self.max_workers = max_workers
+        self._stop_event = threading.Event()
+        self._thread = None
+
+        self.loaded = 0
+        self.failed = 0
+        self.restored = 0
+        self.errors = 0
+        self.elapsed_time = 0.0
+
+    def start(self, snapshot: Dict) -> None:
+        """
+        Inicia o aquecimento em uma thread daemon
+
+        Args:
+            snapshot (dict): Snapshot carregado por load_snapshot
+        """
+        if self.is_running():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self.run, args=(snapshot,),
+                                        name="snapshot-warmer", daemon=True)
+        self._thread.start()
+
+    def run(self, snapshot: Dict) -> int:
+        """
+        Executa o aquecimento na thread atual
+
+        Args:
+            snapshot (dict): Snapshot carregado por load_snapshot
+
+        Returns:
+            int: Número de entradas reinseridas
+        """
+        start_time = time.perf_counter()
+        entries = {alg: saved for alg, saved in snapshot.get('algorithms', {}).items()
+                   if alg in self.cache_manager.algorithms}
+        keys = list(dict.fromkeys(key for saved in entries.values() for key, _ in saved))
+
+        values = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="warmup") as executor:
+            futures = {key: executor.submit(self._load, key) for key in keys}
+            for key, future in futures.items():
+                if self._stop_event.is_set():
+                    for pending in futures.values():
+                        pending.cancel()
+                    break
+                value = future.result()
+                if value:
+                    values[key] = value
+                    self.loaded += 1
+                else:
+                    self.failed += 1
+
+        if not self._stop_event.is_set():
+            for alg, saved in entries.items():
+                available = [(key, values[key], frequency) for key, frequency in saved if key in values]
+                try:
+                    self.restored += self.cache_manager.restore_entries(alg, available)
+                except Exception as e:
+                    # Uma política com problema não impede o aquecimento das demais
+                    self.errors += 1
+                    print(f"Erro ao restaurar o snapshot do algoritmo {alg}: {e}")
+
+        self.elapsed_time = time.perf_counter() - start_time
+        return self.restored
+
+    def _load(self, key: int) -> Any:
+        if self._stop_event.is_set():
+            return None
+        try:
+            return self.loader(key)
+        except Exception:
+            return None
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Aguarda o fim do aquecimento
+
+        Args:
+            timeout (float, optional): Tempo máximo de espera
+
+        Returns:
+            bool: True se o aquecimento terminou
+        """
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return not self.is_running()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Interrompe o aquecimento (nada é reinserido se as cargas não terminaram)
+
+        Args:
+            timeout (float, optional): Tempo máximo de espera pelo término
+        """
+        self._stop_event.set()
+        self.wait(timeout)
+
+    def is_running(self) -> bool:
+        """Verifica se o aquecimento está em andamento"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def get_stats(self) -> Dict:
+        """
+        Retorna estatísticas do aquecimento
+
+        Returns:
+            Dict: Textos carregados, falhas, entradas reinseridas, algoritmos com erro e tempo total
+        """
+        return {
+            'loaded': self.loaded,
+            'failed': self.failed,
+            'restored': self.restored,
+            'errors': self.errors,
+            'elapsed_time': self.elapsed_time,
+            'running': self.is_running()
+        }
@@ -0,0 +1,404 @@
+"""
+Gerenciador de cache concorrente
+Variante thread-safe do CacheManager com particionamento de chaves (lock striping)
+"""
+
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from core.cache_manager import CacheManager
+from core.cache_snapshot import policy_entries, restore_entry
+from algorithms.cache_utils import get_many, new_cache_like, put_many
+
+
+class ConcurrentCacheManager(CacheManager):
+    """
+    Gerenciador de cache seguro para múltiplas threads
+
+    Cada algoritmo é dividido em num_shards instâncias independentes da política,
+    cada uma protegida por seu próprio lock; a chave determina a partição. Com
+    num_shards=1 há um único lock por algoritmo e a ordem global da política
+    (LRU, LFU, ...) é preservada exatamente. O número de partições é limitado
+    pela menor capacidade (e orçamento em bytes) configurada, para que a soma
+    das partições seja sempre igual ao configurado.
+    """
+
+    def __init__(self, cache_algorithms: Dict[str, Any], num_shards: int = 8):
+        """
+        Inicializa o gerenciador concorrente
+
+        Args:
+            cache_algorithms: Dicionário nome -> instância de referência da política
+            num_shards: Número de partições por algoritmo (1 = modo de lock único)
+        """
+        if num_shards < 1:
+            raise ValueError("num_shards deve ser pelo menos 1")
+
+        super().__init__(cache_algorithms)
+
+        # Cada partição precisa de pelo menos uma vaga e um byte
+        limits = [cache.capacity for cache in cache_algorithms.values()]
+        limits += [cache.max_bytes for cache in cache_algorithms.values()
+                   if getattr(cache, 'max_bytes', None) is not None]
+        self.num_shards = max(1, min([num_shards] + limits))
+
+        # Partições, locks e estatísticas por algoritmo
+        self.shards = {}
+        self.locks = {}
+        self.shard_stats = {}
+        for alg, cache in cache_algorithms.items():
+            self.shards[alg] = self._create_shards(cache)
+            self.locks[alg] = [threading.Lock() for _ in range(self.num_shards)]
+            self.shard_stats[alg] = [self._empty_stats() for _ in range(self.num_shards)]
+
+    def _create_shards(self, cache: Any) -> List[Any]:
+        """
+        Cria as partições de uma política dividindo capacidade e orçamento
+
+        Args:
+            cache: Instância de referência
+
+        Returns:
+            Lista de instâncias da política
+        """
+        if self.num_shards == 1:
+            return [cache]
+
+        capacities = self._split_evenly(cache.capacity)
+        max_bytes = getattr(cache, 'max_bytes', None)
+        budgets = self._split_evenly(max_bytes) if max_bytes is not None else [None] * self.num_shards
+
+        return [new_cache_like(cache, capacity, budget) for capacity, budget in zip(capacities, budgets)]
+
+    def _split_evenly(self, total: int) -> List[int]:
+        """
+        Divide um total entre as partições sem perder o resto
+
+        As primeiras total % num_shards partições recebem uma unidade a mais,
+        de modo que a soma coincide com o total (num_shards nunca passa do
+        total, então nenhuma partição fica vazia).
+
+        Args:
+            total: Capacidade ou orçamento em bytes a dividir
+
+        Returns:
+            Lista com a parte de cada partição
+        """
+        base, extra = divmod(total, self.num_shards)
+        return [base + (1 if i < extra else 0) for i in range(self.num_shards)]
+
+    @staticmethod
+    def _empty_stats() -> Dict:
+        return {'hits': 0, 'misses': 0, 'total_time': 0}
+
+    def _shard_index(self, key: int) -> int:
+        """Retorna a partição responsável pela chave"""
+        return hash(key) % self.num_shards
+
+    def _check_algorithm(self, algorithm: str) -> None:
+        if algorithm not in self.algorithms:
+            raise ValueError(f"Algoritmo '{algorithm}' não disponível")
+
+    def get(self, key: int, algorithm: str) -> Optional[str]:
+        """
+        Recupera um item do cache usando o algoritmo especificado
+
+        Args:
+            key (int): Chave do item (ID do texto)
+            algorithm (str): Nome do algoritmo
+
+        Returns:
+            Optional[str]: Conteúdo do cache ou None se não encontrado
+        """
+        self._check_algorithm(algorithm)
+        index = self._shard_index(key)
+
+        with self.locks[algorithm][index]:
+            start_time = time.time()
+            result = self.shards[algorithm][index].get(key)
+            elapsed_time = time.time() - start_time
+
+            stats = self.shard_stats[algorithm][index]
+            if result is not None:
+                stats['hits'] += 1
+            else:
+                stats['misses'] += 1
+            stats['total_time'] += elapsed_time
+
+        return result
+
+    def _group_by_shard(self, keys: Iterable[int]) -> Dict[int, List[int]]:
+        """Agrupa as chaves pela partição responsável, preservando a ordem"""
+        groups = {}
+        for key in keys:
+            groups.setdefault(self._shard_index(key), []).append(key)
+        return groups
+
+    def get_many(self, keys: Iterable[int], algorithm: str) -> Dict[int, str]:
+        """
+        Recupera vários itens, adquirindo o lock de cada partição uma única vez
+
+        Args:
+            keys: IDs dos textos (cada um conta como uma requisição)
+            algorithm (str): Nome do algoritmo
+
+        Returns:
+            Dict[int, str]: ID -> conteúdo apenas dos itens encontrados
+        """
+        self._check_algorithm(algorithm)
+        keys = list(keys)
+
+        found = {}
+        for index, shard_keys in self._group_by_shard(keys).items():
+            with self.locks[algorithm][index]:
+                start_time = time.time()
+                shard_found = get_many(self.shards[algorithm][index], shard_keys)
+                elapsed_time = time.time() - start_time
+
+                stats = self.shard_stats[algorithm][index]
+                hits = sum(1 for key in shard_keys if key in shard_found)
+                stats['hits'] += hits
+                stats['misses'] += len(shard_keys) - hits
+                stats['total_time'] += elapsed_time
+            found.update(shard_found)
+
+        # Mesma ordem das chaves pedidas
+        return {key: found[key] for key in keys if key in found}
+
+    def put(self, key: int, value: str, algorithm: str) -> None:
+        """
+        Armazena um item no cache usando o algoritmo especificado
+
+        Args:
+            key (int): Chave do item (ID do texto)
+            value (str): Valor a armazenar (conteúdo do texto)
+            algorithm (str): Nome do algoritmo
+        """
+        self._check_algorithm(algorithm)
+        index = self._shard_index(key)
+
+        with self.locks[algorithm][index]:
+            self.shards[algorithm][index].put(key, value)
+
+    def put_many(self, items: Iterable[Tuple[int, str]], algorithm: str) -> None:
+        """
+        Armazena vários itens, adquirindo o lock de cada partição uma única vez
+
+        Args:
+            items: Pares (ID do texto, conteúdo) ou dicionário ID -> conteúdo
+            algorithm (str): Nome do algoritmo
+        """
+        self._check_algorithm(algorithm)
+        if isinstance(items, dict):
+            items = items.items()
+
+        groups = {}
+        for key, value in items:
+            groups.setdefault(self._shard_index(key), []).append((key, value))
+
+        for index, shard_items in groups.items():
+            with self.locks[algorithm][index]:
+                put_many(self.shards[algorithm][index], shard_items)
+
+    def contains(self, key: int, algorithm: str) -> bool:
+        """
+        Verifica se uma chave está no cache do algoritmo, sem contar como acesso
+
+        Args:
+            key (int): Chave do item (ID do texto)
+            algorithm (str): Nome do algoritmo
+
+        Returns:
+            bool: True se a chave está no cache
+        """
+        self._check_algorithm(algorithm)
+        index = self._shard_index(key)
+
+        with self.locks[algorithm][index]:
+            return self.shards[algorithm][index].contains(key)
+
+    def clear(self, algorithm: str = None) -> None:
+        """
+        Limpa o cache do algoritmo especificado ou todos
+
+        Args:
+            algorithm (str, optional): Nome do algoritmo ou None para todos
+        """
+        algorithms = [algorithm] if algorithm else list(self.shards)
+        for alg in algorithms:
+            if alg not in self.shards:
+                continue
+            for lock, shard in zip(self.locks[alg], self.shards[alg]):
+                with lock:
+                    shard.clear()
+
+    def invalidate(self, key: int, algorithm: str = None) -> int:
+        """
+        Remove uma única chave do cache do algoritmo especificado ou de todos
+
+        Args:
+            key (int): Chave do item (ID do texto)
+            algorithm (str, optional): Nome do algoritmo ou None para todos
+
+        Returns:
+            int: Número de caches que continham a chave
+        """
+        algorithms = [algorithm] if algorithm else list(self.shards)
+        index = self._shard_index(key)
+        removed = 0
+        for alg in algorithms:
+            self._check_algorithm(alg)
+            with self.locks[alg][index]:
+                if self.shards[alg][index].remove(key):
+                    removed += 1
+        return removed
+
+    def sweep_expired(self, max_per_shard: int = None) -> int:
+        """
+        Remove entradas vencidas das partições com expiração (TTLCache)
+
+        Cada partição é varrida sob o seu lock e remove no máximo
+        max_per_shard entradas, então uma varredura nunca bloqueia uma
+        partição por muito tempo.
+
+        Args:
+            max_per_shard (int, optional): Limite de remoções por partição (None = sem limite)
+
+        Returns:
+            int: Número total de entradas removidas
+        """
+        removed = 0
+        for alg in self.shards:
+            for lock, shard in zip(self.locks[alg], self.shards[alg]):
+                if not hasattr(shard, 'sweep'):
+                    continue
+                with lock:
+                    removed += shard.sweep(max_per_shard)
+        return removed
+
+    def snapshot_entries(self, algorithm: str) -> List[list]:
+        """
+        Lista as chaves do algoritmo (ordem de reinserção de cada partição)
+
+        Args:
+            algorithm (str): Nome do algoritmo
+
+        Returns:
+            List[list]: [chave, frequência ou None] para cada item do cache
+        """
+        self._check_algorithm(algorithm)
+        entries = []
+        for lock, shard in zip(self.locks[algorithm], self.shards[algorithm]):
+            with lock:
+                entries.extend(policy_entries(shard))
+        return entries
+
+    def restore_entries(self, algorithm: str, entries: Iterable[tuple]) -> int:
+        """
+        Reinsere entradas de um snapshot, preservando as que já estão no cache
+
+        Args:
+            algorithm (str): Nome do algoritmo
+            entries: Sequência de (chave, conteúdo, frequência ou None) na ordem salva
+
+        Returns:
+            int: Número de entradas reinseridas
+        """
+        self._check_algorithm(algorithm)
+        restored = 0
+        for key, value, frequency in entries:
+            index = self._shard_index(key)
+            with self.locks[algorithm][index]:
+                shard = self.shards[algorithm][index]
+                if not shard.contains(key):
+                    restore_entry(shard, key, value, frequency)
+                    restored += 1
+        return restored
+
+    def get_stats(self, algorithm: str = None) -> Dict:
+        """
+        Retorna estatísticas agregadas de todas as partições
+
+        Args:
+            algorithm (str, optional): Nome do algoritmo ou None para todos
+
+        Returns:
+            Dict: Estatísticas do algoritmo ou de todos
+        """
+        if algorithm:
+            return self._aggregate_stats(algorithm) if algorithm in self.shards else {}
+        return {alg: self._aggregate_stats(alg) for alg in self.shards}
+
+    def _aggregate_stats(self, algorithm: str) -> Dict:
+        """Soma as estatísticas das partições de um algoritmo"""
+        total = self._empty_stats()
+        for lock, stats in zip(self.locks[algorithm], self.shard_stats[algorithm]):
+            with lock:
+                for field in total:
+                    total[field] += stats[field]
+        return total
+
+    def get_cache_info(self, algorithm: str) -> Dict:
+        """
+        Retorna informações agregadas do cache
+
+        Args:
+            algorithm (str): Nome do algoritmo
+
+        Returns:
+            Dict: Informações do cache
+        """
+        if algorithm not in self.shards:
+            return {}
+
+        stats = self._aggregate_stats(algorithm)
+        size = capacity = bytes_used = 0
+        for lock, shard in zip(self.locks[algorithm], self.shards[algorithm]):
+            with lock:
+                size += shard.size()
+                capacity += shard.capacity
+                bytes_used += getattr(shard, 'current_bytes', 0)
+
+        total_requests = stats['hits'] + stats['misses']
+        hit_rate = (stats['hits'] / total_requests * 100) if total_requests > 0 else 0
+
+        return {
+            'algorithm': algorithm,
+            'size': size,
+            'capacity': capacity,
+            'max_bytes': getattr(self.algorithms[algorithm], 'max_bytes', None),
+            'bytes_used': bytes_used,
+            'hits': stats['hits'],
+            'misses': stats['misses'],
+            'hit_rate': hit_rate,
+            'total_time': stats['total_time'],
+            'avg_time': stats['total_time'] / total_requests if total_requests > 0 else 0,
+            'num_shards': self.num_shards
+        }
+
+    def get_shard_stats(self, algorithm: str) -> List[Dict]:
+        """
+        Retorna as estatísticas de cada partição da política
+
+        Args:
+            algorithm (str): Nome do algoritmo
+
+        Returns:
+            List[Dict]: get_stats() de cada partição
+        """
+        self._check_algorithm(algorithm)
+        result = []
+        for lock, shard in zip(self.locks[algorithm], self.shards[algorithm]):
+            with lock:
+                result.append(shard.get_stats())
+        return result
+
+    def reset_stats(self):
+        """Reinicia todas as estatísticas"""
+        for alg in self.shards:
+            for index, (lock, shard) in enumerate(zip(self.locks[alg], self.shards[alg])):
+                with lock:
+                    self.shard_stats[alg][index] = self._empty_stats()
+                    if hasattr(shard, 'reset_stats'):
+                        shard.reset_stats()
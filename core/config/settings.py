@@ -10,22 +10,86 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent
 
 # Configurações de cache
 CACHE_SIZE = 10  # Máximo de 10 textos no cache, conforme especificado
+CACHE_MAX_BYTES = None  # Orçamento de memória em bytes por cache (None = apenas limite de itens)
+CACHE_COMPRESSION = None  # Comprimir os textos no cache: None, 'zlib' ou 'lzma'
 DEFAULT_ALGORITHM = 'FIFO'  # Algoritmo padrão para uso normal
+# Envelhecimento do LFU: a cada decay_interval acessos as frequências são
+# multiplicadas por decay_factor (None = frequências nunca diminuem)
+LFU_AGING = {'decay_interval': None, 'decay_factor': 0.5}
+# Relógio usado para registrar acessos/inserções: 'logical' (contador, sem
+# chamadas ao sistema) ou 'wall' (time.time, para TTL e diagnóstico)
+CACHE_CLOCK = 'logical'
 
 # Diretórios
 TEXT_DIR = PROJECT_ROOT / "texts"
+# Backend de leitura dos textos: 'files' (str por leitura), 'mmap' (memoryview sem cópia)
+# ou 'packed' (corpus em arquivo único com índice, gerado por core/packed_corpus.py)
+TEXT_BACKEND = 'files'
+MMAP_MAX_OPEN_MAPS = 256  # Mapeamentos mantidos abertos pelo backend 'mmap' (cada um usa um descritor)
+PACKED_CORPUS_FILE = PROJECT_ROOT / "texts.pack"
+# Conferir o mtime de cada texto ao abrir o corpus (O(N) stats na inicialização); sem
+# isso, textos editados exigem "python -m core.packed_corpus --verify" ou regerar o corpus
+PACKED_CORPUS_VERIFY = False
 DOCS_DIR = PROJECT_ROOT / "docs"
+
+# Cache L2 em disco local (sqlite) para os textos removidos do cache em memória
+L2_CACHE = {
+    'enabled': False,
+    'path': PROJECT_ROOT / "cache" / "l2_cache.sqlite",
+    'max_entries': 1000,
+    'max_bytes': None  # None = apenas limite de entradas
+}
 GRAPHS_DIR = DOCS_DIR / "graficos"
 
+# Snapshot das chaves em cache, salvo ao encerrar e usado para aquecer o cache
+# em segundo plano na próxima inicialização
+CACHE_SNAPSHOT = {
+    'enabled': False,
+    'path': PROJECT_ROOT / "cache" / "snapshot.json.gz",
+    'max_workers': 4  # Textos recarregados em paralelo durante o aquecimento
+}
+
+# Expiração das entradas do cache em memória (TTLCache)
+CACHE_TTL = {
+    'enabled': False,
+    'default_ttl': None,           # Tempo de vida em segundos (None = sem prazo)
+    'revalidate_interval': 2.0,    # Segundos entre checagens do mtime do arquivo (None = não checar)
+    'sweep_interval': 5.0,         # Segundos entre varreduras em segundo plano
+    'sweep_batch': 64              # Máximo de remoções por partição a cada varredura
+}
+
+# Pré-carregamento dos próximos textos prováveis (core/prefetcher.py)
+PREFETCH = {
+    'enabled': False,
+    'max_predictions': 2,          # Textos previstos considerados a cada acesso
+    'min_confidence': 0.3,         # Confiança mínima de uma transição aprendida
+    'max_inflight': 2,             # Cargas em segundo plano simultâneas
+    'max_bytes_per_second': None   # Orçamento de banda (None = sem limite)
+}
+
 # Configurações de simulação
 SIMULATION_CONFIG = {
     'requests_per_user': 200,
-    'algorithms': ['FIFO', 'LRU', 'LFU', 'MRU'],
+    'algorithms': ['FIFO', 'LRU', 'LFU', 'MRU', 'ARC', 'WTinyLFU', '2Q', 'LIRS',
+                   'CLOCK', 'CLOCKPro'],
     'user_scenarios': [
         {'user_id': 1, 'distribution': 'uniform'},
         {'user_id': 2, 'distribution': 'poisson'},
         {'user_id': 3, 'distribution': 'weighted'}
-    ]
+    ],
+    # Execução paralela das combinações algoritmo × cenário (ProcessPoolExecutor)
+    'parallel': False,
+    'max_workers': None,  # None = número de CPUs disponíveis
+    # Reproduzir o mesmo trace de requisições de cada cenário em todos os algoritmos
+    'trace_replay': True,
+    'trace_dir': None,  # Diretório para salvar/carregar traces (None = apenas em memória)
+    # Motor de simulação: 'full' carrega textos pelo TextManager a cada miss;
+    # 'metadata' executa as políticas apenas sobre as chaves e estima a latência
+    'engine': 'full',
+    'record_request_details': True,  # Registrar detalhes por requisição no motor 'metadata'
+    # Curva completa do ótimo (OPT) por capacidade: uma reprodução por capacidade, cara
+    # para corpora grandes; sem ela, o OPT é calculado só no tamanho de cache configurado
+    'opt_curve': False
 }
 
 # Configurações específicas das distribuições
@@ -47,6 +111,12 @@ DISK_DELAY_SIMULATION = {
     'max_delay': 0.02       # Delay máximo em segundos
 }
 
+# Cargas em lote (TextManager.iter_load/load_many): leituras simultâneas;
+# com 100 threads o corpus inteiro é lido em uma rodada de atraso do disco
+BULK_LOAD = {
+    'max_workers': 100
+}
+
 # Configurações de relatórios
 REPORT_CONFIG = {
     'save_graphs': True,
@@ -0,0 +1,86 @@
+"""
+Varredura periódica de entradas vencidas
+Thread em segundo plano que remove, em lotes limitados, as entradas com TTL
+vencido de um ConcurrentCacheManager
+"""
+
+import threading
+from typing import Any, Optional
+
+
+class ExpirySweeper:
+    """
+    Chama cache_manager.sweep_expired(batch_size) a cada interval segundos
+
+    A expiração no acesso (TTLCache.get) já garante que nada vencido é
+    retornado; a varredura só libera a memória de entradas vencidas que não
+    voltam a ser pedidas. Cada partição é varrida sob o próprio lock e com no
+    máximo batch_size remoções por rodada.
+    """
+
+    def __init__(self, cache_manager: Any, interval: float = 5.0, batch_size: Optional[int] = 64):
+        """
+        Inicializa o varredor
+
+        Args:
+            cache_manager: Gerenciador com sweep_expired (ConcurrentCacheManager)
+            interval (float): Segundos entre varreduras
+            batch_size (int, optional): Máximo de remoções por partição a cada rodada
+        """
+        if interval <= 0:
+            raise ValueError("interval deve ser positivo")
+
+        self.cache_manager = cache_manager
+        self.interval = interval
+        self.batch_size = batch_size
+        self._stop_event = threading.Event()
+        self._thread = None
+        self.sweep_count = 0
+        self.removed_count = 0
+
+    def start(self) -> None:
+        """Inicia a thread de varredura (daemon); não faz nada se já estiver ativa"""
+        if self.is_running():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="expiry-sweeper", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Interrompe a thread de varredura
+
+        Args:
+            timeout (float, optional): Tempo máximo de espera pelo término
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def is_running(self) -> bool:
+        """Verifica se a thread de varredura está ativa"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def sweep_once(self) -> int:
+        """
+        Executa uma rodada de varredura na thread atual
+
+        Returns:
+            int: Número de entradas removidas
+        """
+        removed = self.cache_manager.sweep_expired(self.batch_size)
+        self.sweep_count += 1
+        self.removed_count += removed
+        return removed
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            self.sweep_once()
+
+    def __enter__(self) -> 'ExpirySweeper':
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
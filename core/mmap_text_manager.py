@@ -0,0 +1,153 @@
+"""
+Backend de textos com mapeamento em memória (mmap)
+Entrega fatias memoryview dos arquivos mapeados em vez de decodificar cada
+texto em uma nova str; a decodificação acontece apenas na exibição
+"""
+
+import mmap
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from core.config import settings
+from core.text_manager import TextManager
+
+
+class MmapTextManager(TextManager):
+    """
+    TextManager que mapeia os arquivos de texto em memória
+
+    Cada arquivo é mapeado na primeira leitura e os textos são entregues como
+    memoryview sobre o mapeamento, sem cópia. As páginas são compartilhadas com
+    o cache de páginas do sistema operacional, então manter vários textos
+    grandes no cache não duplica sua memória residente.
+
+    Como cada mapeamento ocupa um descritor de arquivo, no máximo max_maps
+    ficam abertos (LRU); os removidos são fechados assim que nenhuma
+    memoryview os referencia. Se o mtime do arquivo mudar, ele é remapeado.
+
+    Os arquivos não devem ser truncados enquanto mapeados.
+    """
+
+    def __init__(self, texts_directory, max_maps=None):
+        """
+        Inicializa o backend
+
+        Args:
+            texts_directory: Diretório dos textos
+            max_maps (int, optional): Mapeamentos abertos (None = settings.MMAP_MAX_OPEN_MAPS)
+        """
+        self.max_maps = max_maps or settings.MMAP_MAX_OPEN_MAPS
+        self._maps = OrderedDict()  # ID -> (mtime, mapeamento)
+        self._maps_lock = threading.Lock()
+        super().__init__(texts_directory)
+
+    def _get_view(self, text_id, text_file):
+        """
+        Retorna uma memoryview do arquivo, mapeando-o na primeira leitura ou se ele mudou
+
+        A view é criada sob o lock, antes que outra thread possa fechar o
+        mapeamento ao removê-lo do conjunto aberto.
+
+        Args:
+            text_id (int): ID do texto
+            text_file (Path): Caminho do arquivo
+
+        Returns:
+            memoryview: Bytes do arquivo (vazia para arquivo vazio)
+        """
+        mtime = os.stat(text_file).st_mtime_ns
+
+        with self._maps_lock:
+            cached = self._maps.get(text_id)
+            if cached is not None:
+                if cached[0] == mtime:
+                    self._maps.move_to_end(text_id)
+                    return self._view(cached[1])
+                # Arquivo substituído: descartar o mapeamento antigo
+                del self._maps[text_id]
+                self._release(cached[1])
+
+            with open(text_file, 'rb') as f:
+                try:
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:
+                    # Arquivos vazios não podem ser mapeados
+                    mapped = None
+
+            self._maps[text_id] = (mtime, mapped)
+            view = self._view(mapped)
+            while len(self._maps) > self.max_maps:
+                _, (_, evicted) = self._maps.popitem(last=False)
+                self._release(evicted)
+            return view
+
+    @staticmethod
+    def _view(mapped):
+        return memoryview(mapped) if mapped is not None else memoryview(b'')
+
+    @staticmethod
+    def _release(mapped):
+        """
+        Fecha um mapeamento que saiu do conjunto aberto
+
+        Se ainda houver memoryviews exportadas (ex.: textos no cache), o
+        mapeamento é fechado pelo próprio mmap quando a última delas for liberada.
+        """
+        if mapped is None:
+            return
+        try:
+            mapped.close()
+        except BufferError:
+            pass
+
+    def _read_text_file(self, text_id, text_file):
+        """
+        Retorna o texto como memoryview sobre o arquivo mapeado
+
+        Args:
+            text_id (int): ID do texto
+            text_file (Path): Caminho do arquivo
+
+        Returns:
+            memoryview: Bytes UTF-8 do texto ou None em caso de erro
+        """
+        try:
+            start_time = time.perf_counter()
+            content = self._get_view(text_id, text_file)
+
+            self._record_read(time.perf_counter() - start_time)
+            return content
+        except Exception as e:
+            print(f"Erro ao carregar texto {text_id}: {e}")
+            return None
+
+    def close(self):
+        """
+        Libera os mapeamentos que não estão mais referenciados
+
+        Mapeamentos ainda exportados por memoryviews vivas (por exemplo, textos
+        no cache) permanecem abertos até serem liberados.
+        """
+        with self._maps_lock:
+            for text_id, (_, mapped) in list(self._maps.items()):
+                if mapped is None:
+                    del self._maps[text_id]
+                    continue
+                try:
+                    mapped.close()
+                    del self._maps[text_id]
+                except BufferError:
+                    pass
+
+    def __getstate__(self):
+        # Mapeamentos e locks não são serializáveis (simulação multiprocesso)
+        state = super().__getstate__()
+        state['_maps'] = OrderedDict()
+        del state['_maps_lock']
+        return state
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self._maps_lock = threading.Lock()
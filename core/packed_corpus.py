@@ -0,0 +1,321 @@
+"""
+Corpus compactado em arquivo único com índice de offsets
+Empacota os textos de texts/ em um só arquivo e oferece um backend de
+TextManager que lê dele com um único descritor aberto e pread
+
+Formato (little-endian):
+    cabeçalho: magic (8 bytes), versão (uint32), número de textos (uint32)
+    índice:    uma entrada por texto, ordenada por ID:
+               ID (uint32), offset (uint64), tamanho (uint32), CRC32 (uint32)
+    dados:     conteúdo UTF-8 dos textos, concatenado
+"""
+
+import os
+import sys
+import struct
+import threading
+import zlib
+from pathlib import Path
+
+from core.text_manager import TEXT_FILE_PATTERN, TextManager
+
+PACK_MAGIC = b'RA2PACK\x00'
+PACK_VERSION = 1
+HEADER_FORMAT = '<8sII'
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+INDEX_ENTRY_FORMAT = '<IQII'
+INDEX_ENTRY_SIZE = struct.calcsize(INDEX_ENTRY_FORMAT)
+
+
+def build_packed_corpus(texts_directory, output_path):
+    """
+    Empacota todos os textos "<id>.txt" de um diretório em um único arquivo
+
+    Args:
+        texts_directory: Diretório dos textos
+        output_path: Caminho do arquivo compactado a gerar
+
+    Returns:
+        Path: Caminho do arquivo gerado
+    """
+    texts_directory = Path(texts_directory)
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    text_files = []
+    with os.scandir(texts_directory) as entries:
+        for entry in entries:
+            match = TEXT_FILE_PATTERN.match(entry.name)
+            if match and entry.is_file():
+                text_files.append((int(match.group(1)), entry.path))
+    text_files.sort()
+
+    data_offset = HEADER_SIZE + len(text_files) * INDEX_ENTRY_SIZE
+    index = bytearray()
+    offset = data_offset
+
+    # Escrever em arquivo temporário e renomear ao final (atômico)
+    temp_path = output_path.with_suffix(output_path.suffix + '.tmp')
+    with open(temp_path, 'wb') as out:
+        out.write(b'\x00' * data_offset)  # Reservar cabeçalho e índice
+
+        for text_id, path in text_files:
+            with open(path, 'rb') as f:
+                data = f.read()
+            out.write(data)
+            index += struct.pack(INDEX_ENTRY_FORMAT, text_id, offset, len(data), zlib.crc32(data))
+            offset += len(data)
+
+        out.seek(0)
+        out.write(struct.pack(HEADER_FORMAT, PACK_MAGIC, PACK_VERSION, len(text_files)))
+        out.write(index)
+
+    os.replace(temp_path, output_path)
+    # Marcar o corpus como posterior ao rename (o corpus pode estar no próprio diretório dos textos)
+    os.utime(output_path)
+    return output_path
+
+
+def is_packed_corpus_stale(texts_directory, pack_path, check_files=False):
+    """
+    Verifica se o corpus compactado precisa ser regerado
+
+    O corpus está desatualizado se não existir ou se o diretório (textos
+    adicionados/removidos) for mais recente que ele. Editar um texto existente
+    não altera o mtime do diretório; para detectar isso, check_files compara
+    também cada texto, ao custo de um stat por arquivo.
+
+    Args:
+        texts_directory: Diretório dos textos
+        pack_path: Caminho do corpus compactado
+        check_files (bool): Conferir também o mtime de cada texto (O(N))
+
+    Returns:
+        bool: True se o corpus deve ser regerado
+    """
+    pack_path = Path(pack_path)
+    if not pack_path.exists():
+        return True
+
+    pack_mtime = pack_path.stat().st_mtime_ns
+    if os.stat(texts_directory).st_mtime_ns > pack_mtime:
+        return True
+    if not check_files:
+        return False
+
+    with os.scandir(texts_directory) as entries:
+        for entry in entries:
+            if (TEXT_FILE_PATTERN.match(entry.name) and entry.is_file()
+                    and entry.stat().st_mtime_ns > pack_mtime):
+                return True
+    return False
+
+
+class PackedTextManager(TextManager):
+    """
+    TextManager que lê os textos de um corpus compactado
+
+    O arquivo é aberto uma única vez; o cabeçalho e o índice são lidos com duas
+    chamadas pread na inicialização (sem stat por texto) e cada carga é uma
+    única pread no offset indexado.
+    """
+
+    def __init__(self, pack_path, verify_checksums=True):
+        """
+        Inicializa o backend
+
+        Args:
+            pack_path: Caminho do corpus gerado por build_packed_corpus
+            verify_checksums (bool): Validar o CRC32 de cada texto lido
+        """
+        self.pack_path = Path(pack_path)
+        self.texts_dir = self.pack_path.parent
+        self.verify_checksums = verify_checksums
+
+        # Estatísticas de leitura do disco
+        self.total_read_time = 0.0
+        self.disk_reads = 0
+        self._stats_lock = threading.Lock()
+
+        self._open()
+
+    def _open(self):
+        """Abre o corpus e carrega cabeçalho e índice"""
+        self._fd = os.open(self.pack_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        self._seek_lock = threading.Lock()
+
+        magic, version, count = struct.unpack(HEADER_FORMAT, self._pread(HEADER_SIZE, 0))
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            os.close(self._fd)
+            raise ValueError(f"Corpus compactado inválido: {self.pack_path}")
+
+        self.text_count = count
+        self._index = self._pread(count * INDEX_ENTRY_SIZE, HEADER_SIZE)
+        self._first_id = self._entry(0)[0] if count else 0
+        self._mtime = os.fstat(self._fd).st_mtime
+
+    def _pread(self, length, offset):
+        """Lê length bytes a partir de offset sem alterar a posição do arquivo"""
+        if hasattr(os, 'pread'):
+            return os.pread(self._fd, length, offset)
+
+        # Windows não tem pread: serializar seek + read
+        with self._seek_lock:
+            os.lseek(self._fd, offset, os.SEEK_SET)
+            return os.read(self._fd, length)
+
+    def _entry(self, position):
+        """Retorna a entrada (id, offset, tamanho, crc) na posição do índice"""
+        return struct.unpack_from(INDEX_ENTRY_FORMAT, self._index, position * INDEX_ENTRY_SIZE)
+
+    def _resolve_text_file(self, text_id):
+        """
+        Localiza um texto no índice
+
+        Para IDs contíguos a entrada está na posição text_id - primeiro ID (O(1));
+        caso contrário usa busca binária.
+
+        Args:
+            text_id (int): ID do texto
+
+        Returns:
+            tuple: Entrada (id, offset, tamanho, crc) ou None se não existe
+        """
+        if not self.text_count:
+            return None
+
+        guess = text_id - self._first_id
+        if 0 <= guess < self.text_count:
+            entry = self._entry(guess)
+            if entry[0] == text_id:
+                return entry
+
+        low, high = 0, self.text_count - 1
+        while low <= high:
+            middle = (low + high) // 2
+            entry = self._entry(middle)
+            if entry[0] == text_id:
+                return entry
+            if entry[0] < text_id:
+                low = middle + 1
+            else:
+                high = middle - 1
+        return None
+
+    def _read_file(self, entry):
+        """Lê e decodifica o texto de uma entrada do índice"""
+        text_id, offset, length, checksum = entry
+        data = self._pread(length, offset)
+
+        if self.verify_checksums and zlib.crc32(data) != checksum:
+            raise ValueError(f"Checksum inválido para o texto {text_id}")
+
+        return data.decode('utf-8')
+
+    def get_text_info(self, text_id):
+        """
+        Retorna informações sobre um texto sem carregá-lo
+
+        Args:
+            text_id (int): ID do texto
+
+        Returns:
+            dict: Informações do texto ou None
+        """
+        entry = self._resolve_text_file(text_id)
+        if entry is None:
+            return None
+
+        return {
+            'id': text_id,
+            'filename': f"{self.pack_path.name}#{text_id}",
+            'size_bytes': entry[2],
+            'modified_time': self._mtime,
+            'offset': entry[1],
+            'checksum': entry[3]
+        }
+
+    def refresh_index(self):
+        """
+        Relê o cabeçalho e o índice do corpus (ex.: depois de regerá-lo)
+
+        Substitui a varredura de diretório do TextManager: aqui os IDs vêm
+        do índice gravado no próprio arquivo.
+
+        Returns:
+            int: Número de textos no corpus
+        """
+        self.close()
+        self._open()
+        return self.text_count
+
+    def _is_indexed(self, text_id):
+        """Verifica se um ID está no índice do corpus"""
+        return self._resolve_text_file(text_id) is not None
+
+    def has_text(self, text_id):
+        """
+        Verifica se um texto está no índice do corpus
+
+        Args:
+            text_id (int): ID do texto
+
+        Returns:
+            bool: True se o texto existe
+        """
+        return self._is_indexed(text_id)
+
+    def get_id_range(self):
+        """
+        Retorna o menor e o maior ID do corpus
+
+        Returns:
+            tuple: (primeiro ID, último ID) ou None se o corpus está vazio
+        """
+        if not self.text_count:
+            return None
+        return self._first_id, self._entry(self.text_count - 1)[0]
+
+    def list_available_texts(self):
+        """
+        Lista todos os textos disponíveis (a partir do índice)
+
+        Returns:
+            list: Lista de IDs dos textos disponíveis
+        """
+        return [self._entry(position)[0] for position in range(self.text_count)]
+
+    def close(self):
+        """Fecha o descritor do corpus"""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __getstate__(self):
+        # Descritores e locks não são serializáveis (simulação multiprocesso)
+        state = super().__getstate__()
+        for field in ('_fd', '_seek_lock', '_index'):
+            state.pop(field, None)
+        return state
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self._open()
+
+
+if __name__ == "__main__":
+    from core.config import settings
+
+    # Uso: python -m core.packed_corpus [--verify] [diretório] [corpus]
+    # Com --verify, confere cada texto e só regera o corpus se algum mudou
+    args = sys.argv[1:]
+    verify = '--verify' in args
+    args = [arg for arg in args if arg != '--verify']
+    source = args[0] if len(args) > 0 else settings.TEXT_DIR
+    target = args[1] if len(args) > 1 else settings.PACKED_CORPUS_FILE
+
+    if verify and not is_packed_corpus_stale(source, target, check_files=True):
+        print(f"Corpus compactado atualizado: {target}")
+    else:
+        path = build_packed_corpus(source, target)
+        print(f"Corpus compactado gerado: {path}")
@@ -0,0 +1,331 @@
+"""
+Pré-carregamento (read-ahead) de textos
+Aprende as transições entre IDs de textos (tabela de Markov de primeira ordem
+e detecção de passo constante) e aquece o cache em segundo plano com os
+próximos textos prováveis, dentro de um orçamento de banda
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from algorithms.cache_utils import default_sizer
+from algorithms.timing import Clock, WallClock
+
+
+class AccessPredictor:
+    """
+    Preditor do próximo texto a partir do histórico de acessos
+
+    Combina duas fontes:
+
+    - Markov de primeira ordem: para cada texto, contagem dos textos pedidos
+      logo em seguida (no máximo max_successors por texto, descartando o menos
+      frequente), com confiança = contagem / total;
+    - passo constante: se os dois últimos saltos foram iguais (ex.: 4, 5, 6),
+      os próximos IDs da sequência são previstos com confiança 1, 1/2, 1/3...
+    """
+
+    def __init__(self, max_successors: int = 8):
+        """
+        Inicializa o preditor
+
+        Args:
+            max_successors (int): Máximo de sucessores guardados por texto
+        """
+        self.max_successors = max_successors
+        self.transitions = {}  # texto -> {próximo texto: contagem}
+        self.last_key = None
+        self.last_stride = None
+        self.stride_confirmed = False
+
+    def record(self, key: int) -> None:
+        """
+        Registra um acesso
+
+        Args:
+            key (int): ID do texto acessado
+        """
+        last_key = self.last_key
+        if last_key is not None:
+            successors = self.transitions.setdefault(last_key, {})
+            successors[key] = successors.get(key, 0) + 1
+            if len(successors) > self.max_successors:
+                weakest = min(successors, key=successors.__getitem__)
+                del successors[weakest]
+
+            stride = key - last_key
+            self.stride_confirmed = stride != 0 and stride == self.last_stride
+            self.last_stride = stride
+
+        self.last_key = key
+
+    def train(self, history: Iterable[int]) -> None:
+        """
+        Aprende com um histórico completo (ex.: UserSimulator.access_history)
+
+        Args:
+            history: Sequência de IDs de textos na ordem de acesso
+        """
+        for key in history:
+            self.record(key)
+
+    def predict(self, key: int, max_predictions: int = 2,
+                min_confidence: float = 0.3) -> List[Tuple[int, float]]:
+        """
+        Prevê os próximos textos depois de key
+
+        Args:
+            key (int): Texto acessado agora
+            max_predictions (int): Máximo de previsões
+            min_confidence (float): Confiança mínima de uma previsão de Markov
+
+        Returns:
+            Lista de (ID do texto, confiança) em ordem decrescente de confiança
+        """
+        candidates = {}
+
+        successors = self.transitions.get(key)
+        if successors:
+            total = sum(successors.values())
+            for successor, count in successors.items():
+                confidence = count / total
+                if confidence >= min_confidence and successor != key:
+                    candidates[successor] = confidence
+
+        if self.stride_confirmed and key == self.last_key:
+            for step in range(1, max_predictions + 1):
+                successor = key + step * self.last_stride
+                candidates[successor] = max(candidates.get(successor, 0.0), 1.0 / step)
+
+        ranked = sorted(candidates.items(), key=lambda item: item[1], reverse=True)
+        return ranked[:max_predictions]
+
+    def reset(self) -> None:
+        """Esquece todo o histórico"""
+        self.transitions.clear()
+        self.last_key = None
+        self.last_stride = None
+        self.stride_confirmed = False
+
+
+class Prefetcher:
+    """
+    Aquece o cache em segundo plano com os textos previstos
+
+    A cada acesso de demanda (on_access) o preditor é atualizado e os textos
+    previstos que não estão no cache são carregados por um pool de threads
+    limitado a max_inflight cargas simultâneas. O orçamento de banda
+    (max_bytes_per_second) é um balde de fichas: enquanto o saldo estiver
+    negativo, novas previsões são descartadas.
+
+    Métricas:
+
+    - accuracy: fração dos textos pré-carregados que foram usados (hit de demanda)
+    - coverage: fração dos misses que o pré-carregamento evitou
+      (usados / (usados + misses de demanda))
+    - pollution: textos pré-carregados que saíram do cache sem serem usados
+    """
+
+    def __init__(self, cache_manager: Any, loader: Callable[[int, str], Any],
+                 predictor: Optional[AccessPredictor] = None,
+                 max_predictions: int = 2, min_confidence: float = 0.3,
+                 max_inflight: int = 2, max_bytes_per_second: Optional[float] = None,
+                 clock: Optional[Clock] = None, max_tracked: int = 1024):
+        """
+        Inicializa o pré-carregador
+
+        Args:
+            cache_manager: Gerenciador de cache (com contains)
+            loader: Função (ID do texto, algoritmo) -> conteúdo que carrega e insere no cache
+            predictor (AccessPredictor, optional): Preditor (None = novo preditor)
+            max_predictions (int): Previsões consideradas por acesso
+            min_confidence (float): Confiança mínima para pré-carregar
+            max_inflight (int): Máximo de cargas em segundo plano simultâneas
+            max_bytes_per_second (float, optional): Orçamento de banda (None = sem limite)
+            clock (optional): Relógio do orçamento (None = WallClock monotônico)
+            max_tracked (int): Máximo de textos pré-carregados acompanhados para as métricas
+        """
+        if max_inflight < 1:
+            raise ValueError("max_inflight deve ser pelo menos 1")
+
+        self.cache_manager = cache_manager
+        self.loader = loader
+        self.predictor = predictor or AccessPredictor()
+        self.max_predictions = max_predictions
+        self.min_confidence = min_confidence
+        self.max_inflight = max_inflight
+        self.max_bytes_per_second = max_bytes_per_second
+        self.clock = clock or WallClock(time.monotonic)
+        self.max_tracked = max_tracked
+
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_inflight, thread_name_prefix="prefetch")
+        self._futures = set()
+        self._inflight = set()  # (texto, algoritmo) em carga
+        self._pending = OrderedDict()  # (texto, algoritmo) pré-carregados ainda não usados
+
+        # Balde de fichas em bytes
+        self._tokens = max_bytes_per_second or 0.0
+        self._last_refill = self.clock.now()
+
+        self._reset_counters()
+
+    def _reset_counters(self) -> None:
+        self.issued = 0
+        self.useful = 0
+        self.polluting = 0
+        self.demand_misses = 0
+        self.skipped_budget = 0
+        self.failed = 0
+        self.prefetched_bytes = 0
+
+    def on_access(self, key: int, algorithm: str, was_hit: bool) -> List[int]:
+        """
+        Registra um acesso de demanda e agenda o pré-carregamento dos próximos textos
+
+        Args:
+            key (int): ID do texto pedido pelo usuário
+            algorithm (str): Algoritmo de cache em uso
+            was_hit (bool): Se o acesso foi hit no cache
+
+        Returns:
+            List[int]: Textos agendados para pré-carregamento
+        """
+        with self._lock:
+            self.predictor.record(key)
+            if self._pending.pop((key, algorithm), None) is not None:
+                if was_hit:
+                    self.useful += 1
+                else:
+                    # Pré-carregado mas removido antes de ser usado
+                    self.polluting += 1
+                    self.demand_misses += 1
+            elif not was_hit:
+                self.demand_misses += 1
+            predictions = self.predictor.predict(key, self.max_predictions, self.min_confidence)
+
+        scheduled = []
+        for candidate, _ in predictions:
+            if self._schedule(candidate, algorithm):
+                scheduled.append(candidate)
+        return scheduled
+
+    def _refill(self) -> None:
+        """Repõe as fichas do orçamento de banda (chamado com o lock)"""
+        now = self.clock.now()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        if self.max_bytes_per_second is not None:
+            self._tokens = min(self.max_bytes_per_second,
+                               self._tokens + elapsed * self.max_bytes_per_second)
+
+    def _schedule(self, key: int, algorithm: str) -> bool:
+        """Agenda uma carga em segundo plano se houver orçamento e ela for necessária"""
+        item = (key, algorithm)
+        with self._lock:
+            if item in self._inflight or item in self._pending:
+                return False
+            if len(self._inflight) >= self.max_inflight:
+                self.skipped_budget += 1
+                return False
+            self._refill()
+            if self.max_bytes_per_second is not None and self._tokens <= 0:
+                self.skipped_budget += 1
+                return False
+
+        if self.cache_manager.contains(key, algorithm):
+            return False
+
+        with self._lock:
+            if item in self._inflight or len(self._inflight) >= self.max_inflight:
+                return False
+            self._inflight.add(item)
+            future = self._executor.submit(self._warm, key, algorithm)
+            self._futures.add(future)
+        future.add_done_callback(self._discard_future)
+        return True
+
+    def _discard_future(self, future) -> None:
+        with self._lock:
+            self._futures.discard(future)
+
+    def _warm(self, key: int, algorithm: str) -> None:
+        """Carrega um texto previsto (executa no pool de threads)"""
+        try:
+            content = self.loader(key, algorithm)
+        except Exception:
+            content = None
+
+        with self._lock:
+            self._inflight.discard((key, algorithm))
+            if not content:
+                self.failed += 1
+                return
+
+            size = default_sizer(content)
+            self.issued += 1
+            self.prefetched_bytes += size
+            if self.max_bytes_per_second is not None:
+                self._tokens -= size
+
+            self._pending[(key, algorithm)] = True
+            while len(self._pending) > self.max_tracked:
+                self._pending.popitem(last=False)
+
+    def drain(self, timeout: Optional[float] = None) -> None:
+        """
+        Aguarda as cargas em segundo plano em andamento
+
+        Args:
+            timeout (float, optional): Tempo máximo de espera
+        """
+        with self._lock:
+            futures = list(self._futures)
+        wait(futures, timeout)
+
+    def close(self) -> None:
+        """Encerra o pool de threads (aguarda as cargas em andamento)"""
+        self._executor.shutdown(wait=True)
+
+    def get_stats(self) -> Dict:
+        """
+        Retorna as métricas do pré-carregamento
+
+        Returns:
+            Dict: Cargas emitidas, úteis, acurácia, cobertura e poluição
+        """
+        with self._lock:
+            pending = list(self._pending)
+            stats = {
+                'issued': self.issued,
+                'useful': self.useful,
+                'demand_misses': self.demand_misses,
+                'skipped_budget': self.skipped_budget,
+                'failed': self.failed,
+                'prefetched_bytes': self.prefetched_bytes,
+                'inflight': len(self._inflight)
+            }
+            polluting = self.polluting
+
+        # Pré-carregados ainda não usados que já saíram do cache também poluíram
+        evicted_unused = sum(1 for key, algorithm in pending
+                             if not self.cache_manager.contains(key, algorithm))
+        stats['polluting'] = polluting + evicted_unused
+        stats['pending'] = len(pending) - evicted_unused
+
+        issued = stats['issued']
+        useful = stats['useful']
+        stats['accuracy'] = (useful / issued * 100) if issued > 0 else 0
+        stats['coverage'] = (useful / (useful + stats['demand_misses']) * 100
+                             if useful + stats['demand_misses'] > 0 else 0)
+        stats['pollution'] = (stats['polluting'] / issued * 100) if issued > 0 else 0
+        return stats
+
+    def reset_stats(self) -> None:
+        """Reinicia as métricas (mantém o que o preditor aprendeu)"""
+        with self._lock:
+            self._reset_counters()
+            self._pending.clear()
@@ -0,0 +1,104 @@
+"""
+Coalescência de requisições (single-flight)
+Garante que chamadas simultâneas para a mesma chave executem a carga uma única vez
+"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+
+class _Call:
+    """Carga em andamento para uma chave"""
+
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Agrupa chamadas concorrentes para a mesma chave
+
+    A primeira thread que pede uma chave executa a função (líder); as demais que
+    chegarem enquanto a carga está em andamento aguardam e recebem o mesmo
+    resultado (ou a mesma exceção).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.call_count = 0
+        self.execution_count = 0
+        self.coalesced_count = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Executa fn uma única vez por chave entre as chamadas simultâneas
+
+        Args:
+            key: Chave que identifica a carga
+            fn: Função sem argumentos que realiza a carga
+
+        Returns:
+            Tuple[Any, bool]: (resultado, True se o resultado foi compartilhado
+            com outra chamada em andamento)
+        """
+        with self._lock:
+            self.call_count += 1
+            call = self._calls.get(key)
+            if call is not None:
+                self.coalesced_count += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self.execution_count += 1
+                leader = True
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+        return call.result, False
+
+    def in_flight(self) -> int:
+        """Retorna o número de cargas em andamento"""
+        with self._lock:
+            return len(self._calls)
+
+    def get_stats(self) -> Dict:
+        """
+        Retorna estatísticas de coalescência
+
+        Returns:
+            Dict: Chamadas, execuções reais e requisições coalescidas
+        """
+        with self._lock:
+            return {
+                'calls': self.call_count,
+                'executions': self.execution_count,
+                'coalesced': self.coalesced_count,
+                'in_flight': len(self._calls)
+            }
+
+    def reset_stats(self) -> None:
+        """Reinicia as estatísticas"""
+        with self._lock:
+            self.call_count = 0
+            self.execution_count = 0
+            self.coalesced_count = 0
@@ -13,6 +13,26 @@ sys.path.append(str(project_root))
 from algorithms.fifo_cache import FIFOCache
 from algorithms.lru_cache import LRUCache
 from algorithms.lfu_cache import LFUCache
+from algorithms.mru_cache import MRUCache
+from algorithms.arc_cache import ARCCache
+from algorithms.wtinylfu_cache import WTinyLFUCache, CountMinSketch
+from algorithms.two_queue_cache import TwoQueueCache
+from algorithms.lirs_cache import LIRSCache
+from algorithms.clock_cache import CLOCKCache
+from algorithms.clock_pro_cache import CLOCKProCache
+from algorithms.opt_cache import OPTCache, compute_next_uses, NEVER
+from algorithms.compressed_cache import CompressedCache
+from algorithms.ttl_cache import TTLCache
+from algorithms.timing import LogicalClock, WallClock
+from algorithms.cache_utils import get_many, new_cache_like, put_many
+from core.config.settings import SIMULATION_CONFIG
+
+# Políticas configuradas para a simulação (nome -> classe)
+POLICY_CLASSES = {
+    'FIFO': FIFOCache, 'LRU': LRUCache, 'LFU': LFUCache, 'MRU': MRUCache,
+    'ARC': ARCCache, 'WTinyLFU': WTinyLFUCache, '2Q': TwoQueueCache,
+    'LIRS': LIRSCache, 'CLOCK': CLOCKCache, 'CLOCKPro': CLOCKProCache
+}
 
 class TestFIFOCache(unittest.TestCase):
     """Testes para algoritmo FIFO"""
@@ -109,6 +129,43 @@ class TestLRUCache(unittest.TestCase):
         self.assertEqual(self.cache.get(3), "texto3")
         self.assertEqual(self.cache.get(4), "texto4")
 
+    def test_logical_clock_access_times(self):
+        """Teste instantes de acesso com o relógio lógico padrão"""
+        self.cache.put(1, "texto1")
+        self.cache.put(2, "texto2")
+        self.cache.get(1)
+
+        self.assertIsInstance(self.cache.clock, LogicalClock)
+        self.assertGreater(self.cache.get_access_time(1), self.cache.get_access_time(2))
+
+    def test_injected_wall_clock(self):
+        """Teste relógio injetado (também herdado por spawn)"""
+        cache = LRUCache(3, clock=WallClock(lambda: 42.0))
+        cache.put(1, "texto1")
+
+        self.assertEqual(cache.get_access_time(1), 42.0)
+        self.assertIs(new_cache_like(cache, 5).clock, cache.clock)
+
+    def test_batch_operations(self):
+        """Teste get_many/put_many: ordem LRU e estatísticas iguais às chamadas individuais"""
+        self.cache.put_many([(1, "texto1"), (2, "texto2"), (3, "texto3")])
+
+        found = self.cache.get_many([1, 9, 3])
+        self.assertEqual(found, {1: "texto1", 3: "texto3"})
+
+        # 2 não foi acessado no lote e é o menos recente
+        self.cache.put(4, "texto4")
+        self.assertFalse(self.cache.contains(2))
+
+        stats = self.cache.get_stats()
+        self.assertEqual((stats['hits'], stats['misses']), (2, 1))
+
+    def test_batch_helpers_fall_back_to_single_calls(self):
+        """Teste helpers de lote em caches com e sem API nativa"""
+        for cache in (LFUCache(4), ARCCache(4), CompressedCache(FIFOCache(4))):
+            put_many(cache, {1: "texto1", 2: "texto2"})
+            self.assertEqual(get_many(cache, [1, 2, 3]), {1: "texto1", 2: "texto2"})
+
 class TestLFUCache(unittest.TestCase):
     """Testes para algoritmo LFU"""
 
@@ -150,6 +207,53 @@ class TestLFUCache(unittest.TestCase):
         self.cache.get(1)
         self.assertEqual(self.cache.get_frequency(1), 3)
 
+    def test_empty_buckets_are_released(self):
+        """Teste se baldes de frequência vazios são descartados"""
+        self.cache.put(1, "texto1")
+        for _ in range(50):
+            self.cache.get(1)
+
+        self.assertEqual(self.cache.get_keys_by_frequency(), {51: [1]})
+        self.assertEqual(self.cache.get_stats()['frequency_distribution'], {51: 1})
+
+        self.cache.remove(1)
+        self.assertEqual(self.cache.min_frequency, 0)
+        self.assertIsNone(self.cache.peek_lfu())
+
+    def test_aging_lets_new_hot_set_in(self):
+        """Teste se o envelhecimento reduz a popularidade antiga"""
+        cache = LFUCache(2, decay_interval=10, decay_factor=0.5)
+        cache.put(1, "texto1")
+        for _ in range(9):
+            cache.get(1)
+        self.assertEqual(cache.get_frequency(1), 10)
+
+        cache.get(1)  # Décimo acesso: envelhece antes de contar o hit
+        self.assertEqual(cache.get_frequency(1), 6)
+        self.assertEqual(cache.get_stats()['decays'], 1)
+
+        # Novo item quente passa o antigo e o antigo vira a vítima
+        cache.put(2, "texto2")
+        for _ in range(6):
+            cache.get(2)
+        cache.put(3, "texto3")
+        cache.put(4, "texto4")
+        self.assertTrue(cache.contains(2))
+        self.assertFalse(cache.contains(1))
+
+    def test_pickle_roundtrip(self):
+        """Teste serialização preservando frequências e ordem"""
+        import pickle
+        for key in (1, 2, 3):
+            self.cache.put(key, f"texto{key}")
+        self.cache.get(3)
+
+        restored = pickle.loads(pickle.dumps(self.cache))
+
+        self.assertEqual(restored.get_keys_by_frequency(), self.cache.get_keys_by_frequency())
+        self.assertEqual(restored.peek_lfu(), 1)
+        self.assertEqual(restored.cache[3], "texto3")
+
 class TestCacheComparison(unittest.TestCase):
     """Testes comparativos entre algoritmos"""
 
@@ -200,6 +304,462 @@ class TestCacheComparison(unittest.TestCase):
         self.assertIsNotNone(results["LRU"])
         self.assertIsNotNone(results["LFU"])
 
+class TestByteBudget(unittest.TestCase):
+    """Testes de capacidade por orçamento em bytes"""
+
+    def setUp(self):
+        self.caches = {
+            'FIFO': FIFOCache(10, max_bytes=10),
+            'LRU': LRUCache(10, max_bytes=10),
+            'LFU': LFUCache(10, max_bytes=10),
+            'MRU': MRUCache(10, max_bytes=10),
+            'ARC': ARCCache(10, max_bytes=10),
+            'WTinyLFU': WTinyLFUCache(10, max_bytes=10),
+            '2Q': TwoQueueCache(10, max_bytes=10),
+            'LIRS': LIRSCache(10, max_bytes=10),
+            'CLOCK': CLOCKCache(10, max_bytes=10),
+            'CLOCKPro': CLOCKProCache(10, max_bytes=10)
+        }
+
+    def test_evicts_until_new_item_fits(self):
+        """Teste evição de quantos itens forem necessários para admitir um novo"""
+        for name, cache in self.caches.items():
+            cache.put(1, "aaa")
+            cache.put(2, "bbb")
+            cache.put(3, "ccc")
+            cache.put(4, "dddddddd")  # 8 bytes: exige remover dois itens
+
+            self.assertLessEqual(cache.get_stats()['bytes_used'], 10, name)
+            self.assertEqual(cache.get(4), "dddddddd", name)
+            self.assertEqual(cache.size(), 1, name)
+
+    def test_bytes_used_uses_encoded_length(self):
+        """Teste se o tamanho padrão é o comprimento codificado em UTF-8"""
+        for name, cache in self.caches.items():
+            cache.put(1, "ção")  # 3 caracteres, 5 bytes
+            stats = cache.get_stats()
+            self.assertEqual(stats['bytes_used'], 5, name)
+            self.assertEqual(stats['max_bytes'], 10, name)
+
+    def test_oversized_item_not_admitted(self):
+        """Teste se item maior que o orçamento não é admitido"""
+        for name, cache in self.caches.items():
+            cache.put(1, "a")
+            cache.put(2, "x" * 11)
+
+            self.assertIsNone(cache.get(2), name)
+            self.assertEqual(cache.get(1), "a", name)
+
+    def test_custom_sizer(self):
+        """Teste medidor de tamanho personalizado"""
+        cache = LRUCache(10, max_bytes=100, sizer=lambda value: 40)
+        for i in range(3):
+            cache.put(i, f"texto{i}")
+
+        self.assertEqual(cache.size(), 2)
+        self.assertEqual(cache.get_stats()['bytes_used'], 80)
+        self.assertIsNone(cache.get(0))
+
+    def test_clear_resets_bytes(self):
+        """Teste se clear zera os bytes usados"""
+        for name, cache in self.caches.items():
+            cache.put(1, "abc")
+            cache.clear()
+            self.assertEqual(cache.get_stats()['bytes_used'], 0, name)
+
+
+class TestCompressedCache(unittest.TestCase):
+    """Testes da camada de compressão"""
+
+    def setUp(self):
+        self.text = "Texto forense repetitivo com acentuação. " * 200
+
+    def test_roundtrip(self):
+        """Teste se str e bytes voltam com o tipo original"""
+        for codec in ('zlib', 'lzma'):
+            cache = CompressedCache(LRUCache(3), codec)
+            cache.put(1, self.text)
+            cache.put(2, memoryview(b"dados binarios"))
+
+            self.assertEqual(cache.get(1), self.text, codec)
+            self.assertEqual(cache.get(2), b"dados binarios", codec)
+            self.assertIsNone(cache.get(3), codec)
+
+            stats = cache.get_stats()
+            self.assertEqual(stats['hits'], 2, codec)
+            self.assertEqual(stats['decompressions'], 2, codec)
+            self.assertGreater(stats['compression_ratio'], 1, codec)
+
+    def test_byte_budget_holds_more_entries(self):
+        """Teste se o orçamento em bytes comporta mais textos comprimidos"""
+        budget = len(self.text.encode('utf-8')) * 2
+        plain = FIFOCache(10, max_bytes=budget)
+        compressed = CompressedCache(FIFOCache(10, max_bytes=budget))
+
+        for key in range(5):
+            plain.put(key, self.text)
+            compressed.put(key, self.text)
+
+        self.assertEqual(plain.size(), 2)
+        self.assertEqual(compressed.size(), 5)
+        self.assertLessEqual(compressed.get_stats()['bytes_used'], budget)
+
+    def test_spawn_keeps_policy_and_codec(self):
+        """Teste criação de cache equivalente vazio"""
+        cache = CompressedCache(LFUCache(3), 'lzma')
+        cache.put(1, self.text)
+        clone = new_cache_like(cache, 7)
+
+        self.assertIsInstance(clone, CompressedCache)
+        self.assertIsInstance(clone.policy, LFUCache)
+        self.assertEqual((clone.codec, clone.capacity, clone.size()), ('lzma', 7, 0))
+
+    def test_unknown_codec(self):
+        """Teste codec inválido"""
+        with self.assertRaises(ValueError):
+            CompressedCache(LRUCache(3), 'bz3')
+
+
+class TestARCCache(unittest.TestCase):
+    """Testes para ARCCache"""
+
+    def setUp(self):
+        self.cache = ARCCache(3)
+
+    def test_basic_operations(self):
+        """Teste operações básicas e promoção de T1 para T2"""
+        self.cache.put(1, "texto1")
+        self.cache.put(2, "texto2")
+
+        self.assertEqual(self.cache.get(1), "texto1")
+        self.assertIsNone(self.cache.get(9))
+        self.assertEqual(list(self.cache.t1), [2])
+        self.assertEqual(list(self.cache.t2), [1])
+
+        stats = self.cache.get_stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+
+    def test_ghost_hit_adapts_target(self):
+        """Teste se um miss fantasma em B1 aumenta o alvo de T1"""
+        for key in (1, 2, 3):
+            self.cache.put(key, f"texto{key}")
+        self.cache.get(2)
+        self.cache.put(4, "texto4")
+
+        self.assertIn(1, self.cache.b1)
+        self.assertEqual(self.cache.p, 0)
+
+        self.cache.put(1, "texto1")
+        self.assertGreater(self.cache.p, 0)
+        self.assertIn(1, self.cache.t2)
+        self.assertEqual(self.cache.size(), 3)
+
+    def test_frequent_items_survive_scan(self):
+        """Teste se itens reutilizados resistem a uma varredura"""
+        for key in (1, 2):
+            self.cache.put(key, f"texto{key}")
+            self.cache.get(key)
+
+        for key in range(10, 20):
+            if self.cache.get(key) is None:
+                self.cache.put(key, f"texto{key}")
+
+        self.assertTrue(self.cache.contains(1) or self.cache.contains(2))
+        self.assertLessEqual(len(self.cache.t1) + len(self.cache.b1), 3)
+        self.assertLessEqual(len(self.cache.cache) + len(self.cache.b1) + len(self.cache.b2), 6)
+
+    def test_full_t1_keeps_b2_ghosts(self):
+        """Teste se, com T1 cheio e B1 vazio, uma chave nova remove o LRU de T1 e preserva B2"""
+        cache = ARCCache(2)
+        hits = []
+        for key in (4, 2, 2, 16, 4, 18, 1, 2, 2, 3, 19, 2):
+            hit = cache.get(key) is not None
+            if not hit:
+                cache.put(key, f"texto{key}")
+            hits.append(hit)
+
+        # Sequência do ARC de Megiddo e Modha: o último acesso a 2 é um hit
+        self.assertEqual(hits, [False, False, True, False, False, False,
+                                False, False, True, False, False, True])
+
+
+class TestWTinyLFUCache(unittest.TestCase):
+    """Testes para WTinyLFUCache e o count-min sketch"""
+
+    def test_sketch_estimate_and_aging(self):
+        """Teste estimativa de frequência e envelhecimento periódico"""
+        # Chaves inteiras: o hash não depende de PYTHONHASHSEED
+        hot, cold = 1000, 2000
+        sketch = CountMinSketch(16, sample_size=40)
+        for _ in range(6):
+            sketch.increment(hot)
+        sketch.increment(cold)
+
+        self.assertGreaterEqual(sketch.estimate(hot), 6)
+        self.assertGreaterEqual(sketch.estimate(cold), 1)
+        self.assertLess(sketch.estimate(cold), sketch.estimate(hot))
+
+        for key in range(32):
+            sketch.increment(key)
+        before_aging = sketch.estimate(hot)
+        self.assertEqual(sketch.reset_count, 0)
+
+        # O 40º incremento dispara o envelhecimento (ele mesmo pode colidir com hot)
+        sketch.increment(3000)
+        self.assertEqual(sketch.reset_count, 1)
+        self.assertLessEqual(sketch.estimate(hot), (before_aging + 1) // 2)
+
+    def test_hot_keys_not_displaced_by_one_hit_wonders(self):
+        """Teste se textos acessados uma única vez não expulsam os quentes"""
+        cache = WTinyLFUCache(5, window_ratio=0.2)
+        hot = [1, 2, 3, 4]
+        for _ in range(5):
+            for key in hot:
+                if cache.get(key) is None:
+                    cache.put(key, f"texto{key}")
+
+        for key in range(100, 150):
+            if cache.get(key) is None:
+                cache.put(key, f"texto{key}")
+
+        self.assertTrue(all(cache.contains(key) for key in hot))
+        self.assertGreater(cache.get_stats()['rejected'], 0)
+        self.assertEqual(cache.size(), 5)
+
+    def test_promotion_to_protected(self):
+        """Teste promoção de probation para protected em um hit"""
+        cache = WTinyLFUCache(10, window_ratio=0.1)
+        cache.put(1, "texto1")
+        cache.put(2, "texto2")  # 1 sai da janela para probation
+
+        self.assertIn(1, cache.probation)
+        self.assertEqual(cache.get(1), "texto1")
+        self.assertIn(1, cache.protected)
+
+
+class TestScanResistantCaches(unittest.TestCase):
+    """Testes para 2Q e LIRS"""
+
+    @staticmethod
+    def _request(cache, key):
+        if cache.get(key) is None:
+            cache.put(key, f"texto{key}")
+
+    def test_hot_set_survives_scan(self):
+        """Teste se uma varredura sobre textos frios preserva o conjunto quente"""
+        for cache in (TwoQueueCache(8), LIRSCache(8)):
+            hot = [1, 2, 3, 4]
+            for round_number in range(4):
+                for key in hot:
+                    self._request(cache, key)
+                for key in (50 + 2 * round_number, 51 + 2 * round_number):
+                    self._request(cache, key)
+
+            for key in range(100, 200):
+                self._request(cache, key)
+
+            survivors = [key for key in hot if cache.contains(key)]
+            self.assertEqual(survivors, hot, cache)
+            self.assertEqual(cache.size(), 8)
+
+    def test_two_queue_ghost_promotes_to_am(self):
+        """Teste se uma chave lembrada em A1out volta direto para Am"""
+        cache = TwoQueueCache(4)
+        for key in (1, 2, 3, 4, 5):
+            self._request(cache, key)
+
+        self.assertIn(1, cache.a1out)
+        self._request(cache, 1)
+        self.assertIn(1, cache.am)
+
+    def test_lirs_reuse_promotes_hir(self):
+        """Teste se um HIR reacessado enquanto está na pilha vira LIR"""
+        cache = LIRSCache(4, hir_ratio=0.25)
+        for key in (1, 2, 3, 4):
+            self._request(cache, key)
+
+        self.assertEqual(cache.lir_keys, {1, 2, 3})
+        self._request(cache, 4)
+        self.assertIn(4, cache.lir_keys)
+        self.assertEqual(len(cache.lir_keys), 3)
+        self.assertEqual(list(cache.queue), [1])
+
+
+class TestClockCaches(unittest.TestCase):
+    """Testes para CLOCK e CLOCK-Pro"""
+
+    def test_zero_capacity(self):
+        """Teste se capacidade zero não admite itens"""
+        for cache in (CLOCKCache(0), CLOCKProCache(0)):
+            cache.put(1, "texto1")
+            cache.put(2, "texto2")
+            self.assertEqual(cache.size(), 0)
+            self.assertIsNone(cache.get(1))
+
+    def test_hit_only_sets_reference_bit(self):
+        """Teste se um hit não altera as estruturas de chaves"""
+        for cache in (CLOCKCache(3), CLOCKProCache(3)):
+            for key in (1, 2, 3):
+                cache.put(key, f"texto{key}")
+            slots_before = dict(cache.slot_of)
+
+            self.assertEqual(cache.get(2), "texto2")
+            self.assertEqual(cache.slot_of, slots_before)
+            self.assertEqual(cache.referenced[cache.slot_of[2]], 1)
+            self.assertEqual(dict(cache.cache), {1: "texto1", 2: "texto2", 3: "texto3"})
+
+    def test_clock_second_chance(self):
+        """Teste se o item referenciado ganha segunda chance"""
+        cache = CLOCKCache(3)
+        for key in (1, 2, 3):
+            cache.put(key, f"texto{key}")
+        cache.get(1)
+        cache.put(4, "texto4")
+
+        self.assertTrue(cache.contains(1))
+        self.assertFalse(cache.contains(2))
+        self.assertEqual(cache.size(), 3)
+
+    def test_clock_pro_test_period_reuse(self):
+        """Teste se uma chave reusada em teste volta como quente"""
+        cache = CLOCKProCache(3)
+        for key in (1, 2, 3, 4):
+            cache.put(key, f"texto{key}")
+
+        self.assertIn(1, cache.test_slot_of)
+        self.assertIsNone(cache.get(1))
+
+        cache.put(1, "texto1")
+        stats = cache.get_stats()
+        self.assertTrue(cache.contains(1))
+        self.assertEqual(stats['current_size'], 3)
+        self.assertLessEqual(stats['test_size'], 3)
+        self.assertEqual(stats['hot_size'] + stats['cold_size'], 3)
+
+    def test_clock_pro_bounded_under_long_trace(self):
+        """Teste invariantes do CLOCK-Pro em uma sequência longa"""
+        import random
+        rng = random.Random(7)
+        cache = CLOCKProCache(10)
+        for _ in range(5000):
+            key = rng.randint(1, 40) if rng.random() < 0.7 else rng.randint(1, 5)
+            if cache.get(key) is None:
+                cache.put(key, f"texto{key}")
+
+            self.assertLessEqual(cache.size(), 10)
+            self.assertLessEqual(len(cache.test_slot_of), 10)
+            self.assertEqual(cache.hot_count + cache.cold_count, cache.size())
+
+        self.assertGreater(cache.get_stats()['hit_rate'], 25)
+
+
+class TestOPTCache(unittest.TestCase):
+    """Testes para o algoritmo ótimo offline (Belady)"""
+
+    @staticmethod
+    def _replay(cache, trace):
+        hits = 0
+        for key in trace:
+            if cache.get(key) is not None:
+                hits += 1
+            else:
+                cache.put(key, f"texto{key}")
+        return hits
+
+    def test_next_uses(self):
+        """Teste índice de próximo uso"""
+        self.assertEqual(list(compute_next_uses([1, 2, 1, 3, 2])), [2, 4, NEVER, NEVER, NEVER])
+
+    def test_evicts_farthest_next_use(self):
+        """Teste se remove a chave usada mais tarde (exemplo clássico)"""
+        trace = [1, 2, 3, 4, 1, 2, 5, 1, 2, 3, 4, 5]
+        cache = OPTCache(3, trace=trace)
+        self.assertEqual(self._replay(cache, trace), 5)
+
+    def test_upper_bound_for_other_policies(self):
+        """Teste se nenhuma política supera o OPT no mesmo trace"""
+        import random
+        rng = random.Random(3)
+        trace = [rng.randint(1, 30) for _ in range(2000)]
+        opt_hits = self._replay(OPTCache(8, trace=trace), trace)
+
+        for cache in (FIFOCache(8), LRUCache(8), LFUCache(8), ARCCache(8), LIRSCache(8)):
+            self.assertLessEqual(self._replay(cache, trace), opt_hits, cache)
+
+    def test_requires_trace(self):
+        """Teste uso sem trace ou fora de ordem"""
+        with self.assertRaises(ValueError):
+            OPTCache(3).get(1)
+        with self.assertRaises(ValueError):
+            OPTCache(3, trace=[1, 2]).get(2)
+
+
+class TestTTLCache(unittest.TestCase):
+    """Testes para a camada de expiração"""
+
+    def setUp(self):
+        self.now = 0.0
+        self.clock = WallClock(lambda: self.now)
+
+    def test_lazy_expiry_counts_as_miss(self):
+        """Teste expiração no acesso com TTL padrão e por item"""
+        cache = TTLCache(LRUCache(3), default_ttl=10, clock=self.clock)
+        cache.put(1, "texto1")
+        cache.put(2, "texto2", ttl=30)
+
+        self.now = 15
+        self.assertIsNone(cache.get(1))
+        self.assertEqual(cache.get(2), "texto2")
+        self.assertFalse(cache.contains(1))
+
+        stats = cache.get_stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['expirations']), (1, 1, 1))
+
+    def test_validator_invalidates_changed_entries(self):
+        """Teste revalidação pela versão (mtime) respeitando o intervalo"""
+        versions = {1: 100.0}
+        cache = TTLCache(LRUCache(3), clock=self.clock, validator=versions.get,
+                         revalidate_interval=5)
+        cache.put(1, "texto1")
+        versions[1] = 200.0
+
+        self.now = 1
+        self.assertEqual(cache.get(1), "texto1")  # Ainda dentro do intervalo
+        self.now = 6
+        self.assertIsNone(cache.get(1))
+        self.assertEqual(cache.get_stats()['invalidations'], 1)
+
+    def test_bounded_sweep_and_eviction_cleanup(self):
+        """Teste varredura limitada e limpeza dos metadados na remoção por capacidade"""
+        expired = []
+        cache = TTLCache(FIFOCache(5), default_ttl=1, clock=self.clock)
+        cache.on_expire = expired.append
+        for key in range(5):
+            cache.put(key, f"texto{key}")
+        cache.put(5, "texto5")  # Remove a chave 0 por capacidade
+
+        self.assertNotIn(0, cache.expires_at)
+
+        self.now = 2
+        self.assertEqual(cache.sweep(max_entries=2), 2)
+        self.assertEqual(cache.size(), 3)
+        self.assertEqual(cache.sweep(), 3)
+        self.assertEqual(sorted(expired), [1, 2, 3, 4, 5])
+
+    def test_every_configured_policy(self):
+        """Teste a camada de expiração sobre todas as políticas da simulação"""
+        for name in SIMULATION_CONFIG['algorithms']:
+            with self.subTest(policy=name):
+                self.now = 0.0
+                cache = TTLCache(POLICY_CLASSES[name](3), default_ttl=10, clock=self.clock)
+                cache.put(1, "texto1")
+                self.assertTrue(cache.contains(1))
+                self.assertEqual(cache.get(1), "texto1")
+
+                self.now = 11
+                self.assertFalse(cache.contains(1))
+                self.assertIsNone(cache.get(1))
+
 if __name__ == "__main__":
     # Executar todos os testes
     unittest.main(verbosity=2)
@@ -0,0 +1,578 @@
+"""
+Testes para os gerenciadores de cache
+"""
+
+import unittest
+import os
+import sys
+import asyncio
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+# Adicionar path do projeto
+project_root = Path(__file__).parent.parent.parent
+sys.path.append(str(project_root))
+
+from core.concurrent_cache_manager import ConcurrentCacheManager
+from core.single_flight import SingleFlight
+from core.text_manager import TextManager
+from core.async_text_manager import AsyncTextManager
+from core.async_cache_manager import AsyncCacheManager
+from core.tiered_cache_manager import DiskL2Cache, TieredCacheManager
+from core.config.settings import DISK_DELAY_SIMULATION
+from algorithms.lru_cache import LRUCache
+from algorithms.lfu_cache import LFUCache
+from algorithms.fifo_cache import FIFOCache
+from algorithms.mru_cache import MRUCache
+from algorithms.compressed_cache import CompressedCache
+from algorithms.ttl_cache import TTLCache
+from algorithms.timing import WallClock
+from core.expiry_sweeper import ExpirySweeper
+from core.prefetcher import AccessPredictor, Prefetcher
+from core.cache_snapshot import SnapshotWarmer, load_snapshot, save_snapshot
+
+class TestConcurrentCacheManager(unittest.TestCase):
+    """Testes para o gerenciador de cache concorrente"""
+
+    def setUp(self):
+        self.manager = ConcurrentCacheManager({'LRU': LRUCache(8), 'LFU': LFUCache(8)}, num_shards=4)
+
+    def test_basic_operations(self):
+        """Teste operações básicas através das partições"""
+        for key in range(8):
+            self.manager.put(key, f"texto{key}", 'LRU')
+
+        for key in range(8):
+            self.assertEqual(self.manager.get(key, 'LRU'), f"texto{key}")
+        self.assertIsNone(self.manager.get(99, 'LRU'))
+
+        info = self.manager.get_cache_info('LRU')
+        self.assertEqual(info['size'], 8)
+        self.assertEqual(info['capacity'], 8)
+        self.assertEqual(info['hits'], 8)
+        self.assertEqual(info['misses'], 1)
+
+    def test_single_lock_mode_uses_given_instance(self):
+        """Teste se o modo de lock único preserva a instância e a ordem global"""
+        lru = LRUCache(2)
+        manager = ConcurrentCacheManager({'LRU': lru}, num_shards=1)
+
+        manager.put(1, "texto1", 'LRU')
+        manager.put(2, "texto2", 'LRU')
+        manager.get(1, 'LRU')
+        manager.put(3, "texto3", 'LRU')
+
+        self.assertIs(manager.shards['LRU'][0], lru)
+        self.assertIsNone(manager.get(2, 'LRU'))
+        self.assertEqual(manager.get(1, 'LRU'), "texto1")
+
+    def test_shards_preserve_total_capacity(self):
+        """Teste se a divisão entre partições não arredonda a capacidade total"""
+        manager = ConcurrentCacheManager({'LRU': LRUCache(10, max_bytes=1003)}, num_shards=8)
+
+        shards = manager.shards['LRU']
+        self.assertEqual([shard.capacity for shard in shards], [2, 2, 1, 1, 1, 1, 1, 1])
+        self.assertEqual(sum(shard.capacity for shard in shards), 10)
+        self.assertEqual(sum(shard.max_bytes for shard in shards), 1003)
+        self.assertEqual(manager.get_cache_info('LRU')['capacity'], 10)
+
+    def test_num_shards_capped_by_capacity(self):
+        """Teste se uma capacidade menor que num_shards não gera vagas extras"""
+        manager = ConcurrentCacheManager({'LRU': LRUCache(2), 'LFU': LFUCache(8)}, num_shards=8)
+
+        self.assertEqual(manager.num_shards, 2)
+        self.assertEqual([shard.capacity for shard in manager.shards['LRU']], [1, 1])
+        self.assertEqual(len(manager.locks['LFU']), 2)
+        for key in range(10):
+            manager.put(key, f"texto{key}", 'LRU')
+        self.assertEqual(manager.get_cache_info('LRU')['size'], 2)
+
+    def test_invalid_algorithm(self):
+        """Teste algoritmo inexistente"""
+        with self.assertRaises(ValueError):
+            self.manager.get(1, 'ARC')
+        with self.assertRaises(ValueError):
+            ConcurrentCacheManager({'LRU': LRUCache(2)}, num_shards=0)
+
+    def test_concurrent_access(self):
+        """Teste acesso simultâneo de várias threads"""
+        num_threads = 8
+        requests_per_thread = 500
+
+        def worker(offset):
+            for i in range(requests_per_thread):
+                key = (i + offset) % 20
+                if self.manager.get(key, 'LFU') is None:
+                    self.manager.put(key, f"texto{key}", 'LFU')
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(num_threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = self.manager.get_stats('LFU')
+        self.assertEqual(stats['hits'] + stats['misses'], num_threads * requests_per_thread)
+        self.assertLessEqual(self.manager.get_cache_info('LFU')['size'], 8)
+
+    def test_invalidate_single_key(self):
+        """Teste invalidação de uma chave sem limpar o restante do cache"""
+        for alg in ('LRU', 'LFU'):
+            self.manager.put(1, "texto1", alg)
+            self.manager.put(2, "texto2", alg)
+
+        self.assertEqual(self.manager.invalidate(1), 2)
+        self.assertIsNone(self.manager.get(1, 'LRU'))
+        self.assertEqual(self.manager.get(2, 'LFU'), "texto2")
+
+    def test_sweeper_removes_expired_entries(self):
+        """Teste varredura das partições com TTL"""
+        now = [0.0]
+        cache = TTLCache(LRUCache(8), default_ttl=1, clock=WallClock(lambda: now[0]))
+        manager = ConcurrentCacheManager({'LRU': cache}, num_shards=2)
+        for key in range(6):
+            manager.put(key, f"texto{key}", 'LRU')
+
+        now[0] = 5
+        sweeper = ExpirySweeper(manager, interval=60, batch_size=2)
+        self.assertEqual(sweeper.sweep_once(), 4)
+        self.assertEqual(sweeper.sweep_once(), 2)
+        self.assertEqual(manager.get_cache_info('LRU')['size'], 0)
+
+        with sweeper:
+            self.assertTrue(sweeper.is_running())
+        self.assertFalse(sweeper.is_running())
+
+    def test_batch_operations(self):
+        """Teste get_many/put_many distribuindo as chaves pelas partições"""
+        self.manager.put_many({key: f"texto{key}" for key in range(6)}, 'LRU')
+
+        found = self.manager.get_many([5, 0, 42, 3], 'LRU')
+        self.assertEqual(list(found), [5, 0, 3])
+        self.assertEqual(found[0], "texto0")
+
+        stats = self.manager.get_stats('LRU')
+        self.assertEqual((stats['hits'], stats['misses']), (3, 1))
+        with self.assertRaises(ValueError):
+            self.manager.get_many([1], 'ARC')
+
+    def test_reset_stats(self):
+        """Teste reinício das estatísticas agregadas"""
+        self.manager.put(1, "texto1", 'LRU')
+        self.manager.get(1, 'LRU')
+        self.manager.reset_stats()
+
+        self.assertEqual(self.manager.get_stats('LRU'), {'hits': 0, 'misses': 0, 'total_time': 0})
+
+class TestSingleFlight(unittest.TestCase):
+    """Testes para a coalescência de requisições"""
+
+    def test_concurrent_calls_share_one_execution(self):
+        """Teste se chamadas simultâneas para a mesma chave executam uma única carga"""
+        flight = SingleFlight()
+        executions = []
+        results = []
+
+        def slow_load():
+            executions.append(1)
+            time.sleep(0.05)
+            return "texto42"
+
+        def worker():
+            results.append(flight.do(42, slow_load))
+
+        threads = [threading.Thread(target=worker) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(executions), 1)
+        self.assertTrue(all(value == "texto42" for value, _ in results))
+        self.assertEqual(sum(1 for _, shared in results if not shared), 1)
+
+        stats = flight.get_stats()
+        self.assertEqual(stats['calls'], 10)
+        self.assertEqual(stats['executions'], 1)
+        self.assertEqual(stats['coalesced'], 9)
+        self.assertEqual(stats['in_flight'], 0)
+
+    def test_sequential_calls_execute_again(self):
+        """Teste se chamadas não simultâneas executam novamente"""
+        flight = SingleFlight()
+
+        self.assertEqual(flight.do(1, lambda: "a"), ("a", False))
+        self.assertEqual(flight.do(1, lambda: "b"), ("b", False))
+
+    def test_error_propagates_to_waiters(self):
+        """Teste se a exceção do líder é repassada e a chave liberada"""
+        flight = SingleFlight()
+
+        def failing_load():
+            raise IOError("falha de leitura")
+
+        with self.assertRaises(IOError):
+            flight.do(1, failing_load)
+        self.assertEqual(flight.in_flight(), 0)
+
+class TestAsyncCacheManager(unittest.IsolatedAsyncioTestCase):
+    """Testes para a API assíncrona"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        for text_id in (1, 2, 3):
+            (Path(self.temp_dir.name) / f"{text_id}.txt").write_text(f"conteúdo {text_id}", encoding='utf-8')
+
+        with patch('builtins.print'):
+            self.text_manager = TextManager(self.temp_dir.name)
+        self.async_text_manager = AsyncTextManager(self.text_manager)
+        self.manager = AsyncCacheManager(
+            ConcurrentCacheManager({'LRU': LRUCache(2)}, num_shards=1),
+            self.async_text_manager
+        )
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    async def test_load_text(self):
+        """Teste carregamento assíncrono"""
+        self.assertEqual(await self.async_text_manager.load_text(2), "conteúdo 2")
+        self.assertIsNone(await self.async_text_manager.load_text(50))
+
+    @patch.dict(DISK_DELAY_SIMULATION, {'enabled': True, 'min_delay': 0.5, 'max_delay': 0.5})
+    async def test_missing_text_skips_disk_delay(self):
+        """Teste se um ID inexistente retorna None sem esperar o atraso do disco"""
+        start_time = time.perf_counter()
+        self.assertIsNone(await self.async_text_manager.load_text(50))
+        self.assertLess(time.perf_counter() - start_time, 0.5)
+
+    async def test_get_or_load(self):
+        """Teste miss seguido de hit"""
+        self.assertEqual(await self.manager.get_or_load(1, 'LRU'), ("conteúdo 1", False))
+        self.assertEqual(await self.manager.get_or_load(1, 'LRU'), ("conteúdo 1", True))
+        self.assertEqual(await self.manager.get(1, 'LRU'), "conteúdo 1")
+
+    @patch.dict(DISK_DELAY_SIMULATION, {'enabled': True, 'min_delay': 0.05, 'max_delay': 0.05})
+    async def test_concurrent_misses_are_coalesced_and_overlap(self):
+        """Teste se misses simultâneos compartilham a carga e os atrasos se sobrepõem"""
+        start_time = time.perf_counter()
+        results = await asyncio.gather(*[
+            self.manager.get_or_load(text_id, 'LRU') for text_id in (1, 1, 1, 2, 3)
+        ])
+        elapsed = time.perf_counter() - start_time
+
+        self.assertEqual([content for content, _ in results],
+                         ["conteúdo 1"] * 3 + ["conteúdo 2", "conteúdo 3"])
+        self.assertEqual(self.manager.coalesced_count, 2)
+        self.assertEqual(self.text_manager.disk_reads, 3)
+        self.assertLess(elapsed, 0.05 * 3)  # atrasos em paralelo, não em série
+
+    @patch.dict(DISK_DELAY_SIMULATION, {'enabled': True, 'min_delay': 0.05, 'max_delay': 0.05})
+    async def test_cancelled_leader_does_not_cancel_followers(self):
+        """Teste se cancelar quem iniciou a carga não cancela os demais que a aguardam"""
+        leader = asyncio.ensure_future(self.manager.get_or_load(1, 'LRU'))
+        await asyncio.sleep(0.01)
+        follower = asyncio.ensure_future(self.manager.get_or_load(1, 'LRU'))
+        await asyncio.sleep(0.01)
+
+        leader.cancel()
+        self.assertEqual(await follower, ("conteúdo 1", False))
+        self.assertTrue(leader.cancelled())
+        self.assertEqual(self.text_manager.disk_reads, 1)
+        self.assertEqual(await self.manager.get(1, 'LRU'), "conteúdo 1")
+
+
+class TestTieredCacheManager(unittest.TestCase):
+    """Testes para o cache em dois níveis (memória + sqlite)"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.l2 = DiskL2Cache(Path(self.temp_dir) / "l2.sqlite", max_entries=3)
+
+    def tearDown(self):
+        import shutil
+        self.l2.close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_evictions_demoted_to_l2(self):
+        """Teste se textos removidos do L1 são servidos pelo L2 e promovidos"""
+        for cache in (FIFOCache(2), LRUCache(2), LFUCache(2), MRUCache(2)):
+            self.l2.clear()
+            manager = TieredCacheManager({'ALG': cache}, self.l2)
+            for key in (1, 2, 3):
+                manager.put(key, f"texto{key}", 'ALG')
+
+            evicted = next(key for key in (1, 2, 3) if key not in cache.cache)
+            self.assertEqual(manager.get(evicted, 'ALG'), f"texto{evicted}")
+            self.assertIn(evicted, cache.cache)
+
+            stats = manager.get_tier_stats('ALG')
+            self.assertEqual((stats['l2_hits'], stats['misses']), (1, 0))
+            self.assertGreaterEqual(stats['demotions'], 1)
+
+    def test_miss_in_both_tiers(self):
+        """Teste miss quando o texto não está em nenhum nível"""
+        manager = TieredCacheManager({'LRU': LRUCache(2)}, self.l2)
+        self.assertIsNone(manager.get(42, 'LRU'))
+        self.assertEqual(manager.get_tier_stats('LRU')['misses'], 1)
+
+    def test_l2_lru_limit_and_persistence(self):
+        """Teste limite do L2 e persistência entre instâncias"""
+        for key in range(5):
+            self.l2.put(key, f"texto{key}")
+        self.l2.get(2)
+        self.l2.put(5, b"binario")
+
+        self.assertEqual(self.l2.size(), 3)
+        self.l2.close()
+
+        self.l2 = DiskL2Cache(Path(self.temp_dir) / "l2.sqlite", max_entries=3)
+        self.assertEqual(self.l2.get(2), "texto2")
+        self.assertEqual(self.l2.get(5), b"binario")
+        self.assertIsNone(self.l2.get(0))
+
+    def test_compressed_l1_demotes_original_value(self):
+        """Teste se o L2 recebe o texto descomprimido de um L1 comprimido"""
+        manager = TieredCacheManager({'LRU': CompressedCache(LRUCache(1))}, self.l2)
+        manager.put(1, "texto1", 'LRU')
+        manager.put(2, "texto2", 'LRU')
+
+        self.assertEqual(self.l2.get(1), "texto1")
+
+    def test_demotion_written_outside_l1_lock(self):
+        """Teste se a escrita no L2 acontece depois de liberar o lock da partição"""
+        manager = TieredCacheManager({'LRU': LRUCache(1)}, self.l2)
+        lock_held = []
+        original_put = self.l2.put
+
+        def checked_put(key, value, **metadata):
+            lock_held.append(manager.locks['LRU'][0].locked())
+            original_put(key, value, **metadata)
+
+        with patch.object(self.l2, 'put', checked_put):
+            manager.put(1, "texto1", 'LRU')
+            manager.put(2, "texto2", 'LRU')
+
+        self.assertEqual(lock_held, [False])
+        self.assertEqual(manager._pending_demotions, {})
+        self.assertEqual(manager.get(1, 'LRU'), "texto1")
+
+    def test_expired_l1_entry_dropped_from_l2(self):
+        """Teste se uma entrada vencida no L1 não volta pelo L2"""
+        now = [0.0]
+        cache = TTLCache(LRUCache(2), default_ttl=1, clock=WallClock(lambda: now[0]))
+        manager = TieredCacheManager({'LRU': cache}, self.l2)
+        self.l2.put(1, "texto1 antigo")
+        manager.put(1, "texto1", 'LRU')
+
+        now[0] = 5
+        self.assertIsNone(manager.get(1, 'LRU'))
+        self.assertIsNone(self.l2.get(1))
+
+    def test_text_changed_while_in_l2_is_not_promoted(self):
+        """Teste se um texto editado no disco enquanto estava no L2 não é servido"""
+        text_file = Path(self.temp_dir) / "1.txt"
+        text_file.write_text("versão antiga", encoding='utf-8')
+        (Path(self.temp_dir) / "2.txt").write_text("texto2", encoding='utf-8')
+        with patch('builtins.print'):
+            text_manager = TextManager(self.temp_dir)
+
+        cache = TTLCache(LRUCache(1), validator=text_manager.get_modified_time, revalidate_interval=0)
+        manager = TieredCacheManager({'LRU': cache}, DiskL2Cache(':memory:'))
+        manager.put(1, text_manager.load_text(1), 'LRU')
+        manager.put(2, text_manager.load_text(2), 'LRU')
+
+        text_file.write_text("versão nova", encoding='utf-8')
+        stat = text_file.stat()
+        os.utime(text_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+        self.assertIsNone(manager.get(1, 'LRU'))
+        self.assertIsNone(manager.l2.get(1))
+        manager.close()
+
+    def test_promotion_keeps_remaining_ttl(self):
+        """Teste se um texto promovido do L2 mantém o prazo original"""
+        now = [0.0]
+        cache = TTLCache(LRUCache(1), default_ttl=10, clock=WallClock(lambda: now[0]))
+        manager = TieredCacheManager({'LRU': cache}, self.l2)
+        manager.put(1, "texto1", 'LRU')
+        manager.put(2, "texto2", 'LRU')
+        self.assertEqual(self.l2.get_entry(1), ("texto1", None, 10.0))
+
+        now[0] = 4
+        self.assertEqual(manager.get(1, 'LRU'), "texto1")
+        self.assertEqual(cache.expires_at[1], 10.0)
+
+        manager.put(3, "texto3", 'LRU')
+        now[0] = 11
+        self.assertIsNone(manager.get(1, 'LRU'))
+        self.assertIsNone(self.l2.get(1))
+
+    def test_expired_entry_dropped_from_pending_demotions(self):
+        """Teste se a expiração descarta um rebaixamento ainda não gravado"""
+        cache = TTLCache(LRUCache(1), default_ttl=1, clock=WallClock(lambda: 0.0))
+        manager = TieredCacheManager({'LRU': cache}, self.l2)
+        manager._pending_demotions[1] = ("texto1", None, 1.0)
+
+        cache.on_expire(1)
+        self.assertEqual(manager._pending_demotions, {})
+
+
+class TestPrefetcher(unittest.TestCase):
+    """Testes para o pré-carregamento por previsão de acessos"""
+
+    def setUp(self):
+        self.manager = ConcurrentCacheManager({'LRU': LRUCache(4)}, num_shards=1)
+        self.loads = []
+
+    def _loader(self, key, algorithm):
+        self.loads.append(key)
+        content = f"texto{key}"
+        self.manager.put(key, content, algorithm)
+        return content
+
+    def _access(self, prefetcher, key):
+        hit = self.manager.get(key, 'LRU') is not None
+        prefetcher.on_access(key, 'LRU', hit)
+        if not hit:
+            self._loader(key, 'LRU')
+        prefetcher.drain()
+        return hit
+
+    def test_predictor_markov_and_stride(self):
+        """Teste previsões por transições aprendidas e por passo constante"""
+        predictor = AccessPredictor()
+        predictor.train([7, 20, 7, 20, 7, 31])
+        self.assertEqual(predictor.predict(7, 1, 0.5), [(20, 2 / 3)])
+
+        predictor.train([4, 5, 6])
+        self.assertEqual([key for key, _ in predictor.predict(6, 2)], [7, 8])
+
+    def test_sequential_reading_is_prefetched(self):
+        """Teste leitura sequencial servida pelo pré-carregamento"""
+        prefetcher = Prefetcher(self.manager, self._loader, max_predictions=1)
+        try:
+            hits = [self._access(prefetcher, key) for key in range(1, 8)]
+        finally:
+            prefetcher.close()
+
+        self.assertEqual(hits, [False, False, False, True, True, True, True])
+        stats = prefetcher.get_stats()
+        self.assertEqual((stats['useful'], stats['demand_misses']), (4, 3))
+        self.assertGreater(stats['coverage'], 50)
+        self.assertEqual(stats['polluting'], 0)
+
+    def test_bandwidth_budget(self):
+        """Teste se o orçamento de banda limita as cargas em segundo plano"""
+        now = [0.0]
+        prefetcher = Prefetcher(self.manager, self._loader, max_predictions=1,
+                                max_bytes_per_second=6, clock=WallClock(lambda: now[0]))
+        try:
+            for key in range(1, 6):
+                self._access(prefetcher, key)
+        finally:
+            prefetcher.close()
+
+        stats = prefetcher.get_stats()
+        self.assertEqual(stats['issued'], 1)
+        self.assertGreaterEqual(stats['skipped_budget'], 1)
+
+    def test_prefetch_with_mru(self):
+        """Teste pré-carregamento sobre o MRU (consulta contains da política)"""
+        manager = ConcurrentCacheManager({'MRU': MRUCache(4)}, num_shards=2)
+        loader = lambda key, algorithm: manager.put(key, f"texto{key}", algorithm) or f"texto{key}"
+        prefetcher = Prefetcher(manager, loader, max_predictions=1)
+        try:
+            for key in range(1, 5):
+                prefetcher.on_access(key, 'MRU', False)
+                prefetcher.drain()
+        finally:
+            prefetcher.close()
+
+        self.assertTrue(manager.contains(5, 'MRU'))
+        self.assertEqual(prefetcher.get_stats()['issued'], 2)
+
+
+class TestCacheSnapshot(unittest.TestCase):
+    """Testes para o snapshot e aquecimento do cache"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = Path(self.temp_dir) / "snapshot.json.gz"
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    @staticmethod
+    def _new_manager():
+        return ConcurrentCacheManager({'FIFO': FIFOCache(3), 'LRU': LRUCache(3), 'LFU': LFUCache(3)},
+                                      num_shards=1)
+
+    def test_roundtrip_restores_policy_state(self):
+        """Teste se ordem do FIFO/LRU e frequências do LFU sobrevivem ao reinício"""
+        manager = self._new_manager()
+        for alg in ('FIFO', 'LRU', 'LFU'):
+            for key in (1, 2, 3):
+                manager.put(key, f"texto{key}", alg)
+            manager.get(1, alg)
+            manager.get(1, alg)
+        save_snapshot(manager, self.path)
+
+        loads = []
+        restored = self._new_manager()
+        warmer = SnapshotWarmer(restored, lambda key: loads.append(key) or f"texto{key}", max_workers=2)
+        warmer.start(load_snapshot(self.path))
+        self.assertTrue(warmer.wait(5))
+
+        self.assertEqual(sorted(loads), [1, 2, 3])
+        self.assertEqual(warmer.get_stats()['restored'], 9)
+        self.assertEqual(restored.algorithms['FIFO'].get_insertion_order(), [1, 2, 3])
+        self.assertEqual(restored.algorithms['LRU'].get_access_order(), [2, 3, 1])
+        self.assertEqual(restored.algorithms['LFU'].get_frequency(1), 3)
+        self.assertEqual(restored.algorithms['LFU'].peek_lfu(), 2)
+
+    def test_keeps_entries_added_during_warmup(self):
+        """Teste se entradas já presentes não são sobrescritas"""
+        manager = self._new_manager()
+        manager.put(1, "antigo", 'LRU')
+        save_snapshot(manager, self.path)
+
+        restored = self._new_manager()
+        restored.put(1, "novo", 'LRU')
+        SnapshotWarmer(restored, lambda key: f"texto{key}").run(load_snapshot(self.path))
+
+        self.assertEqual(restored.get(1, 'LRU'), "novo")
+
+    def test_mru_and_failing_policy(self):
+        """Teste MRU restaurado e erro em um algoritmo sem abortar os demais"""
+        manager = ConcurrentCacheManager({'MRU': MRUCache(3), 'LRU': LRUCache(3)}, num_shards=2)
+        for alg in ('MRU', 'LRU'):
+            manager.put(1, "texto1", alg)
+        save_snapshot(manager, self.path)
+
+        restored = ConcurrentCacheManager({'MRU': MRUCache(3), 'LRU': LRUCache(3)}, num_shards=2)
+        warmer = SnapshotWarmer(restored, lambda key: f"texto{key}")
+        warmer.run(load_snapshot(self.path))
+        self.assertEqual(warmer.get_stats()['restored'], 2)
+
+        broken = ConcurrentCacheManager({'MRU': MRUCache(3), 'LRU': LRUCache(3)}, num_shards=1)
+        broken.shards['MRU'][0].put = None  # Falha ao reinserir
+        warmer = SnapshotWarmer(broken, lambda key: f"texto{key}")
+        with patch('builtins.print'):
+            warmer.run(load_snapshot(self.path))
+        self.assertEqual(warmer.get_stats()['errors'], 1)
+        self.assertTrue(broken.contains(1, 'LRU'))
+
+    def test_missing_or_invalid_snapshot(self):
+        """Teste snapshot ausente ou corrompido"""
+        self.assertIsNone(load_snapshot(self.path))
+        self.path.write_bytes(b"lixo")
+        with patch('builtins.print'):
+            self.assertIsNone(load_snapshot(self.path))
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -4,6 +4,7 @@ Testes para o sistema de simulação
 
 import unittest
 import sys
+import tempfile
 from pathlib import Path
 from unittest.mock import Mock, patch
 
@@ -12,7 +13,30 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.append(str(project_root))
 
 from simulation.random_generators import RandomGenerators, UserSimulator
+from simulation.simulator import CacheSimulator
+from simulation.trace import RequestTrace
+from simulation.policy_engine import LoadCostModel, opt_hit_rate_curve, replay_keys, simulate_policy
+from simulation.stack_distance import COLD_MISS, compute_stack_distances, lru_hit_rate_curve
+from core.config.settings import SIMULATION_CONFIG
 from algorithms.fifo_cache import FIFOCache
+from algorithms.lru_cache import LRUCache
+from algorithms.compressed_cache import CompressedCache
+from algorithms.ttl_cache import TTLCache
+
+class StubTextManager:
+    """Gerenciador de textos simples (serializável) para os testes de simulação"""
+
+    def load_text(self, text_id):
+        return f"texto{text_id}"
+
+    def measure_read_time(self, text_id, repeats=1):
+        return 0.001
+
+    def get_expected_disk_delay(self):
+        return 0.01
+
+    def get_text_info(self, text_id):
+        return {'id': text_id, 'size_bytes': 1000}
 
 class TestRandomGenerators(unittest.TestCase):
     """Testes para geradores aleatórios"""
@@ -53,6 +77,23 @@ class TestRandomGenerators(unittest.TestCase):
         self.assertGreater(special_rate, 0.6)  # Pelo menos 60%
         self.assertLess(special_rate, 1.0)     # Menos que 100%
 
+    def test_weighted_generation_large_range(self):
+        """Teste geração ponderada sem listar os textos normais"""
+        generator = RandomGenerators((25, 1_000_000))
+        samples = generator.generate_weighted(2000)
+
+        self.assertTrue(all(25 <= s <= 1_000_000 for s in samples))
+        self.assertGreater(max(samples), 1000)
+
+    def test_range_from_text_manager(self):
+        """Teste range derivado do gerenciador de textos"""
+        text_manager = StubTextManager()
+        text_manager.get_id_range = lambda: (1, 5000)
+
+        generator = RandomGenerators.from_text_manager(text_manager)
+        self.assertEqual((generator.min_text, generator.max_text), (1, 5000))
+        self.assertEqual(RandomGenerators.from_text_manager(StubTextManager()).max_text, 100)
+
     def test_analyze_distribution(self):
         """Teste análise de distribuição"""
         samples = [1, 2, 2, 3, 3, 3]
@@ -152,5 +193,206 @@ class TestSimulationIntegration(unittest.TestCase):
         # Tempo deve ser mensurável
         self.assertGreaterEqual(elapsed, 0)
 
+class TestRequestTrace(unittest.TestCase):
+    """Testes para a camada de traces"""
+
+    def setUp(self):
+        self.generator = RandomGenerators((1, 10))
+
+    def test_generate_compact_trace(self):
+        """Teste geração de trace compacto"""
+        trace = RequestTrace.generate(self.generator, 50, 'uniform', user_id=1)
+
+        self.assertEqual(len(trace), 50)
+        self.assertEqual(trace.requests.typecode, 'H')
+        self.assertTrue(all(1 <= r <= 10 for r in trace))
+
+    def test_save_and_load(self):
+        """Teste persistência do trace em disco"""
+        trace = RequestTrace([1, 5, 70000, 3], distribution='weighted', user_id=3)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = trace.save(Path(temp_dir) / "trace.bin")
+            loaded = RequestTrace.load(path)
+
+        self.assertEqual(loaded.tolist(), [1, 5, 70000, 3])
+        self.assertEqual(loaded.distribution, 'weighted')
+        self.assertEqual(loaded.user_id, 3)
+
+    def test_load_or_generate_reuses_file(self):
+        """Teste se um trace salvo é reaproveitado"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "trace.bin"
+            first = RequestTrace.load_or_generate(path, self.generator, 30, 'poisson', 2)
+            second = RequestTrace.load_or_generate(path, self.generator, 30, 'poisson', 2)
+
+        self.assertEqual(first.tolist(), second.tolist())
+
+    def test_load_or_generate_regenerates_on_mismatch(self):
+        """Teste se um trace de outro usuário ou intervalo de IDs não é reaproveitado"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "trace.bin"
+            RequestTrace.load_or_generate(path, self.generator, 30, 'uniform', 2)
+
+            other_user = RequestTrace.load_or_generate(path, self.generator, 30, 'uniform', 3)
+            self.assertEqual(RequestTrace.load(path).user_id, 3)
+
+            wider = RandomGenerators((500, 600))
+            other_range = RequestTrace.load_or_generate(path, wider, 30, 'uniform', 3)
+            self.assertEqual(RequestTrace.load(path).text_range, (500, 600))
+
+        self.assertEqual(other_user.user_id, 3)
+        self.assertTrue(all(500 <= r <= 600 for r in other_range))
+
+class TestTraceReplay(unittest.TestCase):
+    """Testes da reprodução de traces na simulação"""
+
+    @patch.dict(SIMULATION_CONFIG, {'requests_per_user': 30, 'algorithms': ['FIFO', 'LRU'],
+                                    'trace_replay': True})
+    def test_all_algorithms_see_same_stream(self):
+        """Teste se todos os algoritmos recebem a mesma sequência de requisições"""
+        simulator = CacheSimulator(StubTextManager(), {'FIFO': FIFOCache(5), 'LRU': LRUCache(5)})
+        results = simulator.run_full_simulation(parallel=False)
+
+        for scenario in SIMULATION_CONFIG['user_scenarios']:
+            dist = scenario['distribution']
+            streams = [
+                [r['text_id'] for r in results['results_by_algorithm'][alg][dist][0]['request_details']]
+                for alg in ('FIFO', 'LRU')
+            ]
+            self.assertEqual(streams[0], streams[1])
+            self.assertEqual(streams[0], simulator.traces[(scenario['user_id'], dist)].tolist())
+
+class TestMetadataEngine(unittest.TestCase):
+    """Testes do motor de simulação somente metadados"""
+
+    def test_replay_matches_full_cache_behavior(self):
+        """Teste se hits/misses coincidem com a execução carregando conteúdo"""
+        keys = [1, 2, 1, 3, 4, 1, 2, 5, 1, 3]
+
+        outcomes = replay_keys(LRUCache(3), keys)
+
+        cache = LRUCache(3)
+        expected = []
+        for key in keys:
+            if cache.get(key) is not None:
+                expected.append(1)
+            else:
+                cache.put(key, f"texto{key}")
+                expected.append(0)
+
+        self.assertEqual(list(outcomes), expected)
+
+    def test_cost_model_estimate(self):
+        """Teste estimativa de latência a partir dos misses"""
+        model = LoadCostModel({1: 0.002, 2: 0.004}, disk_delay=0.01, hit_cost=0.0001)
+
+        self.assertAlmostEqual(model.miss_cost(1), 0.012)
+        self.assertAlmostEqual(model.miss_cost(99), 0.013)  # custo médio para texto não medido
+        self.assertAlmostEqual(model.estimate({1: 2, 2: 1}, hits=10), 0.024 + 0.014 + 0.001)
+
+    def test_simulate_policy(self):
+        """Teste resumo da simulação de uma política"""
+        model = LoadCostModel({1: 0.0, 2: 0.0}, disk_delay=0.01)
+        result = simulate_policy(FIFOCache(2), [1, 2, 1, 2], model)
+
+        self.assertEqual(result['cache_hits'], 2)
+        self.assertEqual(result['cache_misses'], 2)
+        self.assertEqual(result['hit_rate'], 50.0)
+        self.assertAlmostEqual(result['total_load_time'], 0.02)
+
+    def test_byte_budget_reaches_wrapped_policy(self):
+        """Teste orçamento em bytes aplicado à política dentro das camadas"""
+        model = LoadCostModel({1: 0.0, 2: 0.0}, disk_delay=0.01, text_sizes={1: 3000, 2: 3000})
+        trace = [1, 2, 1, 2, 1, 2]
+
+        bare = simulate_policy(LRUCache(10, max_bytes=5000), trace, model)
+        wrapped = simulate_policy(CompressedCache(TTLCache(LRUCache(10, max_bytes=5000))), trace, model)
+
+        self.assertEqual(bare['cache_hits'], 0)
+        self.assertEqual(wrapped['cache_hits'], bare['cache_hits'])
+
+    @patch.dict(SIMULATION_CONFIG, {'requests_per_user': 50, 'algorithms': ['FIFO', 'LRU']})
+    def test_metadata_simulation(self):
+        """Teste simulação completa com o motor de metadados"""
+        text_manager = Mock(wraps=StubTextManager())
+        simulator = CacheSimulator(text_manager, {'FIFO': FIFOCache(5), 'LRU': LRUCache(5)})
+        results = simulator.run_full_simulation(parallel=False, engine='metadata')
+
+        text_manager.load_text.assert_not_called()
+        self.assertEqual(results['simulation_info']['engine'], 'metadata')
+        for distributions in results['results_by_algorithm'].values():
+            for users in distributions.values():
+                self.assertEqual(users[0]['total_requests'], 50)
+                self.assertGreater(users[0]['avg_load_time'], 0)
+
+class TestStackDistance(unittest.TestCase):
+    """Testes do motor de distância de pilha"""
+
+    def test_stack_distances(self):
+        """Teste distâncias de pilha de uma sequência conhecida"""
+        distances = compute_stack_distances([1, 2, 3, 1, 1, 3, 2])
+
+        self.assertEqual(distances, [COLD_MISS, COLD_MISS, COLD_MISS, 3, 1, 2, 3])
+
+    def test_curve_matches_lru_simulation(self):
+        """Teste se a curva coincide com simulações LRU para cada capacidade"""
+        trace = RandomGenerators((1, 20)).generate_weighted(500)
+        curve = lru_hit_rate_curve(trace)
+
+        for capacity in (1, 3, 5, 10, len(curve)):
+            result = simulate_policy(LRUCache(capacity), trace)
+            self.assertAlmostEqual(curve[capacity - 1], result['hit_rate'])
+
+    def test_opt_curve_bounds_lru(self):
+        """Teste se a curva OPT nunca fica abaixo da curva LRU"""
+        trace = RandomGenerators((1, 20)).generate_weighted(500)
+        lru_curve = lru_hit_rate_curve(trace)
+        opt_curve = opt_hit_rate_curve(trace)
+
+        self.assertEqual(len(opt_curve), len(lru_curve))
+        for opt_rate, lru_rate in zip(opt_curve, lru_curve):
+            self.assertGreaterEqual(opt_rate + 1e-9, lru_rate)
+
+    def test_opt_reference_curve_is_opt_in(self):
+        """Teste se a referência OPT padrão reproduz apenas o tamanho configurado"""
+        trace = RequestTrace(RandomGenerators((1, 60)).generate_weighted(300), 'weighted', 1)
+        simulator = CacheSimulator(StubTextManager(), {'LRU': LRUCache(5)})
+
+        with patch('simulation.simulator.opt_hit_rate_curve') as curve_function:
+            (reference,) = simulator.compute_opt_reference({(1, 'weighted'): trace})
+        curve_function.assert_not_called()
+        self.assertEqual(reference['curve'], [])
+
+        (full,) = simulator.compute_opt_reference({(1, 'weighted'): trace}, full_curve=True)
+        self.assertAlmostEqual(reference['hit_rate'], full['hit_rate'])
+        self.assertEqual(len(full['curve']), len(set(trace)))
+
+class TestParallelSimulation(unittest.TestCase):
+    """Testes da execução paralela da simulação"""
+
+    def setUp(self):
+        self.simulator = CacheSimulator(StubTextManager(), {
+            'FIFO': FIFOCache(5),
+            'LRU': LRUCache(5)
+        })
+
+    @patch.dict(SIMULATION_CONFIG, {'requests_per_user': 20, 'algorithms': ['FIFO', 'LRU']})
+    def test_parallel_matches_serial_structure(self):
+        """Teste se o modo paralelo mescla resultados na mesma ordem do sequencial"""
+        serial = self.simulator.run_full_simulation(parallel=False)
+        parallel = self.simulator.run_full_simulation(parallel=True, max_workers=2)
+
+        self.assertEqual(parallel['simulation_info']['execution_mode'], 'parallel')
+        self.assertEqual(list(serial['results_by_algorithm']), list(parallel['results_by_algorithm']))
+
+        for alg, distributions in parallel['results_by_algorithm'].items():
+            self.assertEqual(list(distributions), list(serial['results_by_algorithm'][alg]))
+            for dist, users in distributions.items():
+                for user_result in users:
+                    self.assertEqual(user_result['algorithm'], alg)
+                    self.assertEqual(user_result['distribution_type'], dist)
+                    self.assertEqual(user_result['total_requests'], 20)
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -7,12 +7,15 @@ import tempfile
 import os
 import sys
 from pathlib import Path
+from unittest.mock import patch
 
 # Adicionar path do projeto
 project_root = Path(__file__).parent.parent.parent
 sys.path.append(str(project_root))
 
-from core.text_manager import TextManager
+from core.text_manager import TextManager, decode_text
+from core.mmap_text_manager import MmapTextManager
+from core.packed_corpus import PackedTextManager, build_packed_corpus, is_packed_corpus_stale
 
 class TestTextManager(unittest.TestCase):
     """Testes para TextManager"""
@@ -98,5 +101,255 @@ class TestTextManager(unittest.TestCase):
             min_expected = DISK_DELAY_SIMULATION['min_delay']
             self.assertGreaterEqual(elapsed, min_expected * 0.8)  # Margem de erro
 
+class TestLoadMany(unittest.TestCase):
+    """Testes para a carga de vários textos em paralelo"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        for text_id in range(1, 9):
+            file_path = Path(self.temp_dir) / f"{text_id}.txt"
+            file_path.write_text(f"Texto {text_id}", encoding='utf-8')
+        self.text_manager = TextManager(self.temp_dir)
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def test_load_many_overlaps_delays(self):
+        """Teste se os atrasos simulados das leituras se sobrepõem"""
+        import time
+        with patch.object(TextManager, '_simulate_disk_delay', lambda self: time.sleep(0.1)):
+            start_time = time.perf_counter()
+            contents = self.text_manager.load_many([1, 2, 3, 4, 5, 6, 7, 8, 2, 99])
+            elapsed = time.perf_counter() - start_time
+
+        self.assertEqual(sorted(contents), list(range(1, 9)))
+        self.assertEqual(contents[3], "Texto 3")
+        self.assertLess(elapsed, 0.5)
+
+    def test_load_many_empty(self):
+        """Teste lote vazio"""
+        self.assertEqual(self.text_manager.load_many([]), {})
+
+    def test_iter_load_streams_and_bounds_workers(self):
+        """Teste entrega por término e limite de leituras simultâneas"""
+        import threading
+        import time
+        active = [0, 0]  # leituras em andamento, máximo observado
+        lock = threading.Lock()
+
+        def delay(self_):
+            with lock:
+                active[0] += 1
+                active[1] = max(active[1], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+
+        with patch.object(TextManager, '_simulate_disk_delay', delay):
+            results = list(self.text_manager.iter_load(range(1, 10), max_workers=3))
+
+        self.assertEqual(sorted(text_id for text_id, _ in results), list(range(1, 10)))
+        self.assertIsNone(dict(results)[9])
+        self.assertEqual(active[1], 3)
+
+    def test_read_stats_across_threads(self):
+        """Teste estatísticas agregadas corretamente por várias threads"""
+        import pickle
+        for _ in range(20):
+            self.text_manager.load_many(range(1, 9), max_workers=8)
+
+        self.assertEqual(self.text_manager.get_read_stats()['count'], 160)
+
+        # O lock das estatísticas é recriado ao desserializar
+        restored = pickle.loads(pickle.dumps(self.text_manager))
+        restored.reset_stats()
+        self.assertEqual(restored.get_read_stats()['count'], 0)
+
+class TestTextIndex(unittest.TestCase):
+    """Testes para a descoberta dos IDs por varredura do diretório"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        for text_id in (2, 5, 250, 100000):
+            (Path(self.temp_dir) / f"{text_id}.txt").write_text(f"Texto {text_id}", encoding='utf-8')
+        (Path(self.temp_dir) / "notas.txt").write_text("ignorado", encoding='utf-8')
+        self.text_manager = TextManager(self.temp_dir)
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def test_ids_discovered_beyond_100(self):
+        """Teste IDs esparsos e acima de 100"""
+        self.assertEqual(self.text_manager.list_available_texts(), [2, 5, 250, 100000])
+        self.assertEqual(self.text_manager.get_id_range(), (2, 100000))
+        self.assertEqual(self.text_manager.load_text(100000), "Texto 100000")
+        self.assertIsNone(self.text_manager.load_text(3))
+        self.assertIsNone(self.text_manager.load_text(0))
+
+    def test_file_created_after_scan(self):
+        """Teste texto criado depois da varredura"""
+        (Path(self.temp_dir) / "7.txt").write_text("Texto 7", encoding='utf-8')
+
+        self.assertTrue(self.text_manager.has_text(7))
+        self.assertEqual(self.text_manager.list_available_texts(), [2, 5, 7, 250, 100000])
+        self.assertEqual(self.text_manager.text_count, 5)
+
+    def test_refresh_merges_new_ids_and_drops_deleted(self):
+        """Teste se refresh_index funde os IDs novos e descarta arquivos removidos"""
+        (Path(self.temp_dir) / "1.txt").write_text("Texto 1", encoding='utf-8')
+        (Path(self.temp_dir) / "300000.txt").write_text("Texto 300000", encoding='utf-8')
+        self.assertTrue(self.text_manager.has_text(300000))
+        self.assertTrue(self.text_manager.has_text(1))
+        self.assertEqual(self.text_manager.get_id_range(), (1, 300000))
+        self.assertEqual(len(self.text_manager._text_ids), 4)  # índice ordenado não é copiado
+
+        (Path(self.temp_dir) / "1.txt").unlink()
+        (Path(self.temp_dir) / "250.txt").unlink()
+        self.assertEqual(self.text_manager.refresh_index(), 4)
+        self.assertFalse(self.text_manager.has_text(1))
+        self.assertFalse(self.text_manager.has_text(250))
+        self.assertEqual(self.text_manager.list_available_texts(), [2, 5, 100000, 300000])
+
+class TestMmapTextManager(unittest.TestCase):
+    """Testes para o backend com mapeamento em memória"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        for text_id in (1, 2):
+            file_path = Path(self.temp_dir) / f"{text_id}.txt"
+            file_path.write_text(f"Texto número {text_id} com acentuação. " * 20, encoding='utf-8')
+        (Path(self.temp_dir) / "3.txt").write_text("", encoding='utf-8')
+
+        self.text_manager = MmapTextManager(self.temp_dir)
+
+    def tearDown(self):
+        import shutil
+        self.text_manager.close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_returns_zero_copy_view(self):
+        """Teste se o texto é entregue como memoryview e decodificado sob demanda"""
+        content = self.text_manager.load_text(1)
+
+        self.assertIsInstance(content, memoryview)
+        self.assertIn("Texto número 1", decode_text(content))
+        self.assertEqual(self.text_manager.get_read_stats()['count'], 1)
+
+    def test_file_mapped_once(self):
+        """Teste se o arquivo é mapeado apenas na primeira leitura"""
+        first = self.text_manager.load_text(2)
+        second = self.text_manager.load_text(2)
+
+        self.assertEqual(len(self.text_manager._maps), 1)
+        self.assertEqual(bytes(first), bytes(second))
+
+    def test_bounded_maps_and_remap_on_change(self):
+        """Teste limite de mapeamentos abertos e remapeamento quando o arquivo muda"""
+        text_manager = MmapTextManager(self.temp_dir, max_maps=1)
+        self.addCleanup(text_manager.close)
+        text_manager.load_text(1)
+        text_manager.load_text(2)
+        self.assertEqual(list(text_manager._maps), [2])
+
+        # Substituir o arquivo (sem truncar o mapeado)
+        text_file = Path(self.temp_dir) / "2.txt"
+        new_file = Path(self.temp_dir) / "novo.tmp"
+        new_file.write_text("Conteúdo novo", encoding='utf-8')
+        stat = text_file.stat()
+        os.utime(new_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        os.replace(new_file, text_file)
+        self.assertEqual(decode_text(text_manager.load_text(2)), "Conteúdo novo")
+
+    def test_empty_and_missing_texts(self):
+        """Teste texto vazio e inexistente"""
+        self.assertEqual(decode_text(self.text_manager.load_text(3)), "")
+        self.assertIsNone(self.text_manager.load_text(50))
+
+    def test_word_count(self):
+        """Teste contagem de palavras com conteúdo em bytes"""
+        self.assertEqual(self.text_manager.get_word_count(1), 5 * 20)
+
+class TestPackedTextManager(unittest.TestCase):
+    """Testes para o corpus compactado em arquivo único"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        for text_id in (1, 2, 3, 250):
+            file_path = Path(self.temp_dir) / f"{text_id}.txt"
+            file_path.write_text(f"Texto número {text_id} com acentuação. " * 20, encoding='utf-8')
+
+        self.pack_path = build_packed_corpus(self.temp_dir, Path(self.temp_dir) / "texts.pack")
+        self.text_manager = PackedTextManager(self.pack_path)
+
+    def tearDown(self):
+        import shutil
+        self.text_manager.close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_load_text(self):
+        """Teste leitura pelo índice, inclusive IDs não contíguos"""
+        self.assertIn("Texto número 2", self.text_manager.load_text(2))
+        self.assertIn("Texto número 250", self.text_manager.load_text(250))
+        self.assertIsNone(self.text_manager.load_text(4))
+        self.assertEqual(self.text_manager.get_read_stats()['count'], 2)
+
+    def test_list_and_info(self):
+        """Teste listagem e informações a partir do índice"""
+        self.assertEqual(self.text_manager.list_available_texts(), [1, 2, 3, 250])
+
+        info = self.text_manager.get_text_info(3)
+        expected_size = (Path(self.temp_dir) / "3.txt").stat().st_size
+        self.assertEqual(info['size_bytes'], expected_size)
+
+    def test_index_methods_use_pack_index(self):
+        """Teste has_text/get_id_range/refresh_index a partir do índice do corpus"""
+        self.assertTrue(self.text_manager.has_text(250))
+        self.assertFalse(self.text_manager.has_text(4))
+        self.assertEqual(self.text_manager.get_id_range(), (1, 250))
+
+        (Path(self.temp_dir) / "4.txt").write_text("Texto 4", encoding='utf-8')
+        build_packed_corpus(self.temp_dir, self.pack_path)
+        self.assertEqual(self.text_manager.refresh_index(), 5)
+        self.assertEqual(self.text_manager.load_text(4), "Texto 4")
+
+    def test_checksum_mismatch(self):
+        """Teste se dados corrompidos são rejeitados"""
+        offset = self.text_manager.get_text_info(1)['offset']
+        with open(self.pack_path, 'r+b') as f:
+            f.seek(offset)
+            f.write(b'X')
+
+        self.assertIsNone(self.text_manager.load_text(1))
+        self.assertIn("Texto", PackedTextManager(self.pack_path, verify_checksums=False).load_text(1))
+
+    def test_stale_corpus_detection(self):
+        """Teste se textos alterados ou adicionados depois do corpus o tornam desatualizado"""
+        self.assertFalse(is_packed_corpus_stale(self.temp_dir, self.pack_path))
+
+        text_file = Path(self.temp_dir) / "2.txt"
+        text_file.write_text("Texto alterado", encoding='utf-8')
+        pack_mtime = self.pack_path.stat().st_mtime_ns
+        os.utime(text_file, ns=(pack_mtime, pack_mtime + 10**9))
+        # A verificação padrão só olha o diretório; a edição exige check_files
+        self.assertFalse(is_packed_corpus_stale(self.temp_dir, self.pack_path))
+        self.assertTrue(is_packed_corpus_stale(self.temp_dir, self.pack_path, check_files=True))
+
+        (Path(self.temp_dir) / "9.txt").write_text("Texto novo", encoding='utf-8')
+        os.utime(self.temp_dir, ns=(pack_mtime, pack_mtime + 10**9))
+        self.assertTrue(is_packed_corpus_stale(self.temp_dir, self.pack_path))
+
+        self.assertTrue(is_packed_corpus_stale(self.temp_dir, Path(self.temp_dir) / "outro.pack"))
+
+    def test_pickle_reopens_file(self):
+        """Teste se o backend pode ser enviado a outro processo"""
+        import pickle
+        clone = pickle.loads(pickle.dumps(self.text_manager))
+        try:
+            self.assertEqual(clone.load_text(3), self.text_manager.load_text(3))
+        finally:
+            clone.close()
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
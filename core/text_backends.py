@@ -0,0 +1,40 @@
+"""
+Seleção do backend de armazenamento dos textos
+"""
+
+from core.text_manager import TextManager
+from core.mmap_text_manager import MmapTextManager
+from core.packed_corpus import PackedTextManager, build_packed_corpus, is_packed_corpus_stale
+from core.config import settings
+
+# Backends disponíveis: nome -> classe
+TEXT_BACKENDS = {
+    'files': TextManager,
+    'mmap': MmapTextManager,
+    'packed': PackedTextManager
+}
+
+
+def create_text_manager(backend, texts_directory):
+    """
+    Cria o gerenciador de textos do backend escolhido
+
+    Args:
+        backend (str): Nome do backend ('files', 'mmap' ou 'packed')
+        texts_directory: Diretório dos textos
+
+    Returns:
+        TextManager: Instância do backend
+    """
+    if backend not in TEXT_BACKENDS:
+        raise ValueError(f"Backend de textos desconhecido: {backend}")
+
+    if backend == 'packed':
+        # Gerar o corpus compactado na primeira execução ou se textos foram
+        # adicionados/removidos (conferir cada texto só se configurado)
+        if is_packed_corpus_stale(texts_directory, settings.PACKED_CORPUS_FILE,
+                                  check_files=settings.PACKED_CORPUS_VERIFY):
+            build_packed_corpus(texts_directory, settings.PACKED_CORPUS_FILE)
+        return PackedTextManager(settings.PACKED_CORPUS_FILE)
+
+    return TEXT_BACKENDS[backend](texts_directory)
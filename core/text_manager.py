@@ -1,13 +1,44 @@
 """
 Módulo de gerenciamento de textos - Aluno A
-Responsável por carregar e gerenciar os 100 textos do disco
+Responsável por carregar e gerenciar os textos do disco
+Os IDs disponíveis são descobertos por uma varredura do diretório e mantidos em
+um índice ordenado (array), então o corpus pode ter de 100 a milhões de textos
 """
 
+import os
+import re
 import time
 import random
+import threading
+from array import array
+from bisect import bisect_left
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 from core.config import settings
 
+# Arquivos de texto reconhecidos: "<id>.txt"
+TEXT_FILE_PATTERN = re.compile(r'^(\d+)\.txt$')
+
+# Quantidade de IDs descobertos após a varredura que dispara a fusão com o índice
+NEW_IDS_MERGE_THRESHOLD = 1024
+
+def decode_text(content):
+    """
+    Converte o conteúdo de um texto em str
+
+    Backends como o mmap entregam bytes/memoryview; a decodificação é adiada
+    até o texto ser realmente exibido.
+
+    Args:
+        content: str, bytes, bytearray ou memoryview (UTF-8)
+
+    Returns:
+        str: Conteúdo decodificado
+    """
+    if isinstance(content, str) or content is None:
+        return content
+    return bytes(content).decode('utf-8')
+
 class TextManager:
     """Classe responsável pelo carregamento dos textos do disco"""
 
@@ -15,76 +46,353 @@ class TextManager:
         self.texts_dir = Path(texts_directory)
         self.texts_dir.mkdir(parents=True, exist_ok=True)
 
-        # Estatísticas de leitura do disco
+        # Estatísticas de leitura do disco (atualizadas por várias threads nas cargas em lote)
         self.total_read_time = 0.0
         self.disk_reads = 0
+        self._stats_lock = threading.Lock()
+
+        # Índice ordenado dos IDs disponíveis
+        self._index_lock = threading.Lock()
+        self.refresh_index()
 
-        # Verificar se todos os textos existem
+        # Verificar se há lacunas no corpus
         self._validate_texts()
 
+    def refresh_index(self):
+        """
+        Reconstrói o índice de IDs com uma única varredura do diretório
+
+        Returns:
+            int: Número de textos encontrados
+        """
+        found = []
+        with os.scandir(self.texts_dir) as entries:
+            for entry in entries:
+                match = TEXT_FILE_PATTERN.match(entry.name)
+                if match and int(match.group(1)) >= 1 and entry.is_file():
+                    found.append(int(match.group(1)))
+
+        text_ids = array('q', sorted(found))
+        with self._index_lock:
+            # A varredura já inclui os IDs novos e descarta os arquivos removidos
+            self._text_ids = text_ids
+            self._new_ids = set()
+            self.text_count = len(text_ids)
+        return self.text_count
+
+    def _merge_new_ids(self):
+        """Funde os IDs descobertos após a varredura no índice ordenado (requer _index_lock)"""
+        merged = array('q', sorted(self._text_ids.tolist() + list(self._new_ids)))
+        self._text_ids = merged
+        self._new_ids = set()
+
     def _validate_texts(self):
-        """Valida se todos os 100 textos estão disponíveis"""
-        missing_texts = []
-        for i in range(1, 101):
-            text_file = self.texts_dir / f"{i}.txt"
-            if not text_file.exists():
-                missing_texts.append(i)
-
-        if missing_texts:
-            print(f"AVISO: {len(missing_texts)} textos não encontrados: {missing_texts[:10]}...")
+        """Valida se o corpus tem textos e se os IDs são contínuos"""
+        id_range = self.get_id_range()
+        if id_range is None:
+            print(f"AVISO: nenhum texto encontrado em {self.texts_dir}")
             print("Execute o script generate_texts.py para criar os textos em falta.")
+            return
+
+        first_id, last_id = id_range
+        missing_count = (last_id - first_id + 1) - self.text_count
+        if missing_count:
+            missing_texts = []
+            for text_id in range(first_id, last_id + 1):
+                if not self._is_indexed(text_id):
+                    missing_texts.append(text_id)
+                    if len(missing_texts) == 10:
+                        break
+            print(f"AVISO: {missing_count} textos não encontrados: {missing_texts}...")
+            print("Execute o script generate_texts.py para criar os textos em falta.")
+
+    def _is_indexed(self, text_id):
+        """Verifica se um ID está no índice (busca binária) ou entre os IDs novos"""
+        text_ids = self._text_ids
+        position = bisect_left(text_ids, text_id)
+        if position < len(text_ids) and text_ids[position] == text_id:
+            return True
+        return text_id in self._new_ids
+
+    def has_text(self, text_id):
+        """
+        Verifica se um texto existe
+
+        IDs fora do índice são conferidos no disco, para aceitar arquivos
+        criados depois da varredura. Eles ficam em um conjunto à parte, fundido
+        ao índice em refresh_index ou quando passa de NEW_IDS_MERGE_THRESHOLD.
+
+        Args:
+            text_id (int): ID do texto
+
+        Returns:
+            bool: True se o texto existe
+        """
+        if text_id < 1:
+            return False
+        if self._is_indexed(text_id):
+            return True
+        if not (self.texts_dir / f"{text_id}.txt").is_file():
+            return False
+
+        with self._index_lock:
+            if not self._is_indexed(text_id):
+                self._new_ids.add(text_id)
+                self.text_count += 1
+                if len(self._new_ids) >= NEW_IDS_MERGE_THRESHOLD:
+                    self._merge_new_ids()
+        return True
+
+    def get_id_range(self):
+        """
+        Retorna o menor e o maior ID disponíveis
+
+        Returns:
+            tuple: (primeiro ID, último ID) ou None se não há textos
+        """
+        with self._index_lock:
+            text_ids, new_ids = self._text_ids, self._new_ids
+            if not text_ids and not new_ids:
+                return None
+            bounds = [text_ids[0], text_ids[-1]] if text_ids else []
+            if new_ids:
+                bounds += [min(new_ids), max(new_ids)]
+        return min(bounds), max(bounds)
 
     def load_text(self, text_id):
         """
         Carrega um texto do disco (simula lentidão do sistema forense)
 
         Args:
-            text_id (int): ID do texto (1-100)
+            text_id (int): ID do texto
+
+        Returns:
+            str: Conteúdo do texto ou None se não encontrado
+        """
+        text_file = self._resolve_text_file(text_id)
+
+        if text_file is None:
+            return None
+
+        # Simular lentidão do disco forense
+        self._simulate_disk_delay()
+
+        return self._read_text_file(text_id, text_file)
+
+    def iter_load(self, text_ids, max_workers=None):
+        """
+        Carrega vários textos em paralelo, entregando cada um assim que termina
+
+        As leituras rodam em um pool limitado a max_workers threads (a carga é
+        dominada pela espera do disco, então threads bastam) e no máximo
+        max_workers leituras ficam pendentes de cada vez, mesmo para conjuntos
+        grandes de IDs. Interromper a iteração cancela as leituras não iniciadas.
+
+        Args:
+            text_ids: IDs dos textos (repetidos são lidos uma única vez)
+            max_workers (int, optional): Leituras simultâneas (None = settings.BULK_LOAD)
+
+        Yields:
+            tuple: (ID do texto, conteúdo ou None se não encontrado), em ordem de término
+        """
+        pending_ids = iter(dict.fromkeys(text_ids))
+        workers = max_workers or settings.BULK_LOAD['max_workers']
+        if workers < 1:
+            raise ValueError("max_workers deve ser pelo menos 1")
+
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bulk-load")
+        running = {}
+        try:
+            for text_id in pending_ids:
+                running[executor.submit(self.load_text, text_id)] = text_id
+                if len(running) >= workers:
+                    break
+
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield running.pop(future), future.result()
+
+                # Repor as leituras concluídas com os próximos IDs
+                for text_id in pending_ids:
+                    running[executor.submit(self.load_text, text_id)] = text_id
+                    if len(running) >= workers:
+                        break
+        finally:
+            for future in running:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def load_many(self, text_ids, max_workers=None):
+        """
+        Carrega vários textos com leituras em paralelo
+
+        Cada texto paga o próprio atraso simulado, mas as leituras se sobrepõem,
+        então o lote custa aproximadamente um atraso por rodada de max_workers.
+
+        Args:
+            text_ids: IDs dos textos (repetidos são lidos uma única vez)
+            max_workers (int, optional): Leituras simultâneas (None = settings.BULK_LOAD)
+
+        Returns:
+            dict: ID -> conteúdo dos textos encontrados, na ordem pedida
+        """
+        text_ids = list(dict.fromkeys(text_ids))
+        if not text_ids:
+            return {}
+
+        workers = min(max_workers or settings.BULK_LOAD['max_workers'], len(text_ids))
+        contents = dict(self.iter_load(text_ids, workers))
+        return {text_id: contents[text_id] for text_id in text_ids
+                if contents[text_id] is not None}
+
+    def preload_all(self, max_workers=None):
+        """
+        Carrega todo o corpus em paralelo
+
+        Args:
+            max_workers (int, optional): Leituras simultâneas (None = settings.BULK_LOAD)
+
+        Returns:
+            dict: ID -> conteúdo de todos os textos disponíveis
+        """
+        return self.load_many(self.list_available_texts(), max_workers)
+
+    def read_text(self, text_id):
+        """
+        Lê um texto do disco sem aplicar o atraso simulado
+
+        Usado por fachadas que aplicam o atraso por conta própria (ex.: a API
+        assíncrona, que usa asyncio.sleep em vez de time.sleep).
+
+        Args:
+            text_id (int): ID do texto
 
         Returns:
             str: Conteúdo do texto ou None se não encontrado
         """
-        if not (1 <= text_id <= 100):
+        text_file = self._resolve_text_file(text_id)
+
+        if text_file is None:
             return None
 
-        text_file = self.texts_dir / f"{text_id}.txt"
+        return self._read_text_file(text_id, text_file)
+
+    def _resolve_text_file(self, text_id):
+        """
+        Retorna o caminho do arquivo de um texto
+
+        Args:
+            text_id (int): ID do texto
 
-        if not text_file.exists():
+        Returns:
+            Path: Caminho do arquivo ou None se o ID é inválido ou não existe
+        """
+        if not self.has_text(text_id):
             return None
 
-        # Simular lentidão do disco forense
-        if settings.DISK_DELAY_SIMULATION['enabled']:
-            delay = random.uniform(
-                settings.DISK_DELAY_SIMULATION['min_delay'],
-                settings.DISK_DELAY_SIMULATION['max_delay']
-            )
-            time.sleep(delay)
+        return self.texts_dir / f"{text_id}.txt"
+
+    def _read_text_file(self, text_id, text_file):
+        """
+        Lê um texto do disco (sem o atraso simulado) e atualiza as estatísticas
 
+        Args:
+            text_id (int): ID do texto
+            text_file (Path): Caminho do arquivo
+
+        Returns:
+            str: Conteúdo do texto ou None em caso de erro
+        """
         try:
             start_time = time.perf_counter()
-            with open(text_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            elapsed_time = time.perf_counter() - start_time
-            self.total_read_time += elapsed_time
-            self.disk_reads += 1
+            content = self._read_file(text_file)
             
+            self._record_read(time.perf_counter() - start_time)
             return content
         except Exception as e:
             print(f"Erro ao carregar texto {text_id}: {e}")
             return None
 
+    def _record_read(self, elapsed_time):
+        """Contabiliza uma leitura do disco nas estatísticas"""
+        with self._stats_lock:
+            self.total_read_time += elapsed_time
+            self.disk_reads += 1
+
+    def next_disk_delay(self):
+        """
+        Sorteia o atraso simulado da próxima leitura
+
+        Returns:
+            float: Atraso em segundos (0 se a simulação estiver desabilitada)
+        """
+        if not settings.DISK_DELAY_SIMULATION['enabled']:
+            return 0.0
+        return random.uniform(
+            settings.DISK_DELAY_SIMULATION['min_delay'],
+            settings.DISK_DELAY_SIMULATION['max_delay']
+        )
+
+    def _simulate_disk_delay(self):
+        """Aplica o atraso simulado do disco forense, se habilitado"""
+        delay = self.next_disk_delay()
+        if delay > 0:
+            time.sleep(delay)
+
+    def _read_file(self, text_file):
+        """Lê o conteúdo de um arquivo de texto"""
+        with open(text_file, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def get_expected_disk_delay(self):
+        """
+        Retorna o atraso médio esperado do disco simulado
+
+        Returns:
+            float: Atraso médio em segundos (0 se a simulação estiver desabilitada)
+        """
+        if not settings.DISK_DELAY_SIMULATION['enabled']:
+            return 0.0
+        return (settings.DISK_DELAY_SIMULATION['min_delay'] +
+                settings.DISK_DELAY_SIMULATION['max_delay']) / 2
+
+    def measure_read_time(self, text_id, repeats=1):
+        """
+        Mede o tempo de leitura de um texto sem o atraso simulado
+
+        Não altera as estatísticas de leitura do disco.
+
+        Args:
+            text_id (int): ID do texto
+            repeats (int): Número de leituras para calcular a média
+
+        Returns:
+            float: Tempo médio de leitura em segundos ou None se o texto não existe
+        """
+        text_file = self._resolve_text_file(text_id)
+
+        if text_file is None:
+            return None
+
+        start_time = time.perf_counter()
+        for _ in range(repeats):
+            self._read_file(text_file)
+        return (time.perf_counter() - start_time) / repeats
+
     def get_read_stats(self):
         """Retorna estatísticas de leitura do disco."""
-        return {
-            'total_time': self.total_read_time,
-            'count': self.disk_reads
-        }
+        with self._stats_lock:
+            return {
+                'total_time': self.total_read_time,
+                'count': self.disk_reads
+            }
 
     def reset_stats(self):
         """Reseta as estatísticas de leitura."""
-        self.total_read_time = 0.0
-        self.disk_reads = 0
+        with self._stats_lock:
+            self.total_read_time = 0.0
+            self.disk_reads = 0
 
     def get_text_info(self, text_id):
         """
@@ -96,12 +404,9 @@ class TextManager:
         Returns:
             dict: Informações do texto ou None
         """
-        if not (1 <= text_id <= 100):
-            return None
+        text_file = self._resolve_text_file(text_id)
 
-        text_file = self.texts_dir / f"{text_id}.txt"
-
-        if not text_file.exists():
+        if text_file is None:
             return None
 
         try:
@@ -116,19 +421,33 @@ class TextManager:
             print(f"Erro ao obter informações do texto {text_id}: {e}")
             return None
 
+    def get_modified_time(self, text_id):
+        """
+        Retorna o instante de modificação do arquivo de um texto
+
+        Usado como versão das entradas do cache (TTLCache): se o arquivo mudar
+        no disco, a entrada em cache deixa de ser válida.
+
+        Args:
+            text_id (int): ID do texto
+
+        Returns:
+            float: mtime do arquivo ou None se o texto não existir
+        """
+        info = self.get_text_info(text_id)
+        return info['modified_time'] if info else None
+
     def list_available_texts(self):
         """
         Lista todos os textos disponíveis
 
         Returns:
-            list: Lista de IDs dos textos disponíveis
+            list: Lista de IDs dos textos disponíveis (ordem crescente)
         """
-        available = []
-        for i in range(1, 101):
-            text_file = self.texts_dir / f"{i}.txt"
-            if text_file.exists():
-                available.append(i)
-        return available
+        with self._index_lock:
+            if self._new_ids:
+                self._merge_new_ids()
+            return self._text_ids.tolist()
 
     def get_word_count(self, text_id):
         """
@@ -142,5 +461,17 @@ class TextManager:
         """
         content = self.load_text(text_id)
         if content:
-            return len(content.split())
-        return 0
\ No newline at end of file
+            return len(decode_text(content).split())
+        return 0
+
+    def __getstate__(self):
+        # Locks não são serializáveis (simulação multiprocesso)
+        state = self.__dict__.copy()
+        state.pop('_stats_lock', None)
+        state.pop('_index_lock', None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._stats_lock = threading.Lock()
+        self._index_lock = threading.Lock()
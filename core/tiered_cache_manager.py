@@ -0,0 +1,554 @@
+"""
+Gerenciador de cache em dois níveis
+L1: política em memória (FIFO, LRU, LFU, MRU...); L2: cache local em disco
+(sqlite) que recebe os textos removidos do L1 e é consultado antes do disco
+forense lento
+"""
+
+import functools
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from core.concurrent_cache_manager import ConcurrentCacheManager
+from algorithms.cache_utils import put_many
+
+# Tipo original do valor armazenado no L2
+_TEXT_KIND = 's'
+_BINARY_KIND = 'b'
+
+
+class DiskL2Cache:
+    """
+    Cache local em arquivo sqlite com remoção LRU
+
+    Os acessos são ordenados por um contador lógico persistido junto com cada
+    entrada, então a ordem LRU sobrevive a reinicializações. Cada entrada pode
+    guardar também a versão (ex.: mtime do arquivo) e o prazo de expiração que
+    tinha no L1, conferidos por quem a lê.
+    """
+
+    def __init__(self, path, max_entries: int = 1000, max_bytes: Optional[int] = None):
+        """
+        Inicializa o cache em disco
+
+        Args:
+            path: Caminho do arquivo sqlite (':memory:' para testes)
+            max_entries (int): Número máximo de textos armazenados
+            max_bytes (int, optional): Orçamento máximo em bytes (None = sem limite)
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        if path != ':memory:':
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key INTEGER PRIMARY KEY, kind TEXT NOT NULL, value BLOB NOT NULL, "
+            "size INTEGER NOT NULL, last_access INTEGER NOT NULL, version, expires_at REAL)"
+        )
+        # Arquivos criados antes das colunas de versão e prazo
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(entries)")}
+        for column in ('version', 'expires_at REAL'):
+            if column.split()[0] not in columns:
+                self._conn.execute(f"ALTER TABLE entries ADD COLUMN {column}")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_lru ON entries (last_access)")
+
+        count, total, tick = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(MAX(last_access), 0) FROM entries"
+        ).fetchone()
+        self.entry_count = count
+        self.current_bytes = total
+        self._tick = tick
+
+        # Estatísticas
+        self.hit_count = 0
+        self.miss_count = 0
+        self.write_count = 0
+        self.eviction_count = 0
+
+    def _next_tick(self) -> int:
+        self._tick += 1
+        return self._tick
+
+    def get(self, key: int) -> Any:
+        """
+        Recupera um texto do cache em disco
+
+        Args:
+            key (int): ID do texto
+
+        Returns:
+            str ou bytes com o conteúdo, ou None se não encontrado
+        """
+        entry = self.get_entry(key)
+        return entry[0] if entry is not None else None
+
+    def get_entry(self, key: int) -> Optional[tuple]:
+        """
+        Recupera um texto do cache em disco junto com a versão e o prazo
+
+        Args:
+            key (int): ID do texto
+
+        Returns:
+            tuple: (conteúdo, versão ou None, prazo ou None), ou None se não encontrado
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT kind, value, version, expires_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.miss_count += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE entries SET last_access = ? WHERE key = ?", (self._next_tick(), key)
+            )
+            self.hit_count += 1
+
+        kind, value, version, expires_at = row
+        value = value.decode('utf-8') if kind == _TEXT_KIND else bytes(value)
+        return value, version, expires_at
+
+    def put(self, key: int, value: Any, version: Any = None,
+            expires_at: Optional[float] = None) -> None:
+        """
+        Armazena um texto no cache em disco, removendo os menos recentes se necessário
+
+        Args:
+            key (int): ID do texto
+            value: str, bytes ou memoryview
+            version (optional): Versão do texto (número ou string, ex.: mtime do arquivo)
+            expires_at (float, optional): Prazo de expiração no relógio do L1
+        """
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            kind, data = _BINARY_KIND, bytes(value)
+        else:
+            kind, data = _TEXT_KIND, str(value).encode('utf-8')
+
+        if self.max_bytes is not None and len(data) > self.max_bytes:
+            return
+
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute("BEGIN")
+            try:
+                previous = cursor.execute(
+                    "SELECT size FROM entries WHERE key = ?", (key,)
+                ).fetchone()
+                if previous is not None:
+                    self.entry_count -= 1
+                    self.current_bytes -= previous[0]
+
+                cursor.execute(
+                    "INSERT OR REPLACE INTO entries "
+                    "(key, kind, value, size, last_access, version, expires_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, kind, data, len(data), self._next_tick(), version, expires_at)
+                )
+                self.entry_count += 1
+                self.current_bytes += len(data)
+                self.write_count += 1
+
+                self._evict_over_limit(cursor)
+                cursor.execute("COMMIT")
+            except Exception:
+                cursor.execute("ROLLBACK")
+                raise
+
+    def _evict_over_limit(self, cursor: sqlite3.Cursor) -> None:
+        """Remove as entradas menos recentemente usadas até respeitar os limites"""
+        while (self.entry_count > self.max_entries or
+               (self.max_bytes is not None and self.current_bytes > self.max_bytes)):
+            key, size = cursor.execute(
+                "SELECT key, size FROM entries ORDER BY last_access LIMIT 1"
+            ).fetchone()
+            cursor.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self.entry_count -= 1
+            self.current_bytes -= size
+            self.eviction_count += 1
+
+    def remove(self, key: int) -> bool:
+        """
+        Remove um texto do cache em disco
+
+        Args:
+            key (int): ID do texto
+
+        Returns:
+            bool: True se o texto estava armazenado
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT size FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return False
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self.entry_count -= 1
+            self.current_bytes -= row[0]
+            return True
+
+    def clear(self) -> None:
+        """Remove todos os textos do cache em disco"""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self.entry_count = 0
+            self.current_bytes = 0
+
+    def size(self) -> int:
+        """Retorna o número de textos armazenados"""
+        return self.entry_count
+
+    def get_stats(self) -> dict:
+        """
+        Retorna estatísticas do cache em disco
+
+        Returns:
+            dict: Estatísticas detalhadas
+        """
+        total = self.hit_count + self.miss_count
+        return {
+            'path': str(self.path),
+            'current_size': self.entry_count,
+            'max_entries': self.max_entries,
+            'bytes_used': self.current_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hit_count,
+            'misses': self.miss_count,
+            'hit_rate': (self.hit_count / total * 100) if total > 0 else 0,
+            'writes': self.write_count,
+            'evictions': self.eviction_count
+        }
+
+    def reset_stats(self) -> None:
+        """Reinicia as estatísticas sem limpar o cache"""
+        self.hit_count = 0
+        self.miss_count = 0
+        self.write_count = 0
+        self.eviction_count = 0
+
+    def close(self) -> None:
+        """Fecha a conexão com o arquivo sqlite"""
+        with self._lock:
+            self._conn.close()
+
+
+class TieredCacheManager(ConcurrentCacheManager):
+    """
+    Gerenciador de cache com L1 em memória e L2 em disco local
+
+    Os textos removidos por capacidade das políticas do L1 são rebaixados para o
+    L2 (via on_evict). O on_evict roda com o lock da partição do L1, então o
+    texto apenas entra em uma fila de rebaixamento; a escrita no sqlite
+    acontece depois que a operação libera o lock. Um miss no L1 consulta o L2; se o texto estiver lá, ele é
+    promovido de volta ao L1. Apenas misses nos dois níveis vão ao disco forense.
+    O L2 é compartilhado por todos os algoritmos, pois o conteúdo de um texto
+    não depende da política.
+
+    Com uma camada de expiração (TTLCache) no L1, o texto rebaixado leva a
+    versão e o prazo que tinha; um texto vencido ou alterado no disco enquanto
+    estava no L2 é descartado na leitura, e a promoção mantém a versão e o
+    tempo de vida restante em vez de recomeçá-los.
+    """
+
+    def __init__(self, cache_algorithms: Dict[str, Any], l2_cache: DiskL2Cache,
+                 num_shards: int = 1):
+        """
+        Inicializa o gerenciador em dois níveis
+
+        Args:
+            cache_algorithms: Dicionário nome -> instância da política (L1)
+            l2_cache: Cache em disco (L2)
+            num_shards: Número de partições por algoritmo no L1
+        """
+        super().__init__(cache_algorithms, num_shards)
+        self.l2 = l2_cache
+
+        self._tier_lock = threading.Lock()
+        self.tier_stats = {alg: self._empty_tier_stats() for alg in cache_algorithms}
+        self._pending_demotions = OrderedDict()  # ID -> (conteúdo, versão, prazo) ainda não gravado no L2
+
+        # Rebaixar para o L2 tudo que o L1 remover por capacidade; entradas que
+        # vencem no L1 (TTLCache) também são descartadas do L2
+        for alg, shards in self.shards.items():
+            for shard in shards:
+                shard.on_evict = functools.partial(self._demote, alg, shard)
+                if hasattr(shard, 'on_expire'):
+                    shard.on_expire = self._discard_demoted
+
+    @staticmethod
+    def _empty_tier_stats() -> Dict:
+        return {'l1_hits': 0, 'l2_hits': 0, 'misses': 0, 'demotions': 0}
+
+    @staticmethod
+    def _expiry_layer(shard: Any) -> Any:
+        """Retorna o método entry_metadata da partição, se ela tiver expiração"""
+        return getattr(type(shard), 'entry_metadata', None)
+
+    def _demote(self, algorithm: str, shard: Any, key: int, value: Any) -> None:
+        """Enfileira para o L2 um texto removido do L1 (chamado com o lock da partição)"""
+        entry_metadata = self._expiry_layer(shard)
+        version, expires_at = entry_metadata(shard, key) if entry_metadata else (None, None)
+        with self._tier_lock:
+            self._pending_demotions[key] = (value, version, expires_at)
+            self._pending_demotions.move_to_end(key)
+            self.tier_stats[algorithm]['demotions'] += 1
+
+    def _discard_demoted(self, key: int) -> None:
+        """Descarta a cópia de um texto vencido ou desatualizado da fila e do L2"""
+        with self._tier_lock:
+            self._pending_demotions.pop(key, None)
+        self.l2.remove(key)
+
+    def _flush_demotions(self) -> None:
+        """Grava no L2 os rebaixamentos enfileirados (chamado sem o lock do L1)"""
+        with self._tier_lock:
+            if not self._pending_demotions:
+                return
+            pending = list(self._pending_demotions.items())
+
+        for key, (value, version, expires_at) in pending:
+            self.l2.put(key, value, version=version, expires_at=expires_at)
+
+        # Os textos ficam visíveis na fila até estarem no L2
+        with self._tier_lock:
+            for key, entry in pending:
+                if self._pending_demotions.get(key) is entry:
+                    del self._pending_demotions[key]
+
+    def _get_demoted(self, key: int, algorithm: str) -> Optional[tuple]:
+        """
+        Procura um texto na fila de rebaixamento e, em seguida, no L2
+
+        Se a partição do L1 tem expiração, o prazo e a versão guardados são
+        conferidos; uma cópia vencida ou desatualizada é descartada.
+
+        Args:
+            key (int): ID do texto
+            algorithm (str): Nome do algoritmo que vai receber o texto
+
+        Returns:
+            tuple: (conteúdo, versão, tempo de vida restante) ou None
+        """
+        with self._tier_lock:
+            entry = self._pending_demotions.get(key)
+        if entry is None:
+            entry = self.l2.get_entry(key)
+            if entry is None:
+                return None
+
+        value, version, expires_at = entry
+        shard = self.shards[algorithm][self._shard_index(key)]
+        if not self._expiry_layer(shard):
+            return value, None, None
+
+        ttl = None
+        if expires_at is not None:
+            ttl = expires_at - shard.clock.now()
+            if ttl <= 0:
+                self._discard_demoted(key)
+                return None
+            if shard.default_ttl is not None:
+                # Prazos de outra execução (relógio monotônico) não passam do padrão
+                ttl = min(ttl, shard.default_ttl)
+        if version is not None and shard.validator is not None and shard.validator(key) != version:
+            self._discard_demoted(key)
+            return None
+        return value, version, ttl
+
+    def _promote(self, promoted: Iterable[tuple], algorithm: str) -> None:
+        """Devolve ao L1 textos lidos do L2, mantendo versão e tempo de vida restante"""
+        groups = {}
+        for entry in promoted:
+            groups.setdefault(self._shard_index(entry[0]), []).append(entry)
+
+        for index, shard_entries in groups.items():
+            with self.locks[algorithm][index]:
+                shard = self.shards[algorithm][index]
+                if self._expiry_layer(shard):
+                    for key, value, version, ttl in shard_entries:
+                        shard.put(key, value, ttl=ttl, version=version)
+                else:
+                    put_many(shard, [(key, value) for key, value, _, _ in shard_entries])
+        self._flush_demotions()
+
+    def put(self, key: int, value: str, algorithm: str) -> None:
+        """
+        Armazena um texto no L1 e grava no L2 o que ele tiver removido
+
+        Args:
+            key (int): Chave do item (ID do texto)
+            value (str): Conteúdo do texto
+            algorithm (str): Nome do algoritmo
+        """
+        super().put(key, value, algorithm)
+        self._flush_demotions()
+
+    def put_many(self, items: Iterable[Tuple[int, str]], algorithm: str) -> None:
+        """
+        Armazena vários textos no L1 e grava no L2 o que eles tiverem removido
+
+        Args:
+            items: Pares (ID do texto, conteúdo) ou dicionário ID -> conteúdo
+            algorithm (str): Nome do algoritmo
+        """
+        super().put_many(items, algorithm)
+        self._flush_demotions()
+
+    def restore_entries(self, algorithm: str, entries: Iterable[tuple]) -> int:
+        """
+        Reinsere entradas de um snapshot no L1 e grava no L2 o que elas tiverem removido
+
+        Args:
+            algorithm (str): Nome do algoritmo
+            entries: Sequência de (chave, conteúdo, frequência ou None)
+
+        Returns:
+            int: Número de entradas reinseridas
+        """
+        restored = super().restore_entries(algorithm, entries)
+        self._flush_demotions()
+        return restored
+
+    def get(self, key: int, algorithm: str) -> Optional[str]:
+        """
+        Recupera um texto do L1 ou, em caso de miss, do L2
+
+        Args:
+            key (int): Chave do item (ID do texto)
+            algorithm (str): Nome do algoritmo
+
+        Returns:
+            Optional[str]: Conteúdo ou None se não estiver em nenhum nível
+        """
+        result = super().get(key, algorithm)
+        if result is not None:
+            with self._tier_lock:
+                self.tier_stats[algorithm]['l1_hits'] += 1
+            return result
+
+        entry = self._get_demoted(key, algorithm)
+        with self._tier_lock:
+            self.tier_stats[algorithm]['l2_hits' if entry is not None else 'misses'] += 1
+
+        if entry is None:
+            return None
+        # Promover de volta ao L1
+        value, version, ttl = entry
+        self._promote([(key, value, version, ttl)], algorithm)
+        return value
+
+    def get_many(self, keys: Iterable[int], algorithm: str) -> Dict[int, Any]:
+        """
+        Recupera vários textos do L1 e, para os que faltarem, do L2
+
+        Args:
+            keys: IDs dos textos
+            algorithm (str): Nome do algoritmo
+
+        Returns:
+            Dict[int, Any]: ID -> conteúdo apenas dos textos encontrados
+        """
+        keys = list(keys)
+        found = super().get_many(keys, algorithm)
+
+        promoted = []
+        misses = 0
+        for key in keys:
+            if key in found:
+                continue
+            entry = self._get_demoted(key, algorithm)
+            if entry is None:
+                misses += 1
+            else:
+                found[key] = entry[0]
+                promoted.append((key,) + entry)
+
+        with self._tier_lock:
+            stats = self.tier_stats[algorithm]
+            stats['l1_hits'] += len(keys) - len(promoted) - misses
+            stats['l2_hits'] += len(promoted)
+            stats['misses'] += misses
+
+        # Promover de volta ao L1
+        if promoted:
+            self._promote(promoted, algorithm)
+        return {key: found[key] for key in keys if key in found}
+
+    def invalidate(self, key: int, algorithm: str = None) -> int:
+        """
+        Remove uma única chave do L1 (algoritmo especificado ou todos) e do L2
+
+        Args:
+            key (int): Chave do item (ID do texto)
+            algorithm (str, optional): Nome do algoritmo ou None para todos
+
+        Returns:
+            int: Número de caches do L1 que continham a chave
+        """
+        removed = super().invalidate(key, algorithm)
+        with self._tier_lock:
+            self._pending_demotions.pop(key, None)
+        self.l2.remove(key)
+        return removed
+
+    def clear(self, algorithm: str = None, include_l2: bool = False) -> None:
+        """
+        Limpa o L1 do algoritmo especificado ou de todos
+
+        Args:
+            algorithm (str, optional): Nome do algoritmo ou None para todos
+            include_l2 (bool): Também limpar o cache em disco
+        """
+        super().clear(algorithm)
+        if include_l2:
+            with self._tier_lock:
+                self._pending_demotions.clear()
+            self.l2.clear()
+
+    def get_tier_stats(self, algorithm: str) -> Dict:
+        """
+        Retorna as estatísticas por nível de um algoritmo
+
+        Args:
+            algorithm (str): Nome do algoritmo
+
+        Returns:
+            Dict: Hits no L1, hits no L2, misses, rebaixamentos e taxas de acerto
+        """
+        self._check_algorithm(algorithm)
+        with self._tier_lock:
+            stats = dict(self.tier_stats[algorithm])
+
+        total = stats['l1_hits'] + stats['l2_hits'] + stats['misses']
+        l1_misses = total - stats['l1_hits']
+        stats.update({
+            'total_requests': total,
+            'l1_hit_rate': (stats['l1_hits'] / total * 100) if total > 0 else 0,
+            'l2_hit_rate': (stats['l2_hits'] / l1_misses * 100) if l1_misses > 0 else 0,
+            'combined_hit_rate': ((stats['l1_hits'] + stats['l2_hits']) / total * 100)
+                                 if total > 0 else 0,
+            'l2': self.l2.get_stats()
+        })
+        return stats
+
+    def reset_stats(self):
+        """Reinicia todas as estatísticas, incluindo as do L2"""
+        super().reset_stats()
+        with self._tier_lock:
+            for alg in self.tier_stats:
+                self.tier_stats[alg] = self._empty_tier_stats()
+        self.l2.reset_stats()
+
+    def close(self) -> None:
+        """Grava os rebaixamentos pendentes e fecha o cache em disco"""
+        self._flush_demotions()
+        self.l2.close()
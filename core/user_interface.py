@@ -8,6 +8,9 @@ import os
 import time
 from datetime import datetime
 
+from core.text_manager import decode_text
+from core.config import settings
+
 class UserInterface:
     """Classe responsável pela interface com o usuário"""
 
@@ -25,19 +28,28 @@ class UserInterface:
         """Limpa a tela do terminal"""
         os.system('clear' if os.name == 'posix' else 'cls')
 
-    def show_welcome(self):
-        """Exibe mensagem de boas-vindas"""
+    def show_welcome(self, text_manager=None):
+        """
+        Exibe mensagem de boas-vindas
+
+        Args:
+            text_manager (TextManager, optional): Gerenciador de textos (para o tamanho do corpus)
+        """
+        id_range = text_manager.get_id_range() if text_manager is not None else None
+        first_id, last_id = id_range or (1, 100)
+        text_count = text_manager.text_count if text_manager is not None else 100
+
         self.clear_screen()
         print("="*70)
         print("    SISTEMA DE LEITURA DE TEXTOS COM CACHE - RA2")
         print("="*70)
         print("Empresa: Texto é Vida")
-        print("Sistema: Leitura eficiente de 100 textos importantes")
-        print("Algoritmos: FIFO, LRU, LFU, MRU")
+        print(f"Sistema: Leitura eficiente de {text_count} textos importantes")
+        print(f"Algoritmos: {', '.join(settings.SIMULATION_CONFIG['algorithms'])}")
         print("="*70)
         print()
         print("Instruções:")
-        print("• Digite o número do texto desejado (1-100)")
+        print(f"• Digite o número do texto desejado ({first_id}-{last_id})")
         print("• Digite 0 para sair do programa")
         print("• Digite -1 para entrar no modo de simulação")
         print("• Digite -2 para acessar as configurações")
@@ -94,6 +106,9 @@ class UserInterface:
         """
         self.clear_screen()
 
+        # Decodificar apenas no momento da exibição (backends mmap entregam bytes)
+        content = decode_text(content)
+
         # Atualizar estatísticas
         self.stats['texts_viewed'] += 1
         self.stats['total_time'] += load_time
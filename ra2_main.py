@@ -15,12 +15,26 @@ project_root = Path(__file__).parent
 sys.path.append(str(project_root))
 
 from core.user_interface import UserInterface
-from core.text_manager import TextManager
-from core.cache_manager import CacheManager
+from core.text_backends import create_text_manager
+from core.concurrent_cache_manager import ConcurrentCacheManager
+from core.tiered_cache_manager import DiskL2Cache, TieredCacheManager
+from core.single_flight import SingleFlight
+from core.expiry_sweeper import ExpirySweeper
+from core.prefetcher import Prefetcher
+from core.cache_snapshot import SnapshotWarmer, load_snapshot, save_snapshot
 from algorithms.fifo_cache import FIFOCache
 from algorithms.lru_cache import LRUCache
 from algorithms.lfu_cache import LFUCache
 from algorithms.mru_cache import MRUCache
+from algorithms.arc_cache import ARCCache
+from algorithms.wtinylfu_cache import WTinyLFUCache
+from algorithms.two_queue_cache import TwoQueueCache
+from algorithms.lirs_cache import LIRSCache
+from algorithms.clock_cache import CLOCKCache
+from algorithms.clock_pro_cache import CLOCKProCache
+from algorithms.compressed_cache import CompressedCache
+from algorithms.ttl_cache import TTLCache
+from algorithms.timing import create_clock
 from simulation.simulator import CacheSimulator
 from simulation.report_generator import ReportGenerator
 from core.config import settings
@@ -30,19 +44,82 @@ class CacheTextReader:
     """Classe principal da aplicação"""
 
     def __init__(self):
-        self.text_manager = TextManager(settings.TEXT_DIR)
+        self.text_manager = create_text_manager(settings.TEXT_BACKEND, settings.TEXT_DIR)
         self.ui = UserInterface()
 
         # Inicializar algoritmos de cache
         self.cache_algorithms = {
-            'FIFO': FIFOCache(settings.CACHE_SIZE),
-            'LRU': LRUCache(settings.CACHE_SIZE),
-            'LFU': LFUCache(settings.CACHE_SIZE),
-            'MRU': MRUCache(settings.CACHE_SIZE)
+            'FIFO': FIFOCache(settings.CACHE_SIZE, max_bytes=settings.CACHE_MAX_BYTES,
+                              clock=create_clock(settings.CACHE_CLOCK)),
+            'LRU': LRUCache(settings.CACHE_SIZE, max_bytes=settings.CACHE_MAX_BYTES,
+                            clock=create_clock(settings.CACHE_CLOCK)),
+            'LFU': LFUCache(settings.CACHE_SIZE, max_bytes=settings.CACHE_MAX_BYTES, **settings.LFU_AGING),
+            'MRU': MRUCache(settings.CACHE_SIZE, max_bytes=settings.CACHE_MAX_BYTES),
+            'ARC': ARCCache(settings.CACHE_SIZE, max_bytes=settings.CACHE_MAX_BYTES),
+            'WTinyLFU': WTinyLFUCache(settings.CACHE_SIZE, max_bytes=settings.CACHE_MAX_BYTES),
+            '2Q': TwoQueueCache(settings.CACHE_SIZE, max_bytes=settings.CACHE_MAX_BYTES),
+            'LIRS': LIRSCache(settings.CACHE_SIZE, max_bytes=settings.CACHE_MAX_BYTES),
+            'CLOCK': CLOCKCache(settings.CACHE_SIZE, max_bytes=settings.CACHE_MAX_BYTES),
+            'CLOCKPro': CLOCKProCache(settings.CACHE_SIZE, max_bytes=settings.CACHE_MAX_BYTES)
         }
 
-        # Cache manager para coordenar algoritmos
-        self.cache_manager = CacheManager(self.cache_algorithms)
+        # Armazenar os textos comprimidos, se configurado
+        if settings.CACHE_COMPRESSION:
+            self.cache_algorithms = {
+                name: CompressedCache(cache, settings.CACHE_COMPRESSION)
+                for name, cache in self.cache_algorithms.items()
+            }
+
+        # Expirar entradas por tempo de vida e/ou quando o arquivo do texto mudar
+        ttl_config = settings.CACHE_TTL
+        if ttl_config['enabled']:
+            revalidate_interval = ttl_config['revalidate_interval']
+            validator = self.text_manager.get_modified_time if revalidate_interval is not None else None
+            self.cache_algorithms = {
+                name: TTLCache(cache, ttl_config['default_ttl'], validator=validator,
+                               revalidate_interval=revalidate_interval or 0.0)
+                for name, cache in self.cache_algorithms.items()
+            }
+
+        # Cache manager para coordenar algoritmos (lock único: seguro entre
+        # threads e preserva a ordem exata de cada política); com o L2 ativo,
+        # os textos removidos da memória vão para o cache em disco local
+        if settings.L2_CACHE['enabled']:
+            l2_cache = DiskL2Cache(
+                settings.L2_CACHE['path'],
+                max_entries=settings.L2_CACHE['max_entries'],
+                max_bytes=settings.L2_CACHE['max_bytes']
+            )
+            self.cache_manager = TieredCacheManager(self.cache_algorithms, l2_cache)
+        else:
+            self.cache_manager = ConcurrentCacheManager(self.cache_algorithms, num_shards=1)
+
+        # Misses simultâneos do mesmo texto compartilham uma única leitura do disco
+        self.single_flight = SingleFlight()
+
+        # Varredura em segundo plano das entradas vencidas
+        self.expiry_sweeper = None
+        if ttl_config['enabled']:
+            self.expiry_sweeper = ExpirySweeper(self.cache_manager, ttl_config['sweep_interval'],
+                                                ttl_config['sweep_batch'])
+            self.expiry_sweeper.start()
+
+        # Pré-carregamento em segundo plano dos próximos textos prováveis; as
+        # cargas passam pelo single-flight, então um pedido do usuário para um
+        # texto já em pré-carga aguarda a mesma leitura
+        self.prefetcher = None
+        if settings.PREFETCH['enabled']:
+            prefetch_config = {k: v for k, v in settings.PREFETCH.items() if k != 'enabled'}
+            self.prefetcher = Prefetcher(self.cache_manager, self._load_shared, **prefetch_config)
+
+        # Aquecer o cache com as chaves salvas na execução anterior
+        self.snapshot_warmer = None
+        if settings.CACHE_SNAPSHOT['enabled']:
+            snapshot = load_snapshot(settings.CACHE_SNAPSHOT['path'])
+            if snapshot:
+                self.snapshot_warmer = SnapshotWarmer(self.cache_manager, self.text_manager.load_text,
+                                                      settings.CACHE_SNAPSHOT['max_workers'])
+                self.snapshot_warmer.start(snapshot)
 
         # Algoritmo padrão (pode ser alterado pela simulação)
         self.current_algorithm = settings.DEFAULT_ALGORITHM
@@ -54,24 +131,89 @@ class CacheTextReader:
         # Verificar se texto existe no cache
         cached_text = self.cache_manager.get(text_id, self.current_algorithm)
 
+        if self.prefetcher is not None:
+            self.prefetcher.on_access(text_id, self.current_algorithm, cached_text is not None)
+
         if cached_text is not None:
             # Cache hit
             load_time = time.perf_counter() - start_time
             return cached_text, True, load_time
         else:
-            # Cache miss - carregar do disco (simulando lentidão)
-            text_content = self.text_manager.load_text(text_id)
+            # Cache miss - carregar do disco (simulando lentidão); leituras
+            # simultâneas do mesmo texto aguardam a carga já em andamento
+            text_content = self._load_shared(text_id, self.current_algorithm)
             if text_content:
-                # Adicionar ao cache
-                self.cache_manager.put(text_id, text_content, self.current_algorithm)
                 load_time = time.perf_counter() - start_time
                 return text_content, False, load_time
             else:
                 return None, False, time.perf_counter() - start_time
 
+    def load_many(self, text_ids):
+        """
+        Carrega vários textos de uma vez (ex.: exportações em lote)
+
+        Os hits saem do cache em uma única chamada; os misses são lidos do
+        disco em paralelo e inseridos no cache de uma só vez.
+
+        Args:
+            text_ids: IDs dos textos
+
+        Returns:
+            dict: ID -> conteúdo dos textos encontrados
+        """
+        text_ids = list(text_ids)
+        algorithm = self.current_algorithm
+
+        found = self.cache_manager.get_many(text_ids, algorithm)
+        missing = [text_id for text_id in text_ids if text_id not in found]
+        if missing:
+            loaded = self.text_manager.load_many(missing)
+            self.cache_manager.put_many(loaded, algorithm)
+            found.update(loaded)
+
+        return {text_id: found[text_id] for text_id in text_ids if text_id in found}
+
+    def _load_shared(self, text_id, algorithm):
+        """Carrega e armazena um texto, compartilhando cargas simultâneas do mesmo texto"""
+        text_content, _ = self.single_flight.do(
+            (algorithm, text_id),
+            lambda: self._load_and_cache(text_id, algorithm)
+        )
+        return text_content
+
+    def _load_and_cache(self, text_id, algorithm):
+        """Carrega um texto do disco e o adiciona ao cache do algoritmo"""
+        text_content = self.text_manager.load_text(text_id)
+        if text_content:
+            self.cache_manager.put(text_id, text_content, algorithm)
+        return text_content
+
+    def close(self):
+        """Encerra as tarefas em segundo plano e salva o snapshot do cache"""
+        if self.snapshot_warmer is not None:
+            self.snapshot_warmer.stop()
+        if self.expiry_sweeper is not None:
+            self.expiry_sweeper.stop()
+        if self.prefetcher is not None:
+            self.prefetcher.close()
+        if settings.CACHE_SNAPSHOT['enabled']:
+            try:
+                save_snapshot(self.cache_manager, settings.CACHE_SNAPSHOT['path'])
+            except OSError as e:
+                print(f"Erro ao salvar snapshot do cache: {e}")
+        if settings.L2_CACHE['enabled']:
+            self.cache_manager.close()
+
+    def _describe_id_range(self):
+        """Descreve o range de IDs do corpus para as mensagens de erro"""
+        id_range = self.text_manager.get_id_range()
+        if id_range is None:
+            return "Nenhum texto disponível"
+        return f"Digite um número entre {id_range[0]}-{id_range[1]}"
+
     def run_interactive_mode(self):
         """Executa o modo interativo principal"""
-        self.ui.show_welcome()
+        self.ui.show_welcome(self.text_manager)
 
         while True:
             try:
@@ -84,21 +226,22 @@ class CacheTextReader:
                 elif text_id == -1:
                     # Modo simulação
                     self.run_simulation_mode()
-                    self.ui.show_welcome()
+                    self.ui.show_welcome(self.text_manager)
                 elif text_id == -2:
                     # Modo configuração
                     self.run_config_mode()
-                    self.ui.show_welcome()
-                elif 1 <= text_id <= 100:
+                    self.ui.show_welcome(self.text_manager)
+                elif text_id > 0:
                     # Carregar e exibir texto
                     text_content, was_cached, load_time = self.load_text(text_id)
 
                     if text_content:
                         self.ui.display_text(text_id, text_content, was_cached, load_time, self.current_algorithm)
                     else:
-                        self.ui.show_error(f"Texto {text_id} não encontrado!")
+                        self.ui.show_error(f"Texto {text_id} não encontrado! {self._describe_id_range()}")
                 else:
-                    self.ui.show_error("Número inválido! Digite um número entre 1-100, 0 para sair, -1 para simulação ou -2 para configurações.")
+                    self.ui.show_error(f"Número inválido! {self._describe_id_range()}, 0 para sair, "
+                                       "-1 para simulação ou -2 para configurações.")
 
             except KeyboardInterrupt:
                 self.ui.show_goodbye()
@@ -176,7 +319,10 @@ def main():
     """Função principal"""
     try:
         app = CacheTextReader()
-        app.run_interactive_mode()
+        try:
+            app.run_interactive_mode()
+        finally:
+            app.close()
     except Exception as e:
         print(f"Erro fatal: {e}")
         sys.exit(1)
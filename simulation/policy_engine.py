@@ -0,0 +1,251 @@
+"""
+Motor de simulação "somente metadados"
+Executa as políticas de cache apenas sobre sequências de chaves, sem carregar
+textos pelo TextManager, e estima a latência com um modelo de custo separado
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+from algorithms.cache_utils import innermost_policy
+from algorithms.opt_cache import OPTCache
+
+# Valor armazenado no lugar do conteúdo dos textos. Hits/misses das políticas
+# dependem apenas das chaves; basta que o valor seja diferente de None.
+PLACEHOLDER_VALUE = ''
+
+
+class LoadCostModel:
+    """
+    Modelo de custo que converte misses em latência estimada
+
+    O custo de um miss é o tempo de leitura medido de cada texto somado ao
+    atraso médio do disco simulado; hits custam um valor fixo (tipicamente
+    desprezível).
+    """
+
+    def __init__(self, read_costs: Dict[int, float], disk_delay: float = 0.0,
+                 hit_cost: float = 0.0, text_sizes: Optional[Dict[int, int]] = None):
+        """
+        Inicializa o modelo de custo
+
+        Args:
+            read_costs: Tempo de leitura (segundos) por ID de texto
+            disk_delay: Atraso médio do disco somado a cada miss (segundos)
+            hit_cost: Custo de um cache hit (segundos)
+            text_sizes: Tamanho em bytes de cada texto (para caches com orçamento em bytes)
+        """
+        self.read_costs = dict(read_costs)
+        self.disk_delay = disk_delay
+        self.hit_cost = hit_cost
+        self.text_sizes = dict(text_sizes or {})
+        self.default_read_cost = (sum(self.read_costs.values()) / len(self.read_costs)
+                                  if self.read_costs else 0.0)
+
+    @classmethod
+    def measure(cls, text_manager, text_ids: Iterable[int], repeats: int = 3,
+                hit_cost: float = 0.0) -> 'LoadCostModel':
+        """
+        Mede o custo de carregamento de cada texto uma única vez
+
+        Args:
+            text_manager: Gerenciador de textos
+            text_ids: IDs dos textos a medir
+            repeats: Leituras por texto para calcular a média
+            hit_cost: Custo de um cache hit (segundos)
+
+        Returns:
+            LoadCostModel com os custos medidos
+        """
+        read_costs = {}
+        text_sizes = {}
+        for text_id in set(text_ids):
+            cost = text_manager.measure_read_time(text_id, repeats)
+            if cost is not None:
+                read_costs[text_id] = cost
+            info = text_manager.get_text_info(text_id)
+            if info is not None:
+                text_sizes[text_id] = info['size_bytes']
+
+        return cls(read_costs, text_manager.get_expected_disk_delay(), hit_cost, text_sizes)
+
+    def miss_cost(self, text_id: int) -> float:
+        """
+        Retorna o custo estimado de um miss para o texto
+
+        Args:
+            text_id: ID do texto
+
+        Returns:
+            Custo em segundos
+        """
+        return self.read_costs.get(text_id, self.default_read_cost) + self.disk_delay
+
+    def estimate(self, miss_counts: Dict[int, int], hits: int) -> float:
+        """
+        Estima a latência total a partir das contagens de misses por texto
+
+        Args:
+            miss_counts: Número de misses por ID de texto
+            hits: Número total de hits
+
+        Returns:
+            Latência total estimada em segundos
+        """
+        total = hits * self.hit_cost
+        for text_id, count in miss_counts.items():
+            total += count * self.miss_cost(text_id)
+        return total
+
+
+class KeySizer:
+    """
+    Medidor de tamanho para caches com orçamento em bytes no motor de metadados
+
+    O motor armazena a própria chave como valor; o tamanho vem do texto real.
+    """
+
+    def __init__(self, text_sizes: Dict[int, int]):
+        self.text_sizes = text_sizes
+        self.default_size = (sum(text_sizes.values()) // len(text_sizes)) if text_sizes else 0
+
+    def __call__(self, key: int) -> int:
+        return self.text_sizes.get(key, self.default_size)
+
+
+def replay_keys(cache, keys: Iterable[int], store_keys: bool = False) -> bytearray:
+    """
+    Executa uma política de cache sobre uma sequência de chaves
+
+    Args:
+        cache: Instância da política (get/put)
+        keys: Sequência de IDs de textos
+        store_keys: Armazenar a própria chave como valor (usado com KeySizer)
+
+    Returns:
+        bytearray com 1 para cada hit e 0 para cada miss, na ordem das requisições
+    """
+    get = cache.get
+    put = cache.put
+    outcomes = bytearray()
+    append = outcomes.append
+
+    for key in keys:
+        if get(key) is not None:
+            append(1)
+        else:
+            put(key, key if store_keys else PLACEHOLDER_VALUE)
+            append(0)
+
+    return outcomes
+
+
+def count_misses(keys: Iterable[int], outcomes: bytearray) -> Dict[int, int]:
+    """
+    Conta os misses por chave
+
+    Args:
+        keys: Sequência de IDs de textos reproduzida
+        outcomes: Resultado de replay_keys
+
+    Returns:
+        Dicionário ID do texto -> número de misses
+    """
+    miss_counts = {}
+    for key, was_hit in zip(keys, outcomes):
+        if not was_hit:
+            miss_counts[key] = miss_counts.get(key, 0) + 1
+    return miss_counts
+
+
+def simulate_policy(cache, keys: List[int], cost_model: Optional[LoadCostModel] = None) -> Dict:
+    """
+    Simula uma política sobre uma sequência de chaves e resume o resultado
+
+    Se o cache tiver orçamento em bytes e houver modelo de custo, o tamanho de
+    cada entrada passa a ser o tamanho real do texto (KeySizer). Nesse caso a
+    reprodução usa a política mais interna: camadas como a compressão
+    transformam o valor armazenado e o KeySizer deixaria de ver a chave.
+
+    Args:
+        cache: Instância da política (vazia)
+        keys: Sequência de IDs de textos
+        cost_model: Modelo de custo para estimar a latência (opcional)
+
+    Returns:
+        Dicionário com hits, misses, hit rate e latência estimada
+    """
+    store_keys = getattr(cache, 'max_bytes', None) is not None and cost_model is not None
+    if store_keys:
+        cache = innermost_policy(cache)
+        cache.sizer = KeySizer(cost_model.text_sizes)
+
+    outcomes = replay_keys(cache, keys, store_keys)
+    total_requests = len(outcomes)
+    hits = sum(outcomes)
+    misses = total_requests - hits
+
+    result = {
+        'total_requests': total_requests,
+        'cache_hits': hits,
+        'cache_misses': misses,
+        'hit_rate': (hits / total_requests * 100) if total_requests > 0 else 0,
+        'miss_rate': (misses / total_requests * 100) if total_requests > 0 else 0,
+        'outcomes': outcomes
+    }
+
+    if cost_model is not None:
+        total_load_time = cost_model.estimate(count_misses(keys, outcomes), hits)
+        result['total_load_time'] = total_load_time
+        result['avg_load_time'] = total_load_time / total_requests if total_requests > 0 else 0
+
+    return result
+
+
+def opt_hit_rate(trace: Iterable[int], capacity: int) -> float:
+    """
+    Calcula o hit rate do algoritmo ótimo (OPT) para uma única capacidade
+
+    Args:
+        trace: Sequência de IDs de textos
+        capacity: Capacidade do cache
+
+    Returns:
+        float: Hit rate (%) em uma reprodução O(n log k)
+    """
+    keys = list(trace)
+    if not keys:
+        return 0
+    outcomes = replay_keys(OPTCache(capacity, trace=keys), keys)
+    return sum(outcomes) / len(keys) * 100
+
+
+def opt_hit_rate_curve(trace: Iterable[int], max_capacity: Optional[int] = None) -> List[float]:
+    """
+    Calcula a curva hit rate × capacidade do algoritmo ótimo (OPT) para um trace
+
+    Cada capacidade é uma reprodução O(n log k); quando o OPT atinge o máximo
+    possível (apenas misses compulsórios) as capacidades maiores são preenchidas
+    sem nova reprodução.
+
+    Args:
+        trace: Sequência de IDs de textos
+        max_capacity: Maior capacidade da curva (None = número de chaves distintas)
+
+    Returns:
+        Lista onde o índice i contém o hit rate (%) para capacidade i + 1
+    """
+    keys = list(trace)
+    total_requests = len(keys)
+    distinct = len(set(keys))
+    if max_capacity is None:
+        max_capacity = distinct
+
+    best_possible = ((total_requests - distinct) / total_requests * 100) if total_requests > 0 else 0
+    curve = []
+    for capacity in range(1, max_capacity + 1):
+        if curve and curve[-1] >= best_possible:
+            curve.append(best_possible)
+            continue
+        curve.append(opt_hit_rate(keys, capacity))
+
+    return curve
@@ -5,7 +5,8 @@ Implementa três tipos de distribuições: uniforme, Poisson e ponderada
 
 import random
 import numpy as np
-from typing import List, Tuple
+from collections import Counter
+from typing import Iterable, List, Tuple
 from core.config.settings import DISTRIBUTION_PARAMS
 
 class RandomGenerators:
@@ -24,6 +25,21 @@ class RandomGenerators:
         self.poisson_params = DISTRIBUTION_PARAMS['poisson']
         self.weighted_params = DISTRIBUTION_PARAMS['weighted']
 
+    @classmethod
+    def from_text_manager(cls, text_manager) -> 'RandomGenerators':
+        """
+        Cria um gerador com o range de IDs descoberto pelo gerenciador de textos
+
+        Args:
+            text_manager: Gerenciador de textos (com get_id_range)
+
+        Returns:
+            RandomGenerators: Gerador para o corpus (range padrão se ele estiver vazio)
+        """
+        get_id_range = getattr(text_manager, 'get_id_range', None)
+        id_range = get_id_range() if get_id_range else None
+        return cls(id_range) if id_range else cls()
+
     def generate_uniform(self, num_samples: int) -> List[int]:
         """
         Gera números aleatórios com distribuição uniforme
@@ -51,15 +67,9 @@ class RandomGenerators:
         # Gerar números seguindo distribuição de Poisson
         poisson_values = np.random.poisson(lambda_param, num_samples)
 
-        # Mapear valores para o range de textos (1-100)
-        # Usar módulo para garantir que ficam no range
-        mapped_values = []
-        for value in poisson_values:
-            # Mapear valor de Poisson para range de textos
-            mapped_value = ((value % (self.max_text - self.min_text + 1)) + self.min_text)
-            mapped_values.append(mapped_value)
-
-        return mapped_values
+        # Mapear valores para o range de textos (módulo garante que ficam no range)
+        span = self.max_text - self.min_text + 1
+        return (poisson_values % span + self.min_text).tolist()
 
     def generate_weighted(self, num_samples: int) -> List[int]:
         """
@@ -74,9 +84,14 @@ class RandomGenerators:
         special_range = self.weighted_params['special_range']
         special_prob = self.weighted_params['special_probability']
 
-        special_texts = list(range(special_range[0], special_range[1] + 1))
-        normal_texts = [i for i in range(self.min_text, self.max_text + 1) 
-                       if i not in special_texts]
+        special_texts = range(special_range[0], special_range[1] + 1)
+
+        # Textos normais = range de textos sem a parte especial que cai nele;
+        # o i-ésimo texto normal é calculado em vez de listado (corpus grandes)
+        overlap_start = max(special_range[0], self.min_text)
+        overlap_end = min(special_range[1], self.max_text)
+        overlap = max(0, overlap_end - overlap_start + 1)
+        normal_count = (self.max_text - self.min_text + 1) - overlap
 
         results = []
         for _ in range(num_samples):
@@ -85,7 +100,11 @@ class RandomGenerators:
                 text_id = random.choice(special_texts)
             else:
                 # Escolher texto normal
-                text_id = random.choice(normal_texts)
+                if normal_count <= 0:
+                    raise IndexError("Não há textos fora do range especial")
+                text_id = self.min_text + random.randrange(normal_count)
+                if overlap and text_id >= overlap_start:
+                    text_id += overlap
             results.append(text_id)
 
         return results
@@ -150,11 +169,7 @@ class RandomGenerators:
         }
 
         # Frequência por valor
-        frequency = {}
-        for sample in samples:
-            frequency[sample] = frequency.get(sample, 0) + 1
-
-        stats['frequency_distribution'] = frequency
+        stats['frequency_distribution'] = dict(Counter(samples))
 
         # Análise específica para textos 30-40
         special_range = self.weighted_params['special_range']
@@ -227,6 +242,20 @@ class UserSimulator:
         self.access_history.extend(requests)
         return requests
 
+    def replay_session(self, requests: Iterable[int]) -> List[int]:
+        """
+        Reproduz uma sessão previamente gerada (trace) em vez de gerar uma nova
+
+        Args:
+            requests: Sequência de IDs de textos já gerada
+
+        Returns:
+            Lista de IDs de textos requisitados
+        """
+        requests = list(requests)
+        self.access_history.extend(requests)
+        return requests
+
     def get_user_stats(self) -> dict:
         """
         Retorna estatísticas do usuário
@@ -241,6 +270,6 @@ class UserSimulator:
             'user_id': self.user_id,
             'total_requests': len(self.access_history),
             'unique_texts': len(set(self.access_history)),
-            'most_accessed': max(set(self.access_history), key=self.access_history.count),
+            'most_accessed': Counter(self.access_history).most_common(1)[0][0],
             'access_distribution': self.generator.analyze_distribution(self.access_history)
         }
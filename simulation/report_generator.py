@@ -12,13 +12,16 @@ from datetime import datetime
 from typing import Dict, List, Any
 import json
 
-from core.config.settings import GRAPHS_DIR, REPORT_CONFIG
+from core.config.settings import DISTRIBUTION_PARAMS, GRAPHS_DIR, REPORT_CONFIG
 
 class ReportGenerator:
     """
     Classe para gerar relatórios e visualizações dos resultados
     """
 
+    # Máximo de barras no gráfico de acessos por texto (acima disso, faixas de IDs)
+    MAX_ACCESS_BARS = 200
+
     def __init__(self):
         # Configurar estilo dos gráficos
         plt.style.use('default')
@@ -28,6 +31,22 @@ class ReportGenerator:
         GRAPHS_DIR.mkdir(parents=True, exist_ok=True)
         self.graphs_dir = GRAPHS_DIR
 
+    @staticmethod
+    def _opt_by_distribution(results: Dict) -> Dict[str, float]:
+        """
+        Hit rate médio do ótimo offline (OPT) por distribuição
+
+        Args:
+            results: Resultados da simulação
+
+        Returns:
+            Dicionário distribuição -> hit rate (vazio se não houver referência)
+        """
+        rates = {}
+        for entry in results.get('opt_reference', []):
+            rates.setdefault(entry['distribution'], []).append(entry['hit_rate'])
+        return {dist: float(np.mean(values)) for dist, values in rates.items()}
+
     def generate_hit_rate_comparison(self, results: Dict) -> str:
         """
         Gera gráfico comparativo de hit rates entre algoritmos
@@ -43,6 +62,7 @@ class ReportGenerator:
 
         algorithms = list(results['results_by_algorithm'].keys())
         distributions = ['uniform', 'poisson', 'weighted']
+        opt_rates = self._opt_by_distribution(results)
 
         # Gráfico 1: Hit rate médio por algoritmo
         ax1 = axes[0, 0]
@@ -60,6 +80,13 @@ class ReportGenerator:
         ax1.set_ylabel('Hit Rate (%)')
         ax1.set_ylim(0, 100)
 
+        # Linha de referência: ótimo offline
+        if opt_rates:
+            opt_mean = np.mean(list(opt_rates.values()))
+            ax1.axhline(opt_mean, color='black', linestyle='--', alpha=0.7,
+                        label=f'OPT (ótimo): {opt_mean:.1f}%')
+            ax1.legend()
+
         # Adicionar valores nas barras
         for bar, rate in zip(bars1, alg_hit_rates):
             ax1.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 1,
@@ -82,6 +109,12 @@ class ReportGenerator:
         for patch, color in zip(bp['boxes'], colors):
             patch.set_facecolor(color)
 
+        if opt_rates:
+            positions = [i + 1 for i, dist in enumerate(distributions) if dist in opt_rates]
+            ax2.scatter(positions, [opt_rates[dist] for dist in distributions if dist in opt_rates],
+                        marker='_', s=600, color='black', zorder=3, label='OPT (ótimo)')
+            ax2.legend()
+
         ax2.set_title('Distribuição de Hit Rates por Tipo')
         ax2.set_ylabel('Hit Rate (%)')
         ax2.set_ylim(0, 100)
@@ -100,15 +133,21 @@ class ReportGenerator:
                     row.append(0)
             heatmap_data.append(row)
 
+        # Última linha: ótimo offline como referência
+        heatmap_labels = list(algorithms)
+        if opt_rates:
+            heatmap_data.append([opt_rates.get(dist, 0) for dist in distributions])
+            heatmap_labels.append('OPT (ótimo)')
+
         im = ax3.imshow(heatmap_data, cmap='RdYlGn', aspect='auto', vmin=0, vmax=100)
         ax3.set_xticks(range(len(distributions)))
-        ax3.set_yticks(range(len(algorithms)))
+        ax3.set_yticks(range(len(heatmap_labels)))
         ax3.set_xticklabels(distributions)
-        ax3.set_yticklabels(algorithms)
+        ax3.set_yticklabels(heatmap_labels)
         ax3.set_title('Heatmap: Hit Rate por Combinação')
 
         # Adicionar valores no heatmap
-        for i in range(len(algorithms)):
+        for i in range(len(heatmap_labels)):
             for j in range(len(distributions)):
                 ax3.text(j, i, f'{heatmap_data[i][j]:.1f}%', 
                         ha='center', va='center', color='black')
@@ -131,6 +170,10 @@ class ReportGenerator:
                 y_vals = [state['hit_rate_so_far'] for state in cache_states]
 
                 ax4.plot(x_vals, y_vals, marker='o', markersize=4)
+                if first_dist in opt_rates:
+                    ax4.axhline(opt_rates[first_dist], color='black', linestyle='--', alpha=0.7,
+                                label='OPT (ótimo)')
+                    ax4.legend()
                 ax4.set_title(f'Evolução Hit Rate - {first_alg} ({first_dist})')
                 ax4.set_xlabel('Número de Requisições')
                 ax4.set_ylabel('Hit Rate (%)')
@@ -349,38 +392,56 @@ class ReportGenerator:
         fig, axes = plt.subplots(2, 2, figsize=(15, 12))
         fig.suptitle('Análise de Padrões de Acesso aos Textos', fontsize=16)
 
-        # Coletar dados de acesso por texto
-        text_access_counts = {i: 0 for i in range(1, 101)}
-
-        for alg in results['results_by_algorithm'].values():
-            for dist in alg.values():
-                for user in dist:
-                    for request in user['request_details']:
-                        text_id = request['text_id']
-                        text_access_counts[text_id] += 1
-
-        # Gráfico 1: Distribuição geral de acessos
+        # Coletar dados de acesso por texto (contagens em array indexado pelo ID)
+        requested = np.fromiter(
+            (request['text_id']
+             for alg in results['results_by_algorithm'].values()
+             for dist in alg.values()
+             for user in dist
+             for request in user['request_details']),
+            dtype=np.int64
+        )
+
+        text_range = results.get('simulation_info', {}).get('text_range') or (1, 100)
+        first_id, last_id = text_range
+        if requested.size:
+            first_id = min(first_id, int(requested.min()))
+            last_id = max(last_id, int(requested.max()))
+
+        access_counts = np.bincount(requested, minlength=last_id + 1)[first_id:last_id + 1]
+        text_ids = np.arange(first_id, last_id + 1)
+        num_texts = len(text_ids)
+
+        special_range = DISTRIBUTION_PARAMS['weighted']['special_range']
+        special_probability = DISTRIBUTION_PARAMS['weighted']['special_probability']
+        special_label = f'Textos {special_range[0]}-{special_range[1]}'
+
+        # Gráfico 1: Distribuição geral de acessos (agrupada em faixas se houver muitos textos)
         ax1 = axes[0, 0]
-        text_ids = list(text_access_counts.keys())
-        access_counts = list(text_access_counts.values())
-
-        ax1.bar(text_ids, access_counts, alpha=0.7, color='skyblue')
+        bar_width = max(1, -(-num_texts // self.MAX_ACCESS_BARS))
+        if bar_width > 1:
+            starts = np.arange(0, num_texts, bar_width)
+            ax1.bar(text_ids[starts], np.add.reduceat(access_counts, starts), width=bar_width,
+                    align='edge', alpha=0.7, color='skyblue')
+            ax1.set_ylabel(f'Número de Acessos (faixas de {bar_width} textos)')
+        else:
+            ax1.bar(text_ids, access_counts, alpha=0.7, color='skyblue')
+            ax1.set_ylabel('Número de Acessos')
         ax1.set_title('Distribuição de Acessos por Texto')
         ax1.set_xlabel('ID do Texto')
-        ax1.set_ylabel('Número de Acessos')
         ax1.grid(True, alpha=0.3)
 
-        # Destacar região 30-40
-        ax1.axvspan(30, 40, alpha=0.2, color='red', label='Textos 30-40 (43% esperado)')
+        # Destacar região especial
+        ax1.axvspan(special_range[0], special_range[1], alpha=0.2, color='red',
+                    label=f'{special_label} ({special_probability * 100:.0f}% esperado)')
         ax1.legend()
 
         # Gráfico 2: Top 20 textos mais acessados
         ax2 = axes[0, 1]
-        sorted_texts = sorted(text_access_counts.items(), key=lambda x: x[1], reverse=True)
-        top_20 = sorted_texts[:20]
+        top_20 = np.argsort(-access_counts, kind='stable')[:20]
 
-        top_ids = [str(item[0]) for item in top_20]
-        top_counts = [item[1] for item in top_20]
+        top_ids = [str(text_ids[i]) for i in top_20]
+        top_counts = access_counts[top_20]
 
         ax2.bar(range(len(top_20)), top_counts, color='lightgreen')
         ax2.set_title('Top 20 Textos Mais Acessados')
@@ -389,13 +450,12 @@ class ReportGenerator:
         ax2.set_xticks(range(0, len(top_20), 2))
         ax2.set_xticklabels([top_ids[i] for i in range(0, len(top_20), 2)], rotation=45)
 
-        # Gráfico 3: Análise da região especial (30-40)
+        # Gráfico 3: Análise da região especial
         ax3 = axes[1, 0]
-        special_range_counts = [text_access_counts[i] for i in range(30, 41)]
-        other_counts = [text_access_counts[i] for i in range(1, 101) if not (30 <= i <= 40)]
+        special_mask = (text_ids >= special_range[0]) & (text_ids <= special_range[1])
 
-        data_to_plot = [special_range_counts, other_counts]
-        labels = ['Textos 30-40', 'Outros Textos']
+        data_to_plot = [access_counts[special_mask], access_counts[~special_mask]]
+        labels = [special_label, 'Outros Textos']
         colors = ['lightcoral', 'lightblue']
 
         bp = ax3.boxplot(data_to_plot, labels=labels, patch_artist=True)
@@ -408,21 +468,25 @@ class ReportGenerator:
         # Gráfico 4: Heatmap de acessos
         ax4 = axes[1, 1]
 
-        # Reorganizar dados em matriz 10x10
-        heatmap_data = np.zeros((10, 10))
-        for text_id, count in text_access_counts.items():
-            row = (text_id - 1) // 10
-            col = (text_id - 1) % 10
-            heatmap_data[row][col] = count
+        # Reorganizar dados em matriz 10x10; cada célula soma cell_width textos consecutivos
+        cell_width = max(1, -(-num_texts // 100))
+        padded_counts = np.zeros(100 * cell_width)
+        padded_counts[:num_texts] = access_counts
+        heatmap_data = padded_counts.reshape(10, 10, cell_width).sum(axis=2)
 
         im = ax4.imshow(heatmap_data, cmap='YlOrRd', aspect='auto')
-        ax4.set_title('Heatmap de Acessos aos Textos')
+        if cell_width > 1:
+            ax4.set_title(f'Heatmap de Acessos aos Textos ({cell_width} textos por célula)')
+        else:
+            ax4.set_title('Heatmap de Acessos aos Textos')
 
-        # Configurar ticks
+        # Configurar ticks (linha: faixa de IDs; coluna: deslocamento dentro da linha)
+        row_width = 10 * cell_width
         ax4.set_xticks(range(10))
         ax4.set_yticks(range(10))
-        ax4.set_xticklabels([f'{i+1}-{i+10}' for i in range(0, 100, 10)])
-        ax4.set_yticklabels([f'{i*10+1}-{(i+1)*10}' for i in range(10)])
+        ax4.set_xticklabels([f'+{i * cell_width}' for i in range(10)], rotation=45)
+        ax4.set_yticklabels([f'{first_id + i * row_width}-{first_id + (i + 1) * row_width - 1}'
+                             for i in range(10)])
 
         plt.colorbar(im, ax=ax4, label='Número de Acessos')
 
@@ -438,6 +502,56 @@ class ReportGenerator:
 
         return str(filepath)
 
+    def generate_hit_rate_curve(self, results: Dict) -> str:
+        """
+        Gera gráfico da curva hit rate × tamanho do cache (LRU e ótimo OPT)
+
+        Args:
+            results: Resultados da simulação (com 'hit_rate_curves')
+
+        Returns:
+            Caminho do arquivo do gráfico salvo
+        """
+        fig, ax = plt.subplots(figsize=(12, 7))
+        fig.suptitle('Curva Hit Rate × Tamanho do Cache (LRU, distância de pilha; OPT tracejado)', fontsize=16)
+
+        opt_curves = {(entry['user_id'], entry['distribution']): entry['curve']
+                      for entry in results.get('opt_reference', [])}
+
+        for entry in results['hit_rate_curves']:
+            curve = entry['curve']
+            capacities = range(1, len(curve) + 1)
+            line, = ax.plot(capacities, curve, label=f"{entry['distribution']} (usuário {entry['user_id']})")
+
+            # Referência ótima com a mesma cor
+            opt_curve = opt_curves.get((entry['user_id'], entry['distribution']))
+            if opt_curve:
+                ax.plot(range(1, len(opt_curve) + 1), opt_curve, linestyle='--', color=line.get_color(),
+                        label=f"OPT {entry['distribution']} (usuário {entry['user_id']})")
+
+        # Destacar o tamanho de cache configurado
+        cache_size = results['simulation_info']['cache_size']
+        ax.axvline(cache_size, color='gray', linestyle='--', alpha=0.7,
+                   label=f'Tamanho configurado ({cache_size})')
+
+        ax.set_xlabel('Capacidade do Cache (textos)')
+        ax.set_ylabel('Hit Rate (%)')
+        ax.set_ylim(0, 100)
+        ax.grid(True, alpha=0.3)
+        ax.legend()
+
+        plt.tight_layout()
+
+        # Salvar gráfico
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"hit_rate_curve_{timestamp}.png"
+        filepath = self.graphs_dir / filename
+
+        plt.savefig(filepath, dpi=300, bbox_inches='tight')
+        plt.close()
+
+        return str(filepath)
+
     def generate_summary_report(self, results: Dict) -> str:
         """
         Gera relatório textual detalhado da simulação.
@@ -464,6 +578,8 @@ class ReportGenerator:
             f.write(f"- **Algoritmos Testados:** {config['algorithms']}\n")
             f.write(f"- **Requisições por Usuário:** {config['requests_per_user']}\n")
             f.write(f"- **Tamanho do Cache:** {results['simulation_info']['cache_size']}\n")
+            if results['simulation_info'].get('cache_max_bytes'):
+                f.write(f"- **Orçamento de Memória do Cache:** {results['simulation_info']['cache_max_bytes']} bytes\n")
             f.write("- **Cenários de Usuário:**\n")
             for scenario in config['user_scenarios']:
                 f.write(f"  - **Usuário {scenario['user_id']}:** Distribuição `{scenario['distribution']}`\n")
@@ -481,6 +597,23 @@ class ReportGenerator:
             f.write("\n### **Algoritmo Recomendado:**\n")
             f.write(f"> O algoritmo **{best['algorithm']}** apresentou o melhor desempenho geral, com um Hit Rate médio de **{best['hit_rate']:.2f}%**.\n")
 
+            # Distância até o ótimo offline
+            opt_rates = self._opt_by_distribution(results)
+            if opt_rates:
+                f.write("\n### Distância do Ótimo (OPT)\n\n")
+                f.write("| Distribuição | OPT (ótimo) | Melhor Algoritmo | Hit Rate | Diferença |\n")
+                f.write("|:---:|:---:|:---:|:---:|:---:|\n")
+                for dist, opt_rate in opt_rates.items():
+                    candidates = [
+                        (np.mean([user['hit_rate'] for user in dists[dist]]), alg)
+                        for alg, dists in results['results_by_algorithm'].items()
+                        if dists.get(dist)
+                    ]
+                    if not candidates:
+                        continue
+                    best_rate, best_alg = max(candidates)
+                    f.write(f"| {dist} | {opt_rate:.2f}% | {best_alg} | {best_rate:.2f}% | {opt_rate - best_rate:.2f} p.p. |\n")
+
             # Análise Detalhada
             f.write("\n## 3. Análise Detalhada por Combinação\n")
             for alg, distributions in results['results_by_algorithm'].items():
@@ -509,8 +642,9 @@ class ReportGenerator:
                             sample_indices = [0, len(cache_states) // 2, len(cache_states) - 1]
                             for i in sample_indices:
                                 state = cache_states[i]
-                                contents = ", ".join(map(str, state['cache_contents']))
-                                f.write(f"    | {state['request_number']} | {state['cache_size']} / {results['simulation_info']['cache_size']} | {contents} |\n")
+                                # O motor 'metadata' não registra o conteúdo do cache
+                                contents = ", ".join(map(str, state.get('cache_contents', [])))
+                                f.write(f"    | {state['request_number']} | {state.get('cache_size', '-')} / {results['simulation_info']['cache_size']} | {contents} |\n")
 
                         # Amostra de requisições
                         req_details = user_result.get('request_details', [])
@@ -563,6 +697,12 @@ class ReportGenerator:
             generated_files.append(access_file)
             print(f"✓ Análise de acessos: {access_file}")
 
+            # Curva hit rate × capacidade
+            if results.get('hit_rate_curves'):
+                curve_file = self.generate_hit_rate_curve(results)
+                generated_files.append(curve_file)
+                print(f"✓ Curva hit rate × capacidade: {curve_file}")
+
             # Análise de tempo de execução
             execution_time_file = self.generate_execution_time_analysis(results)
             generated_files.append(execution_time_file)
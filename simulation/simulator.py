@@ -5,12 +5,43 @@ Executa simulações completas comparando algoritmos de cache
 
 import time
 import random
+import numpy as np
 from typing import Dict, List, Tuple, Any
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 
+from pathlib import Path
+
 from .random_generators import RandomGenerators, UserSimulator
-from core.config.settings import SIMULATION_CONFIG, CACHE_SIZE
+from .trace import RequestTrace
+from .policy_engine import LoadCostModel, simulate_policy, opt_hit_rate, opt_hit_rate_curve
+from .stack_distance import lru_hit_rate_curve
+from core.config import settings
+from core.config.settings import SIMULATION_CONFIG, CACHE_SIZE, CACHE_MAX_BYTES
+from algorithms.cache_utils import new_cache_like
+
+
+def _init_worker(disk_delay_config: Dict) -> None:
+    """
+    Inicializa um processo trabalhador da simulação paralela
+
+    Args:
+        disk_delay_config: Configuração de atraso de disco do processo principal
+    """
+    # Cada processo precisa de sua própria semente; com fork todos herdariam
+    # o mesmo estado dos geradores e produziriam sequências idênticas
+    random.seed()
+    np.random.seed()
+    settings.DISK_DELAY_SIMULATION.update(disk_delay_config)
+
+
+def _simulate_combination_worker(simulator: 'CacheSimulator', engine: str, algorithm_name: str,
+                                 user_id: int, distribution_type: str,
+                                 requests: RequestTrace = None) -> Dict:
+    """Executa uma combinação algoritmo × cenário em um processo trabalhador"""
+    return simulator._simulate_combination(
+        engine, algorithm_name, user_id, distribution_type, requests, show_progress=False
+    )
 
 class CacheSimulator:
     """
@@ -20,11 +51,15 @@ class CacheSimulator:
     def __init__(self, text_manager, cache_algorithms: Dict[str, Any]):
         self.text_manager = text_manager
         self.cache_algorithms = cache_algorithms
-        self.generator = RandomGenerators()
+        self.generator = RandomGenerators.from_text_manager(text_manager)
         self.simulation_results = {}
+        self.traces = {}
+        self.cost_model = None
 
     def simulate_user_algorithm_combination(self, algorithm_name: str, user_id: int, 
-                                          distribution_type: str) -> Dict:
+                                          distribution_type: str,
+                                          show_progress: bool = True,
+                                          requests: RequestTrace = None) -> Dict:
         """
         Simula um usuário usando um algoritmo específico
 
@@ -32,22 +67,26 @@ class CacheSimulator:
             algorithm_name: Nome do algoritmo de cache
             user_id: ID do usuário
             distribution_type: Tipo de distribuição dos acessos
+            show_progress: Exibir barra de progresso no terminal
+            requests: Trace de requisições a reproduzir (gera um novo se None)
 
         Returns:
             Dicionário com resultados da simulação
         """
         # Criar novo cache para esta simulação
-        cache_class = type(self.cache_algorithms[algorithm_name])
-        cache = cache_class(CACHE_SIZE)
+        cache = new_cache_like(self.cache_algorithms[algorithm_name], CACHE_SIZE)
 
         # Criar simulador de usuário
         user = UserSimulator(user_id, self.generator)
 
-        # Gerar requisições
-        requests = user.simulate_session(
-            SIMULATION_CONFIG['requests_per_user'],
-            distribution_type
-        )
+        # Gerar requisições ou reproduzir o trace do cenário
+        if requests is None:
+            requests = user.simulate_session(
+                SIMULATION_CONFIG['requests_per_user'],
+                distribution_type
+            )
+        else:
+            requests = user.replay_session(requests)
 
         # Simular execução das requisições
         results = {
@@ -97,11 +136,12 @@ class CacheSimulator:
             results['request_details'].append(request_detail)
             
             # Visualização do progresso
-            progress = (i + 1) / total_requests
-            bar_length = 20
-            filled_length = int(bar_length * progress)
-            bar = '█' * filled_length + '-' * (bar_length - filled_length)
-            print(f"\r    - Usuário {user_id}: [{bar}] {progress:.0%} lendo livro {i+1}/{total_requests}", end='')
+            if show_progress:
+                progress = (i + 1) / total_requests
+                bar_length = 20
+                filled_length = int(bar_length * progress)
+                bar = '█' * filled_length + '-' * (bar_length - filled_length)
+                print(f"\r    - Usuário {user_id}: [{bar}] {progress:.0%} lendo livro {i+1}/{total_requests}", end='')
 
 
             # Registrar estado do cache a cada 50 requisições
@@ -114,7 +154,8 @@ class CacheSimulator:
                 }
                 results['cache_states'].append(cache_state)
         
-        print() # Newline after progress bar
+        if show_progress:
+            print() # Newline after progress bar
 
         # Calcular métricas finais
         results['hit_rate'] = (results['cache_hits'] / results['total_requests']) * 100
@@ -127,32 +168,134 @@ class CacheSimulator:
 
 
 
-    def run_full_simulation(self) -> Dict:
+    def simulate_metadata_combination(self, algorithm_name: str, user_id: int,
+                                      distribution_type: str,
+                                      requests: RequestTrace = None) -> Dict:
+        """
+        Simula um usuário usando apenas as chaves, sem carregar textos
+
+        A política é executada sobre a sequência de IDs e a latência é estimada
+        pelo modelo de custo (self.cost_model) a partir dos misses.
+
+        Args:
+            algorithm_name: Nome do algoritmo de cache
+            user_id: ID do usuário
+            distribution_type: Tipo de distribuição dos acessos
+            requests: Trace de requisições a reproduzir (gera um novo se None)
+
+        Returns:
+            Dicionário com resultados da simulação (mesmo formato do motor completo)
+        """
+        cache = new_cache_like(self.cache_algorithms[algorithm_name], CACHE_SIZE)
+
+        user = UserSimulator(user_id, self.generator)
+        if requests is None:
+            requests = user.simulate_session(
+                SIMULATION_CONFIG['requests_per_user'],
+                distribution_type
+            )
+        else:
+            requests = user.replay_session(requests)
+
+        if self.cost_model is None:
+            self.cost_model = LoadCostModel.measure(self.text_manager, requests)
+
+        policy_result = simulate_policy(cache, requests, self.cost_model)
+        outcomes = policy_result.pop('outcomes')
+
+        results = {
+            'algorithm': algorithm_name,
+            'user_id': user_id,
+            'distribution_type': distribution_type,
+            'engine': 'metadata',
+            **policy_result,
+            'request_details': [],
+            'cache_states': []
+        }
+
+        if SIMULATION_CONFIG.get('record_request_details', True):
+            hits_so_far = 0
+            for i, (text_id, was_hit) in enumerate(zip(requests, outcomes)):
+                hits_so_far += was_hit
+                results['request_details'].append({
+                    'request_number': i + 1,
+                    'text_id': text_id,
+                    'was_cache_hit': bool(was_hit),
+                    'load_time': self.cost_model.hit_cost if was_hit else self.cost_model.miss_cost(text_id)
+                })
+                if (i + 1) % 50 == 0:
+                    results['cache_states'].append({
+                        'request_number': i + 1,
+                        'hit_rate_so_far': (hits_so_far / (i + 1)) * 100
+                    })
+
+        results['user_stats'] = user.get_user_stats()
+        results['final_cache_stats'] = cache.get_stats() if hasattr(cache, 'get_stats') else {}
+
+        return results
+
+    def _simulate_combination(self, engine: str, algorithm_name: str, user_id: int,
+                              distribution_type: str, requests: RequestTrace = None,
+                              show_progress: bool = True) -> Dict:
+        """Executa uma combinação com o motor de simulação escolhido"""
+        if engine == 'metadata':
+            return self.simulate_metadata_combination(algorithm_name, user_id, distribution_type, requests)
+        return self.simulate_user_algorithm_combination(
+            algorithm_name, user_id, distribution_type, show_progress=show_progress, requests=requests
+        )
+
+    def run_full_simulation(self, parallel: bool = None, max_workers: int = None,
+                            engine: str = None) -> Dict:
         """
         Executa simulação completa de todos os algoritmos e distribuições
+
+        Args:
+            parallel: Distribuir as combinações entre processos (usa
+                SIMULATION_CONFIG['parallel'] se None)
+            max_workers: Número de processos trabalhadores (usa
+                SIMULATION_CONFIG['max_workers'] se None; None = número de CPUs)
+            engine: Motor de simulação, 'full' ou 'metadata' (usa
+                SIMULATION_CONFIG['engine'] se None)
+
         Returns:
             Dicionário com todos os resultados
         """
+        if parallel is None:
+            parallel = SIMULATION_CONFIG.get('parallel', False)
+        if max_workers is None:
+            max_workers = SIMULATION_CONFIG.get('max_workers')
+        if engine is None:
+            engine = SIMULATION_CONFIG.get('engine', 'full')
+        if engine not in ('full', 'metadata'):
+            raise ValueError(f"Motor de simulação desconhecido: {engine}")
+        trace_replay = SIMULATION_CONFIG.get('trace_replay', False)
+
         print("Iniciando simulação completa...")
         print(f"Algoritmos: {SIMULATION_CONFIG['algorithms']}")
         print(f"Cenários de usuário: {SIMULATION_CONFIG['user_scenarios']}")
         print(f"Requisições por usuário: {SIMULATION_CONFIG['requests_per_user']}")
+        print(f"Modo de execução: {'paralelo' if parallel else 'sequencial'}")
+        print(f"Reprodução de traces: {'sim' if trace_replay else 'não'}")
+        print(f"Motor de simulação: {engine}")
         print("-" * 60)
 
         all_results = {
             'simulation_info': {
                 'timestamp': datetime.now().isoformat(),
                 'config': SIMULATION_CONFIG,
-                'cache_size': CACHE_SIZE
+                'cache_size': CACHE_SIZE,
+                'cache_max_bytes': CACHE_MAX_BYTES,
+                'execution_mode': 'parallel' if parallel else 'serial',
+                'trace_replay': trace_replay,
+                'engine': engine,
+                'text_range': (self.generator.min_text, self.generator.max_text)
             },
             'results_by_algorithm': {},
             'summary_stats': {}
         }
 
-        total_combinations = (len(SIMULATION_CONFIG['algorithms']) *
-                            len(SIMULATION_CONFIG['user_scenarios']))
-        current_combination = 0
-
+        # Montar lista de combinações na ordem da configuração
+        combinations = []
         for algorithm in SIMULATION_CONFIG['algorithms']:
             if algorithm not in self.cache_algorithms:
                 print(f"AVISO: Algoritmo {algorithm} não disponível")
@@ -161,23 +304,201 @@ class CacheSimulator:
             all_results['results_by_algorithm'][algorithm] = {}
 
             for scenario in SIMULATION_CONFIG['user_scenarios']:
-                user_id = scenario['user_id']
                 distribution = scenario['distribution']
-                current_combination += 1
-                print(f"\n[{current_combination}/{total_combinations}] Executando: {algorithm} com usuário {user_id} (distribuição {distribution})")
-
                 if distribution not in all_results['results_by_algorithm'][algorithm]:
                     all_results['results_by_algorithm'][algorithm][distribution] = []
+                combinations.append((algorithm, scenario['user_id'], distribution))
+
+        # Gerar cada trace uma única vez e reproduzi-lo em todos os algoritmos
+        traces = self.build_traces(SIMULATION_CONFIG.get('trace_dir')) if trace_replay else {}
+        self.traces = traces
+
+        # Medir o custo de carregamento de cada texto uma única vez
+        if engine == 'metadata':
+            measured_ids = set()
+            for trace in traces.values():
+                measured_ids.update(trace)
+            if not measured_ids:
+                measured_ids = range(self.generator.min_text, self.generator.max_text + 1)
+            self.cost_model = LoadCostModel.measure(self.text_manager, measured_ids)
+        combinations = [
+            (algorithm, user_id, distribution, traces.get((user_id, distribution)))
+            for algorithm, user_id, distribution in combinations
+        ]
+
+        if parallel:
+            combination_results = self._run_combinations_parallel(combinations, engine, max_workers)
+        else:
+            combination_results = self._run_combinations_serial(combinations, engine)
 
-                simulation_result = self.simulate_user_algorithm_combination(algorithm, user_id, distribution)
-                all_results['results_by_algorithm'][algorithm][distribution].append(simulation_result)
+        # Mesclar resultados sempre na ordem das combinações (determinístico)
+        for (algorithm, user_id, distribution, _), simulation_result in zip(combinations, combination_results):
+            all_results['results_by_algorithm'][algorithm][distribution].append(simulation_result)
 
         # Gerar estatísticas resumidas
         all_results['summary_stats'] = self._generate_summary_stats(all_results['results_by_algorithm'])
 
+        # Curva hit rate × capacidade do LRU (uma passagem por trace)
+        if traces:
+            all_results['hit_rate_curves'] = self.compute_hit_rate_curves(traces)
+            # Referência do ótimo offline (Belady) para os gráficos e o relatório
+            all_results['opt_reference'] = self.compute_opt_reference(
+                traces, full_curve=SIMULATION_CONFIG.get('opt_curve', False)
+            )
+
         self.simulation_results = all_results
         return all_results
 
+    def build_traces(self, trace_dir: str = None) -> Dict[Tuple[int, str], RequestTrace]:
+        """
+        Gera (ou carrega do disco) o trace de requisições de cada cenário
+
+        Args:
+            trace_dir: Diretório onde os traces são salvos/carregados
+                (None = gerar apenas em memória)
+
+        Returns:
+            Dicionário (user_id, distribuição) -> RequestTrace
+        """
+        num_requests = SIMULATION_CONFIG['requests_per_user']
+        traces = {}
+
+        for scenario in SIMULATION_CONFIG['user_scenarios']:
+            user_id = scenario['user_id']
+            distribution = scenario['distribution']
+            path = None
+            if trace_dir is not None:
+                path = Path(trace_dir) / f"trace_user{user_id}_{distribution}_{num_requests}.bin"
+
+            traces[(user_id, distribution)] = RequestTrace.load_or_generate(
+                path, self.generator, num_requests, distribution, user_id
+            )
+
+        return traces
+
+    def compute_hit_rate_curves(self, traces: Dict[Tuple[int, str], RequestTrace],
+                                max_capacity: int = None) -> List[Dict]:
+        """
+        Calcula a curva hit rate × capacidade do LRU para cada trace
+
+        Args:
+            traces: Dicionário (user_id, distribuição) -> RequestTrace
+            max_capacity: Maior capacidade da curva (None = chaves distintas do trace)
+
+        Returns:
+            Lista de dicionários com user_id, distribuição e a curva (índice i =
+            capacidade i + 1)
+        """
+        curves = []
+        for (user_id, distribution), trace in traces.items():
+            curves.append({
+                'user_id': user_id,
+                'distribution': distribution,
+                'algorithm': 'LRU',
+                'curve': lru_hit_rate_curve(trace, max_capacity)
+            })
+        return curves
+
+    def compute_opt_reference(self, traces: Dict[Tuple[int, str], RequestTrace],
+                              full_curve: bool = False, max_capacity: int = None) -> List[Dict]:
+        """
+        Calcula o hit rate do algoritmo ótimo (OPT) para cada trace
+
+        Por padrão há uma única reprodução por trace, no tamanho de cache
+        configurado; a curva completa custa uma reprodução por capacidade e só
+        é calculada com full_curve (SIMULATION_CONFIG['opt_curve']).
+
+        Args:
+            traces: Dicionário (user_id, distribuição) -> RequestTrace
+            full_curve: Calcular também a curva por capacidade
+            max_capacity: Maior capacidade da curva (None = chaves distintas do trace)
+
+        Returns:
+            Lista de dicionários com user_id, distribuição, hit rate no tamanho de
+            cache configurado e a curva por capacidade (vazia sem full_curve)
+        """
+        references = []
+        for (user_id, distribution), trace in traces.items():
+            if full_curve:
+                curve = opt_hit_rate_curve(trace, max_capacity)
+                hit_rate = curve[min(CACHE_SIZE, len(curve)) - 1] if curve else 0
+            else:
+                curve = []
+                hit_rate = opt_hit_rate(trace, CACHE_SIZE)
+            references.append({
+                'user_id': user_id,
+                'distribution': distribution,
+                'algorithm': 'OPT',
+                'hit_rate': hit_rate,
+                'curve': curve
+            })
+        return references
+
+    def _run_combinations_serial(self, combinations: List[Tuple[str, int, str, RequestTrace]],
+                                 engine: str = 'full') -> List[Dict]:
+        """
+        Executa as combinações uma a uma no processo atual
+
+        Args:
+            combinations: Lista de tuplas (algoritmo, user_id, distribuição, trace)
+            engine: Motor de simulação ('full' ou 'metadata')
+
+        Returns:
+            Lista de resultados na mesma ordem das combinações
+        """
+        results = []
+        total_combinations = len(combinations)
+
+        for current_combination, (algorithm, user_id, distribution, trace) in enumerate(combinations, 1):
+            print(f"\n[{current_combination}/{total_combinations}] Executando: {algorithm} com usuário {user_id} (distribuição {distribution})")
+            results.append(self._simulate_combination(engine, algorithm, user_id, distribution, trace))
+
+        return results
+
+    def _run_combinations_parallel(self, combinations: List[Tuple[str, int, str, RequestTrace]],
+                                   engine: str = 'full', max_workers: int = None) -> List[Dict]:
+        """
+        Distribui as combinações entre processos trabalhadores
+
+        Cada combinação cria sua própria instância de cache, portanto são
+        independentes e podem ser executadas em qualquer ordem.
+
+        Args:
+            combinations: Lista de tuplas (algoritmo, user_id, distribuição, trace)
+            engine: Motor de simulação ('full' ou 'metadata')
+            max_workers: Número máximo de processos (None = número de CPUs)
+
+        Returns:
+            Lista de resultados na mesma ordem das combinações
+        """
+        # Enviar aos trabalhadores apenas caches vazios, sem o conteúdo já carregado
+        worker_simulator = CacheSimulator(
+            self.text_manager,
+            {alg: new_cache_like(cache, CACHE_SIZE) for alg, cache in self.cache_algorithms.items()}
+        )
+        worker_simulator.cost_model = self.cost_model
+
+        results = [None] * len(combinations)
+        total_combinations = len(combinations)
+        completed = 0
+
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 initializer=_init_worker,
+                                 initargs=(dict(settings.DISK_DELAY_SIMULATION),)) as executor:
+            futures = {
+                executor.submit(_simulate_combination_worker, worker_simulator, engine, *combination): index
+                for index, combination in enumerate(combinations)
+            }
+
+            for future in as_completed(futures):
+                index = futures[future]
+                results[index] = future.result()
+                completed += 1
+                algorithm, user_id, distribution, _ = combinations[index]
+                print(f"[{completed}/{total_combinations}] Concluído: {algorithm} com usuário {user_id} (distribuição {distribution})")
+
+        return results
+
     def _generate_summary_stats(self, results_by_algorithm: Dict) -> Dict:
         """
         Gera estatísticas resumidas dos resultados
@@ -0,0 +1,138 @@
+"""
+Motor de distância de pilha (algoritmo de Mattson)
+Calcula, em uma única passagem sobre um trace, o hit rate do LRU para todos os
+tamanhos de cache ao mesmo tempo
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+# Distância atribuída ao primeiro acesso de cada chave (miss compulsório)
+COLD_MISS = 0
+
+
+class FenwickTree:
+    """
+    Árvore de Fenwick (Binary Indexed Tree) para somas de prefixo em O(log n)
+    """
+
+    def __init__(self, size: int):
+        """
+        Inicializa a árvore
+
+        Args:
+            size: Número de posições (indexadas de 1 a size)
+        """
+        self.size = size
+        self.tree = [0] * (size + 1)
+
+    def add(self, index: int, delta: int) -> None:
+        """
+        Soma delta na posição index
+
+        Args:
+            index: Posição (1..size)
+            delta: Valor a somar
+        """
+        tree = self.tree
+        while index <= self.size:
+            tree[index] += delta
+            index += index & -index
+
+    def prefix_sum(self, index: int) -> int:
+        """
+        Retorna a soma das posições 1..index
+
+        Args:
+            index: Posição final (0 retorna 0)
+
+        Returns:
+            Soma do prefixo
+        """
+        tree = self.tree
+        total = 0
+        while index > 0:
+            total += tree[index]
+            index -= index & -index
+        return total
+
+
+def compute_stack_distances(trace: Iterable[int]) -> List[int]:
+    """
+    Calcula a distância de pilha LRU de cada requisição
+
+    A distância de uma requisição é a posição da chave na pilha LRU no momento
+    do acesso (1 = mais recente), ou seja, o número de chaves distintas
+    acessadas desde o último acesso a ela, mais um. A árvore de Fenwick marca a
+    posição do último acesso de cada chave, tornando cada consulta O(log n).
+
+    Args:
+        trace: Sequência de IDs de textos
+
+    Returns:
+        Lista de distâncias (COLD_MISS para o primeiro acesso de cada chave)
+    """
+    trace = list(trace)
+    tree = FenwickTree(len(trace))
+    last_access = {}
+    distances = []
+
+    for position, key in enumerate(trace, 1):
+        previous = last_access.get(key)
+        if previous is None:
+            distances.append(COLD_MISS)
+        else:
+            distinct_between = tree.prefix_sum(position - 1) - tree.prefix_sum(previous)
+            distances.append(distinct_between + 1)
+            tree.add(previous, -1)
+
+        tree.add(position, 1)
+        last_access[key] = position
+
+    return distances
+
+
+def distance_histogram(distances: Iterable[int]) -> Dict[int, int]:
+    """
+    Agrupa as distâncias de pilha em um histograma
+
+    Args:
+        distances: Distâncias calculadas por compute_stack_distances
+
+    Returns:
+        Dicionário distância -> número de requisições
+    """
+    histogram = {}
+    for distance in distances:
+        histogram[distance] = histogram.get(distance, 0) + 1
+    return histogram
+
+
+def lru_hit_rate_curve(trace: Iterable[int], max_capacity: Optional[int] = None) -> List[float]:
+    """
+    Calcula a curva hit rate × capacidade do LRU em uma única passagem
+
+    Uma requisição com distância d é hit em todo cache LRU com capacidade >= d
+    (propriedade de inclusão dos algoritmos de pilha), então o hit rate para a
+    capacidade c é a fração de requisições com 1 <= d <= c.
+
+    Args:
+        trace: Sequência de IDs de textos
+        max_capacity: Maior capacidade da curva (None = número de chaves distintas)
+
+    Returns:
+        Lista onde o índice i contém o hit rate (%) para capacidade i + 1
+    """
+    distances = compute_stack_distances(trace)
+    total_requests = len(distances)
+    histogram = distance_histogram(distances)
+
+    if max_capacity is None:
+        max_capacity = histogram.get(COLD_MISS, 0)
+
+    curve = []
+    cumulative_hits = 0
+    for capacity in range(1, max_capacity + 1):
+        cumulative_hits += histogram.get(capacity, 0)
+        curve.append((cumulative_hits / total_requests * 100) if total_requests > 0 else 0)
+
+    return curve
@@ -0,0 +1,175 @@
+"""
+Camada de traces de requisições
+Gera (ou carrega do disco) a sequência de requisições de cada cenário uma única
+vez e a armazena como um array compacto de inteiros para ser reproduzida contra
+todos os algoritmos de cache
+"""
+
+import sys
+import json
+from array import array
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+from .random_generators import RandomGenerators, UserSimulator
+
+# Cabeçalho dos arquivos de trace
+TRACE_MAGIC = b'RA2TRACE'
+
+
+class RequestTrace:
+    """
+    Sequência de IDs de textos requisitados, armazenada como array de inteiros
+
+    Usa 2 bytes por requisição quando todos os IDs cabem em 16 bits e 4 bytes
+    caso contrário, em vez dos ~28 bytes de um int Python em uma lista.
+    """
+
+    def __init__(self, requests: Iterable[int], distribution: str = None, user_id: int = None,
+                 text_range: Optional[Tuple[int, int]] = None):
+        """
+        Inicializa o trace
+
+        Args:
+            requests: Sequência de IDs de textos
+            distribution: Distribuição que gerou o trace (metadado)
+            user_id: Usuário associado ao trace (metadado)
+            text_range: Intervalo (mínimo, máximo) de IDs usado na geração (metadado)
+        """
+        values = list(requests)
+        typecode = 'H' if not values or max(values) < 2 ** 16 else 'I'
+        self.requests = array(typecode, values)
+        self.distribution = distribution
+        self.user_id = user_id
+        self.text_range = tuple(text_range) if text_range is not None else None
+
+    @classmethod
+    def generate(cls, generator: RandomGenerators, num_requests: int,
+                 distribution: str, user_id: int = None) -> 'RequestTrace':
+        """
+        Gera um novo trace usando os geradores aleatórios da simulação
+
+        Args:
+            generator: Gerador de números aleatórios
+            num_requests: Número de requisições
+            distribution: Tipo de distribuição ('uniform', 'poisson', 'weighted')
+            user_id: ID do usuário associado
+
+        Returns:
+            RequestTrace gerado
+        """
+        user = UserSimulator(user_id, generator)
+        requests = user.simulate_session(num_requests, distribution)
+        return cls(requests, distribution=distribution, user_id=user_id,
+                   text_range=(generator.min_text, generator.max_text))
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """
+        Salva o trace em formato binário compacto
+
+        Formato: magic, uma linha JSON com metadados e os bytes do array.
+
+        Args:
+            path: Caminho do arquivo
+
+        Returns:
+            Caminho do arquivo salvo
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        header = {
+            'typecode': self.requests.typecode,
+            'byteorder': sys.byteorder,
+            'length': len(self.requests),
+            'distribution': self.distribution,
+            'user_id': self.user_id,
+            'text_range': list(self.text_range) if self.text_range is not None else None
+        }
+
+        with open(path, 'wb') as f:
+            f.write(TRACE_MAGIC)
+            f.write(json.dumps(header).encode('utf-8') + b'\n')
+            self.requests.tofile(f)
+
+        return path
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'RequestTrace':
+        """
+        Carrega um trace salvo com save()
+
+        Args:
+            path: Caminho do arquivo
+
+        Returns:
+            RequestTrace carregado
+        """
+        with open(path, 'rb') as f:
+            if f.read(len(TRACE_MAGIC)) != TRACE_MAGIC:
+                raise ValueError(f"Arquivo de trace inválido: {path}")
+
+            header = json.loads(f.readline().decode('utf-8'))
+            requests = array(header['typecode'])
+            requests.fromfile(f, header['length'])
+
+        if header['byteorder'] != sys.byteorder:
+            requests.byteswap()
+
+        trace = cls.__new__(cls)
+        trace.requests = requests
+        trace.distribution = header.get('distribution')
+        trace.user_id = header.get('user_id')
+        text_range = header.get('text_range')
+        trace.text_range = tuple(text_range) if text_range is not None else None
+        return trace
+
+    @classmethod
+    def load_or_generate(cls, path: Optional[Union[str, Path]], generator: RandomGenerators,
+                         num_requests: int, distribution: str,
+                         user_id: int = None) -> 'RequestTrace':
+        """
+        Carrega o trace do disco se existir; caso contrário gera e salva
+
+        O trace salvo só é reaproveitado se tamanho, distribuição, usuário e
+        intervalo de IDs do gerador coincidirem; caso contrário é regerado.
+
+        Args:
+            path: Caminho do arquivo (None para apenas gerar em memória)
+            generator: Gerador de números aleatórios
+            num_requests: Número de requisições
+            distribution: Tipo de distribuição
+            user_id: ID do usuário associado
+
+        Returns:
+            RequestTrace carregado ou gerado
+        """
+        if path is not None and Path(path).exists():
+            trace = cls.load(path)
+            if (len(trace) == num_requests and trace.distribution == distribution
+                    and trace.user_id == user_id
+                    and trace.text_range == (generator.min_text, generator.max_text)):
+                return trace
+
+        trace = cls.generate(generator, num_requests, distribution, user_id)
+        if path is not None:
+            trace.save(path)
+        return trace
+
+    def tolist(self) -> List[int]:
+        """Retorna as requisições como lista de inteiros"""
+        return self.requests.tolist()
+
+    def __len__(self) -> int:
+        return len(self.requests)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.requests)
+
+    def __getitem__(self, index):
+        return self.requests[index]
+
+    def __repr__(self) -> str:
+        return (f"RequestTrace(distribution={self.distribution}, user_id={self.user_id}, "
+                f"text_range={self.text_range}, "
+                f"length={len(self.requests)})")